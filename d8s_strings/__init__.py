@@ -2,4 +2,245 @@ __version__ = "0.6.0"
 __author__ = """Floyd Hightower"""
 __email__ = "floyd.hightower27@gmail.com"
 
-from .strings import *
+import os
+import sys
+from typing import TYPE_CHECKING
+
+# the functions are split into submodules which are only imported when one of their functions is first used (so that
+# importing d8s_strings does not import all of the dependencies of every function) - when adding a public function to
+# one of these submodules, add its name here as well
+SUBMODULE_ATTRIBUTES = {
+    "casing": (
+        "camel_case",
+        "crazycase",
+        "kebab_case",
+        "lowercase",
+        "lowercase_count",
+        "lowercase_first_letter",
+        "pascal_case",
+        "sentence_case",
+        "snake_case",
+        "string_reverse_case",
+        "string_split_on_lowercase",
+        "string_split_on_uppercase",
+        "titlecase",
+        "uppercase",
+        "uppercase_count",
+        "uppercase_first_letter",
+    ),
+    "cleaning": (
+        "NON_ALPHA_NUMERIC_CHARACTERS_REGEX",
+        "NUMBERS_REGEX",
+        "PATTERN_CACHE_SIZE",
+        "REGEX_METACHARACTERS",
+        "string_has_multiple_consecutive_spaces",
+        "string_remove",
+        "string_remove_after",
+        "string_remove_before",
+        "string_remove_cache_info",
+        "string_remove_from_end",
+        "string_remove_from_start",
+        "string_remove_many",
+        "string_remove_non_alpha_numeric_characters",
+        "string_remove_non_alpha_numeric_characters_many",
+        "string_remove_numbers",
+        "string_remove_numbers_many",
+        "string_remove_unicode",
+    ),
+    "codepoints": ("CodePoints",),
+    "codecs": (
+        "ENGLISH_LETTER_FREQUENCIES",
+        "LEET_SPEAK_CONVERSIONS",
+        "base64_decode",
+        "base64_encode",
+        "bytes_decode_as_string",
+        "character_to_unicode_number",
+        "from_char_code",
+        "hex_to_string",
+        "leet_speak_to_text",
+        "letter_as_number",
+        "numbers_as_string",
+        "string_as_numbers",
+        "string_as_numbers_array",
+        "string_char_codes",
+        "string_encode_as_bytes",
+        "string_rotate",
+        "string_rotate_crack",
+        "string_rotate_crack_many",
+        "string_to_hex",
+        "text_ascii_character_count",
+        "text_ascii_characters",
+        "text_ascii_runs",
+        "text_non_ascii_character_count",
+        "text_non_ascii_characters",
+        "text_non_ascii_runs",
+        "text_to_leet_speak",
+        "unicode_number_to_character",
+        "unicode_to_ascii",
+        "unicode_to_ascii_many",
+        "unicode_to_ascii_stream",
+        "xor",
+        "xor_recover_key",
+    ),
+    "corpus": (
+        "CORPUS_CACHE_ENVIRONMENT_VARIABLE",
+        "CORPUS_VERSION",
+        "CORPUS_WORDS",
+        "UNICODE_CATEGORIES",
+        "corpus_cache_directory",
+        "corpus_characters",
+        "corpus_file",
+        "corpus_mmap",
+        "corpus_text",
+        "corpus_texts",
+    ),
+    "core": (
+        "ContainmentIndex",
+        "TEXT_INPUT_CHUNK_SIZE",
+        "a10n",
+        "character_examples",
+        "characters",
+        "letter_frequency",
+        "string_add_to_start_of_each_line",
+        "string_chars_at_start",
+        "string_chars_at_start_len",
+        "string_entropy",
+        "string_find_between",
+        "string_find_between_iter",
+        "string_find_between_stream",
+        "string_has_index",
+        "string_in_iterable_fuzzy",
+        "string_insert",
+        "string_is_no",
+        "string_is_palindrome",
+        "string_is_yes",
+        "string_left_pad",
+        "string_modify_line",
+        "string_remove_index",
+        "string_replace_index",
+        "string_reverse",
+        "string_shorten",
+        "string_split_multiple",
+        "string_split_without_empty",
+        "string_to_bool",
+        "substrings",
+        "switch",
+        "text_abbreviate",
+        "text_consonant_count",
+        "text_consonants",
+        "text_ensure_ends_with",
+        "text_ensure_starts_with",
+        "text_examples",
+        "text_input",
+        "text_input_chunks",
+        "text_input_is_no",
+        "text_input_is_yes",
+        "text_input_lines",
+        "text_join",
+        "text_vowel_count",
+        "text_vowels",
+    ),
+    "display": (
+        "ALIGNMENTS",
+        "character_display_width",
+        "string_display_width",
+        "string_graphemes",
+        "string_pad",
+        "string_shorten_to_width",
+        "string_shorten_to_width_many",
+        "text_column_widths",
+        "text_columns_format",
+        "text_columns_write",
+    ),
+    "inflection": (
+        "cardinalize",
+        "indefinite_article",
+        "is_plural",
+        "is_singular",
+        "ordinalize",
+        "pluralize",
+        "singularize",
+        "string_forms",
+    ),
+    "lines": ("LineIndex",),
+    "palindromes": (
+        "string_is_palindrome_normalized",
+        "string_is_palindrome_normalized_many",
+        "string_longest_palindrome",
+        "string_longest_palindrome_many",
+        "string_longest_palindrome_span",
+        "string_palindrome_count",
+        "string_palindrome_count_many",
+    ),
+    "pipeline": ("Pipeline",),
+    "rope": ("StringRope", "apply_edits"),
+    "similarity": (
+        "STRINGS_DIFF_MANY_OUTPUTS",
+        "hamming_distance",
+        "string_common_prefix",
+        "string_common_suffix",
+        "string_get_closes_matches",
+        "string_sequence_matcher",
+        "strings_diff",
+        "strings_diff_many",
+        "strings_diff_opcodes",
+        "strings_longest_matching_block",
+        "strings_matching_blocks",
+        "strings_similarity",
+    ),
+    "whitespace": (
+        "TRIM_SIDES",
+        "WHITESPACE_KINDS",
+        "WhitespaceNormalizer",
+        "string_collapse_whitespace",
+        "string_has_whitespace_run",
+        "string_normalize_line_endings",
+        "string_trim_lines",
+        "string_whitespace_run_count",
+        "string_whitespace_runs",
+    ),
+}
+_ATTRIBUTE_SUBMODULES = {name: submodule for submodule, names in SUBMODULE_ATTRIBUTES.items() for name in names}
+
+__all__ = sorted(_ATTRIBUTE_SUBMODULES)
+
+# when instrumentation is enabled (see d8s_strings.instrumentation), this is a function which wraps each attribute
+_instrument = None
+
+if TYPE_CHECKING:
+    from .strings import *
+
+
+def __getattr__(name: str):
+    if name in SUBMODULE_ATTRIBUTES:
+        return _import_submodule(name)
+
+    submodule_name = _ATTRIBUTE_SUBMODULES.get(name)
+    if submodule_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    submodule = _import_submodule(submodule_name)
+    value = getattr(submodule, name)
+    if _instrument is not None:
+        value = _instrument(name, value)
+    # cache the value so __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(submodule_name: str):
+    """Import the submodule with the given name."""
+    # unlike importlib.import_module, __import__ uses the interpreter's own import machinery (which is faster and is
+    # reported by `python -X importtime`)
+    __import__(f"{__name__}.{submodule_name}")
+    return sys.modules[f"{__name__}.{submodule_name}"]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTE_SUBMODULES))
+
+
+if os.environ.get("D8S_STRINGS_INSTRUMENTATION"):
+    from .instrumentation import enable_instrumentation
+
+    enable_instrumentation()
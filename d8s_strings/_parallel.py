@@ -0,0 +1,35 @@
+from typing import Callable, Iterable
+
+
+def _default_chunksize(iterable: Iterable, workers: int) -> int:
+    """Return a chunksize which gives each worker a few chunks of the iterable (if the iterable has a length)."""
+    try:
+        length = len(iterable)  # type: ignore
+    except TypeError:
+        return 64
+    return max(1, min(1024, length // (workers * 4)))
+
+
+def _ordered_parallel_map(func: Callable, iterable: Iterable, workers: int, *, executor_class=None) -> Iterable:
+    """Apply the func to each item in the iterable using a pool of workers and yield the results in order.
+
+    Only a bounded number of items are submitted ahead of the results being consumed so that very large (or infinite)
+    iterables can be streamed through the pool."""
+    if workers <= 1:
+        yield from map(func, iterable)
+        return
+
+    import collections
+    import concurrent.futures
+
+    if executor_class is None:
+        executor_class = concurrent.futures.ProcessPoolExecutor
+
+    with executor_class(max_workers=workers) as executor:
+        pending: collections.deque = collections.deque()
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,113 @@
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+from . import inflection, similarity
+
+AIO_BACKENDS = ("thread", "process")
+
+
+class AsyncRunner:
+    """Run functions on a bounded pool of threads (or processes) without blocking the event loop.
+
+    The pool has the given number of workers (by default, one per cpu) and is only created when it is first used. At
+    most max_concurrency calls (by default, twice the number of workers) are submitted to the pool at once; the other
+    calls wait (without using the pool) until one of the submitted calls is done. If a waiting call is cancelled, its
+    function is never run; if a submitted call is cancelled before the pool starts it, it is removed from the pool."""
+
+    def __init__(self, backend: str = "thread", workers: Optional[int] = None, max_concurrency: Optional[int] = None):
+        if backend not in AIO_BACKENDS:
+            message = f"Invalid backend given: {backend}\nAvailable backends are: {AIO_BACKENDS}"
+            raise ValueError(message)
+
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.workers * 2
+        self._executor: Any = None
+        self._executor_lock = threading.Lock()
+        # an asyncio.Semaphore can only be used by one event loop, so there is one for each loop the runner is used in
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                import concurrent.futures
+
+                if self.backend == "thread":
+                    self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+                else:
+                    self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run the func with the given arguments in the pool and return its result."""
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = True):
+        """Shut down the pool (cancelling the calls which have not been started unless cancel_futures is False). The
+        runner can still be used afterwards (a new pool is created when it is next used)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_runner = AsyncRunner()
+
+
+def configure(backend: str = "thread", workers: Optional[int] = None, max_concurrency: Optional[int] = None):
+    """Set the backend ("thread" or "process"), number of workers, and maximum number of concurrent calls used by the
+    awaitable functions in this module (the previous pool is shut down once its calls are done)."""
+    global _runner
+
+    runner = AsyncRunner(backend, workers, max_concurrency)
+    _runner, previous_runner = runner, _runner
+    previous_runner.shutdown(wait=False, cancel_futures=False)
+    return runner
+
+
+def shutdown(wait: bool = True):
+    """Shut down the pool used by the awaitable functions in this module."""
+    _runner.shutdown(wait=wait)
+
+
+async def run(func: Callable, *args, **kwargs):
+    """Run the func with the given arguments using the configured pool (see configure) and return its result."""
+    return await _runner.run(func, *args, **kwargs)
+
+
+def _awaitable(func: Callable) -> Callable:
+    """Create an awaitable version of the func which runs it using the configured pool."""
+
+    @functools.wraps(func)
+    async def awaitable_func(*args, **kwargs):
+        return await _runner.run(func, *args, **kwargs)
+
+    awaitable_func.__module__ = __name__
+    awaitable_func.__doc__ = f"Awaitable version of d8s_strings.{func.__name__} (see d8s_strings.aio.configure)."
+    return awaitable_func
+
+
+strings_diff = _awaitable(similarity.strings_diff)
+strings_similarity = _awaitable(similarity.strings_similarity)
+string_get_closes_matches = _awaitable(similarity.string_get_closes_matches)
+
+cardinalize = _awaitable(inflection.cardinalize)
+indefinite_article = _awaitable(inflection.indefinite_article)
+is_plural = _awaitable(inflection.is_plural)
+is_singular = _awaitable(inflection.is_singular)
+ordinalize = _awaitable(inflection.ordinalize)
+pluralize = _awaitable(inflection.pluralize)
+singularize = _awaitable(inflection.singularize)
+string_forms = _awaitable(inflection.string_forms)
@@ -0,0 +1,126 @@
+import functools
+import itertools
+import os
+from typing import Callable, Iterable, Iterator, Optional
+
+from ._parallel import _default_chunksize, _ordered_parallel_map
+
+BATCH_BACKENDS = ("serial", "thread", "process")
+# the d8s_strings functions which are CPU-bound enough that spreading them across processes is worth the cost of
+# sending their inputs and results between processes (every other function is run serially by default)
+PROCESS_BACKEND_FUNCTIONS = frozenset(
+    {
+        "cardinalize",
+        "hamming_distance",
+        "indefinite_article",
+        "is_plural",
+        "is_singular",
+        "ordinalize",
+        "pluralize",
+        "singularize",
+        "string_forms",
+        "string_get_closes_matches",
+        "string_longest_palindrome",
+        "string_palindrome_count",
+        "strings_diff",
+        "strings_diff_opcodes",
+        "strings_longest_matching_block",
+        "strings_matching_blocks",
+        "strings_similarity",
+    }
+)
+
+
+def default_backend(func: Callable) -> str:
+    """Return the backend which batch uses for the given func by default."""
+    is_d8s_strings_function = getattr(func, "__module__", "").startswith("d8s_strings")
+    if is_d8s_strings_function and getattr(func, "__name__", None) in PROCESS_BACKEND_FUNCTIONS:
+        return "process"
+    return "serial"
+
+
+def batch(
+    func: Callable,
+    iterable: Iterable,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    backend: Optional[str] = None,
+    *,
+    unpack: bool = False,
+) -> Iterator:
+    """Apply the func to each item in the iterable and yield the results in the same order as the items.
+
+    The items are split into chunks of the given chunksize which are run by the given backend: "serial" (in this
+    thread), "thread" (a pool of threads), or "process" (a pool of processes, which requires the func and items to be
+    picklable). By default, CPU-bound d8s_strings functions (see PROCESS_BACKEND_FUNCTIONS) use processes and all
+    other functions are run serially. The pools have the given number of workers (by default, one per cpu). Repeated
+    (hashable) items within a chunk are only computed once if their result is immutable (e.g. a str or a tuple of
+    numbers), so repeated items never share a result which can be changed. If unpack is True, each item is a tuple of
+    the arguments to the func (e.g. batch(strings_diff, pairs, unpack=True))."""
+    if backend is None:
+        backend = default_backend(func)
+    if backend not in BATCH_BACKENDS:
+        message = f"Invalid backend given: {backend}\nAvailable backends are: {BATCH_BACKENDS}"
+        raise ValueError(message)
+
+    if backend == "serial":
+        workers = 1
+    elif workers is None:
+        workers = os.cpu_count() or 1
+
+    if chunksize is None:
+        chunksize = _default_chunksize(iterable, workers)
+
+    import more_itertools
+
+    executor_class = None
+    if backend == "thread":
+        import concurrent.futures
+
+        executor_class = concurrent.futures.ThreadPoolExecutor
+
+    chunk_func = functools.partial(_batch_chunk, func, unpack=unpack)
+    chunks = more_itertools.chunked(iterable, chunksize)
+    chunk_results = _ordered_parallel_map(chunk_func, chunks, workers, executor_class=executor_class)
+    return itertools.chain.from_iterable(chunk_results)
+
+
+# the types of results which can not be changed (so the same result can be shared by repeated items)
+_IMMUTABLE_TYPES = frozenset({str, bytes, int, float, complex, bool, type(None), frozenset})
+
+
+def _is_immutable(value) -> bool:
+    if type(value) is tuple:
+        return all(_is_immutable(item) for item in value)
+    return type(value) in _IMMUTABLE_TYPES
+
+
+def _dedupe_key(item):
+    """Return a key for the item which is only equal to the key of an equal item of the same types (e.g. the keys of
+    (1,) and (1.0,) are different)."""
+    if isinstance(item, tuple):
+        return type(item), tuple(_dedupe_key(element) for element in item)
+    if isinstance(item, frozenset):
+        return type(item), frozenset(_dedupe_key(element) for element in item)
+    return type(item), item
+
+
+def _batch_chunk(func: Callable, chunk: list, *, unpack: bool) -> list:
+    """Apply the func to each item in the chunk (computing the result for repeated items only once if it is
+    immutable)."""
+    results_by_item: dict = {}
+    results = []
+    for item in chunk:
+        # the types are part of the key so that equal items of different types (e.g. 1 and 1.0) are computed separately
+        try:
+            key = _dedupe_key(item)
+            result = results_by_item[key]
+        except KeyError:
+            result = func(*item) if unpack else func(item)
+            if _is_immutable(result):
+                results_by_item[key] = result
+        except TypeError:
+            # the item is not hashable
+            result = func(*item) if unpack else func(item)
+        results.append(result)
+    return results
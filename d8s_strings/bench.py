@@ -0,0 +1,357 @@
+import argparse
+import io
+import json
+import math
+import platform
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import d8s_strings
+
+# sizes (in characters) of the text each function is benchmarked with: 10 B to 10 MB
+DEFAULT_SIZES = tuple(10**exponent for exponent in range(1, 8))
+DEFAULT_MIN_TIME = 0.02
+DEFAULT_MAX_SECONDS = 1.0
+DEFAULT_THRESHOLD = 0.25
+
+# the complexity classes a function's timings are fitted to (from the least to the most complex)
+COMPLEXITY_CLASSES: Dict[str, Callable[[int], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+}
+
+# the seed of the corpus the benchmark texts are taken from
+BENCHMARK_SEED = 0
+
+# public functions which are not benchmarked and the reasons why
+SKIPPED_FUNCTIONS = {
+    "Pipeline": "it is built from the other functions (which are benchmarked)",
+    "WhitespaceNormalizer": "it is used by the whitespace functions (which are benchmarked)",
+    "character_examples": "its results are random and do not depend on the size of an input",
+    "corpus_cache_directory": "it generates the benchmark inputs",
+    "corpus_characters": "it generates the benchmark inputs",
+    "corpus_file": "it generates the benchmark inputs",
+    "corpus_mmap": "it generates the benchmark inputs",
+    "corpus_text": "it generates the benchmark inputs",
+    "corpus_texts": "it generates the benchmark inputs",
+    "sentence_case": "it is not implemented",
+    "text_examples": "its results are random and do not depend on the size of an input",
+    "text_input": "it reads from stdin interactively",
+    "text_input_chunks": "it reads from stdin",
+    "text_input_is_no": "it reads from stdin interactively",
+    "text_input_is_yes": "it reads from stdin interactively",
+    "text_input_lines": "it reads from stdin",
+}
+
+
+def _mutated(text: str) -> str:
+    """Return the text with the character in the middle of it changed."""
+    middle = len(text) // 2
+    return text[:middle] + "#" + text[middle + 1 :]
+
+
+def _letters(text: str) -> str:
+    """Return the text with everything except ascii letters removed."""
+    return "".join(char for char in text.lower() if "a" <= char <= "z")
+
+
+def _rows(text: str) -> List[List[str]]:
+    """Return the words on each line of the text."""
+    return [line.split() for line in text.splitlines()]
+
+
+# functions which take something other than the text as their only argument, mapped to a function which returns the
+# arguments for the given text
+BENCHMARK_ARGUMENTS: Dict[str, Callable[[str], tuple]] = {
+    "ContainmentIndex": lambda text: (text.splitlines(),),
+    "apply_edits": lambda text: (text, [(index, index + 1, "#") for index in range(0, len(text), 10)]),
+    "base64_decode": lambda text: (d8s_strings.base64_encode(text),),
+    "bytes_decode_as_string": lambda text: (text.encode(),),
+    "cardinalize": lambda text: (text, 2),
+    "character_display_width": lambda text: (text[0],),
+    "character_to_unicode_number": lambda text: (text[0],),
+    "from_char_code": lambda text: ([ord(char) for char in text],),
+    "hamming_distance": lambda text: (text, _mutated(text)),
+    "hex_to_string": lambda text: (text.encode().hex(),),
+    "letter_as_number": lambda text: (_letters(text)[:1] or "a",),
+    "letter_frequency": lambda text: ("e", text),
+    "numbers_as_string": lambda text: (d8s_strings.string_as_numbers_array(_letters(text)),),
+    "ordinalize": lambda text: (len(text),),
+    "string_add_to_start_of_each_line": lambda text: (text, "> "),
+    "string_as_numbers": lambda text: (_letters(text),),
+    "string_as_numbers_array": lambda text: (_letters(text),),
+    "string_chars_at_start": lambda text: (text, text),
+    "string_chars_at_start_len": lambda text: (text, text),
+    "string_common_prefix": lambda text: (text, _mutated(text)),
+    "string_common_suffix": lambda text: (text, _mutated(text)),
+    "string_find_between": lambda text: (text, "quick", "lazy"),
+    "string_find_between_iter": lambda text: (text, "quick", "lazy"),
+    "string_find_between_stream": lambda text: (text, "quick", "lazy"),
+    "string_get_closes_matches": lambda text: ("fox", text.split()),
+    "string_has_index": lambda text: (text, len(text) - 1),
+    "string_in_iterable_fuzzy": lambda text: ("zebra", text.splitlines()),
+    "string_insert": lambda text: (text, "foo", len(text) // 2),
+    "string_is_palindrome_normalized_many": lambda text: (text.splitlines(),),
+    "string_left_pad": lambda text: (text, len(text) * 2),
+    "string_longest_palindrome_many": lambda text: (text.splitlines(),),
+    "string_modify_line": lambda text: (text, str.upper, 1),
+    "string_pad": lambda text: (text, len(text) * 2),
+    "string_palindrome_count_many": lambda text: (text.splitlines(),),
+    "string_remove": lambda text: (r"\d+", text),
+    "string_remove_after": lambda text: (text, "lazy"),
+    "string_remove_before": lambda text: (text, "lazy"),
+    "string_remove_cache_info": lambda text: (),
+    "string_remove_from_end": lambda text: (text, text[-3:]),
+    "string_remove_from_start": lambda text: (text, text[:3]),
+    "string_remove_index": lambda text: (text, len(text) // 2),
+    "string_remove_many": lambda text: (r"\d+", text.splitlines()),
+    "string_remove_non_alpha_numeric_characters_many": lambda text: (text.splitlines(),),
+    "string_remove_numbers_many": lambda text: (text.splitlines(),),
+    "string_replace_index": lambda text: (text, len(text) // 2, "x"),
+    "string_rotate_crack_many": lambda text: (text.splitlines(),),
+    "string_sequence_matcher": lambda text: (text, _mutated(text)),
+    "string_shorten": lambda text: (text, len(text) // 2),
+    "string_shorten_to_width": lambda text: (text, len(text) // 2),
+    "string_shorten_to_width_many": lambda text: (text.splitlines(), 20),
+    "string_split_multiple": lambda text: (text, " ", "\n", ";"),
+    "string_split_without_empty": lambda text: (text, " "),
+    "strings_diff": lambda text: (text, _mutated(text)),
+    "strings_diff_many": lambda text: ([(text, _mutated(text))], 1),
+    "strings_diff_opcodes": lambda text: (text, _mutated(text)),
+    "strings_longest_matching_block": lambda text: (text, _mutated(text)),
+    "strings_matching_blocks": lambda text: (text, _mutated(text)),
+    "strings_similarity": lambda text: (text, _mutated(text)),
+    "switch": lambda text: ("fox", "dog", text),
+    "text_column_widths": lambda text: (_rows(text),),
+    "text_columns_format": lambda text: (_rows(text),),
+    "text_columns_write": lambda text: (_rows(text), io.StringIO()),
+    "text_ensure_ends_with": lambda text: (text, "!"),
+    "text_ensure_starts_with": lambda text: (text, "!"),
+    "text_join": lambda text: (" ", *text.split()),
+    "unicode_number_to_character": lambda text: (len(text),),
+    "unicode_to_ascii_many": lambda text: (text.splitlines(),),
+    "unicode_to_ascii_stream": lambda text: (text.splitlines(keepends=True),),
+    "xor": lambda text: (text, "key"),
+    "xor_recover_key": lambda text: (text.encode("utf-8"),),
+}
+
+
+def benchmark_text(size: int) -> str:
+    """Return a text of the given size from the (cached) corpus."""
+    return d8s_strings.corpus_text(size, BENCHMARK_SEED)
+
+
+def benchmarked_functions() -> List[str]:
+    """Return the names of all of the public functions which are benchmarked."""
+    return [
+        name for name in d8s_strings.__all__ if name not in SKIPPED_FUNCTIONS and callable(getattr(d8s_strings, name))
+    ]
+
+
+def time_call(func: Callable, args: tuple, min_time: float = DEFAULT_MIN_TIME) -> float:
+    """Return the number of seconds it takes to call the func with the given args.
+
+    The func is called repeatedly until at least min_time seconds have passed (and any iterator it returns is
+    consumed) and the average time per call is returned."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            result = func(*args)
+            if hasattr(result, "__next__"):
+                for _ in result:
+                    pass
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time:
+            return elapsed / number
+        # estimate how many calls will be needed to reach the min_time (with a bit to spare)
+        number = max(number * 2, int(number * min_time * 1.2 / max(elapsed, 1e-9)))
+
+
+def benchmark_function(
+    name: str,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    min_time: float = DEFAULT_MIN_TIME,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+) -> dict:
+    """Benchmark the public function with the given name over texts of each of the sizes.
+
+    Larger sizes are skipped once a single call takes longer than max_seconds."""
+    func = getattr(d8s_strings, name)
+    arguments = BENCHMARK_ARGUMENTS.get(name, lambda text: (text,))
+    timings: List[list] = []
+
+    for size in sizes:
+        text = benchmark_text(size)
+        try:
+            seconds = time_call(func, arguments(text), min_time)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}", "timings": timings}
+
+        timings.append([size, seconds])
+        if seconds > max_seconds:
+            break
+
+    return {"complexity": fit_complexity(*zip(*timings)) if timings else None, "timings": timings}
+
+
+def benchmark(
+    names: Optional[Iterable[str]] = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    min_time: float = DEFAULT_MIN_TIME,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    output=None,
+) -> dict:
+    """Benchmark the public functions with the given names (or all of them) and return the results.
+
+    If an output stream is given, a report of each function's results is written to it as soon as it is finished."""
+    if names is None:
+        names = benchmarked_functions()
+
+    results = {}
+    for name in names:
+        results[name] = benchmark_function(name, sizes, min_time=min_time, max_seconds=max_seconds)
+        if output is not None:
+            output.write(format_result(name, results[name]))
+            output.flush()
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def fit_complexity(sizes: Sequence[int], seconds: Sequence[float]) -> str:
+    """Return the complexity class which best fits the given timings.
+
+    Each class is fitted as seconds = a + b * f(size) (so that the constant overhead of calling a function does not
+    hide its growth) minimizing the relative error so that the small sizes count as much as the large ones. A class
+    is only chosen over a simpler one if it fits noticeably better and its growth accounts for most of the time at the
+    largest size (otherwise, noise in the timings of a constant-time function could be fitted as growth)."""
+    best_fit = None
+    for complexity, f in COMPLEXITY_CLASSES.items():
+        x = [f(size) for size in sizes]
+        a, b, residual = _fit(x, seconds)
+        if best_fit is not None and b * max(x) < a:
+            continue
+        if best_fit is None or residual < best_fit[1] * 0.8:
+            best_fit = (complexity, residual)
+    return best_fit[0]  # type: ignore
+
+
+def _fit(x: Sequence[float], y: Sequence[float]) -> Tuple[float, float, float]:
+    """Fit y = a + b * x (with a, b >= 0) by least squares weighted by 1/y^2 and return a, b, and the residual."""
+    w = [1 / max(value, 1e-12) ** 2 for value in y]
+    s = sum(w)
+    sx = sum(wi * xi for wi, xi in zip(w, x))
+    sy = sum(wi * yi for wi, yi in zip(w, y))
+    sxx = sum(wi * xi * xi for wi, xi in zip(w, x))
+    sxy = sum(wi * xi * yi for wi, xi, yi in zip(w, x, y))
+
+    determinant = s * sxx - sx * sx
+    if determinant <= 1e-12 * s * sxx:
+        # x is constant, so only a constant can be fitted
+        a, b = sy / s, 0.0
+    else:
+        a = (sxx * sy - sx * sxy) / determinant
+        b = (s * sxy - sx * sy) / determinant
+        if b < 0:
+            a, b = sy / s, 0.0
+        elif a < 0:
+            a, b = 0.0, sxy / sxx
+
+    residual = sum(wi * (a + b * xi - yi) ** 2 for wi, xi, yi in zip(w, x, y))
+    return a, b, residual
+
+
+def compare_results(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Compare the results with the baseline results and return a description of each regression.
+
+    A function has regressed if its complexity class has increased or if, at the largest size benchmarked in both, it
+    is more than threshold (as a fraction) slower than the baseline."""
+    complexities = list(COMPLEXITY_CLASSES)
+    regressions = []
+
+    for name, result in results["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if not baseline_result or not baseline_result.get("timings") or not result.get("timings"):
+            continue
+
+        if result.get("complexity") in complexities and baseline_result.get("complexity") in complexities:
+            if complexities.index(result["complexity"]) > complexities.index(baseline_result["complexity"]):
+                regressions.append(
+                    f"{name}: complexity went from {baseline_result['complexity']} to {result['complexity']}"
+                )
+
+        baseline_timings = dict(baseline_result["timings"])
+        common_sizes = [size for size, _ in result["timings"] if size in baseline_timings]
+        if common_sizes:
+            size = max(common_sizes)
+            ratio = dict(result["timings"])[size] / baseline_timings[size]
+            if ratio > 1 + threshold:
+                regressions.append(f"{name}: {ratio:.2f}x slower than the baseline with {size:,} characters")
+
+    return regressions
+
+
+def format_result(name: str, result: dict) -> str:
+    """Return a report of the given function's benchmark result."""
+    if "error" in result:
+        return f"{name}: {result['error']}\n"
+
+    lines = [f"{name}: {result['complexity']}"]
+    for size, seconds in result["timings"]:
+        throughput = size / seconds / 1e6
+        lines.append(f"    {size:>12,} chars {seconds * 1e6:>16,.2f} µs {throughput:>12,.2f} MB/s")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m d8s_strings.bench", description="Benchmark the d8s_strings functions over growing inputs."
+    )
+    parser.add_argument("functions", nargs="*", help="names of the functions to benchmark (defaults to all of them)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_SIZES[-1], help="the largest text size to benchmark")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="minimum seconds to time each size")
+    parser.add_argument(
+        "--max-seconds", type=float, default=DEFAULT_MAX_SECONDS, help="stop growing the size past this time per call"
+    )
+    parser.add_argument("--save", help="save the results as a JSON baseline at this path")
+    parser.add_argument("--compare", help="compare the results with the JSON baseline at this path")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="fraction by which a function may be slower"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in DEFAULT_SIZES if size <= args.max_size]
+    results = benchmark(
+        args.functions or None, sizes, min_time=args.min_time, max_seconds=args.max_seconds, output=sys.stdout
+    )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
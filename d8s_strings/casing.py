@@ -0,0 +1,215 @@
+import string as string_module
+from array import array
+
+from d8s_lists import truthy_items
+
+from .codepoints import CodePoints
+
+
+def string_split_on_uppercase(  # noqa: CCR001
+    input_string: str, include_uppercase_characters=False, split_acronyms=True
+):
+    """Split the input_string on uppercase characters.
+
+    If split_acronyms is False, the function will not split consecutive uppercase letters."""
+    if not split_acronyms and not include_uppercase_characters:
+        message = "If you set the `split_acronyms` to False when calling the `string_split_on_uppercase` function,\
+             you must also set the `include_uppercase_characters` (which you did not). The function will continue,\
+                  but the `split_acronyms` argument will make no difference."
+        raise ValueError(message)
+
+    uppercase_char_array = [char.isupper() for char in input_string]
+    split_string = []
+    last_uppercase_character_index = 0
+
+    for index, character_is_upper in enumerate(uppercase_char_array):
+        if character_is_upper:
+            # if we are not splitting acronyms, check to see if the character is part of an acronym
+            if include_uppercase_characters and not split_acronyms:
+                previous_character_is_upper = uppercase_char_array[index - 1]
+                # if the capital letter is preceded and followed by an uppercase letter, continue
+                if previous_character_is_upper:
+                    # continue to the next character
+                    continue
+
+            # if the first character in the input_string is uppercase (index == 0), we don't need to append anything
+            if index > 0:
+                split_string.append(input_string[last_uppercase_character_index:index])
+
+            if include_uppercase_characters:
+                last_uppercase_character_index = index
+            else:
+                last_uppercase_character_index = index + 1
+
+    split_string.append(input_string[last_uppercase_character_index:])
+
+    # we are using the truthy_items function b/c if include_uppercase_characters is False and the last character of the
+    # input_string is uppercase, an empty string will be erroneously included in the response from this function
+    return truthy_items(split_string)
+
+
+def string_split_on_lowercase(input_string, include_lowercase_characters=False):  # noqa: CCR001
+    """Split the string on lowercase characters."""
+    split_string = []
+    last_lowercase_character_index = 0
+
+    for index, character in enumerate(input_string):
+        if character.islower():
+            # if the first character in the string is lowercase (index == 0), we don't need to append anything
+            if index > 0:
+                split_string.append(input_string[last_lowercase_character_index:index])
+
+            if include_lowercase_characters:
+                last_lowercase_character_index = index
+            else:
+                last_lowercase_character_index = index + 1
+
+    split_string.append(input_string[last_lowercase_character_index:])
+
+    # see the note from the string_split_on_uppercase function
+    return truthy_items(split_string)
+
+
+def _latin_1_swapcase_table():
+    """Return a bytes.translate table which swaps the case of latin-1 characters and the characters whose swapped case
+    is not a single latin-1 character (which cannot be swapped using the table)."""
+    table = bytearray(range(256))
+    untranslatable_characters = bytearray()
+    for byte in range(256):
+        character = chr(byte)
+        swapped_character = character.swapcase()
+        if len(swapped_character) == 1 and ord(swapped_character) < 256:
+            table[byte] = ord(swapped_character)
+        else:
+            untranslatable_characters.append(byte)
+    return bytes(table), bytes(untranslatable_characters)
+
+
+_LATIN_1_SWAPCASE_TABLE, _LATIN_1_UNSWAPPABLE_CHARACTERS = _latin_1_swapcase_table()
+
+
+def string_reverse_case(input_string):
+    """Make lowercase characters uppercased and visa-versa."""
+    if isinstance(input_string, CodePoints):
+        data = input_string.codes.tobytes()
+        if input_string.typecode == "B" and len(data.translate(None, _LATIN_1_UNSWAPPABLE_CHARACTERS)) == len(data):
+            return CodePoints.from_codes(array("B", data.translate(_LATIN_1_SWAPCASE_TABLE)))
+        return CodePoints(string_reverse_case(str(input_string)))
+
+    # str.swapcase does the same thing as the code below except that it lowercases "Σ" differently at the end of words
+    if "Σ" not in input_string:
+        return input_string.swapcase()
+
+    string_list = []
+
+    for character in input_string:
+        if character.isupper():
+            string_list.append(lowercase(character))
+        elif character.islower():
+            string_list.append(uppercase(character))
+        else:
+            string_list.append(character)
+
+    return "".join(string_list)
+
+
+def titlecase(item):
+    return _handle_casing(item, "title")
+
+
+def uppercase(item):
+    return _handle_casing(item, "upper")
+
+
+def uppercase_first_letter(text):
+    """Make the first letter of the text uppercase."""
+    return "{}{}".format(text[0].upper(), text[1:])
+
+
+def lowercase_first_letter(text):
+    """Make the first letter of the text lowercase."""
+    return "{}{}".format(text[0].lower(), text[1:])
+
+
+def crazycase(text):
+    """Make the case of the characters in the given text pseudo-random"""
+    import random
+
+    new_text = ""
+
+    for character in text:
+        if character in string_module.ascii_letters:
+            casing_options = (lowercase, uppercase)
+            casing_action = random.choice(casing_options)  # nosec
+            character = casing_action(character)
+        new_text += character
+
+    return new_text
+
+
+def kebab_case(text):
+    """Return the text with a "-" in place of every space."""
+    text = text.replace(" ", "-")
+    text = text.replace("_", "-")
+
+    return text
+
+
+def snake_case(text):
+    """Return the text with a "_" in place of every space."""
+    text = text.replace(" ", "_")
+    text = text.replace("-", "_")
+
+    return text
+
+
+def camel_case(text: str):
+    """Return the text with no spaces and every word (except the first one) capitalized."""
+    text = text.replace("-", " ")
+    text = text.replace("_", " ")
+    text_list = [word.title() for word in text.split()]
+    text_list[0] = text_list[0].lower()
+
+    return "".join(text_list)
+
+
+def pascal_case(text: str):
+    """Return the text with no spaces and every word capitalized."""
+    text_list = [word.title() for word in text.split()]
+
+    return "".join(text_list)
+
+
+def sentence_case(text: str):
+    """."""
+    # TODO: does this already exist?
+    raise NotImplementedError
+
+
+def uppercase_count(text):
+    """Count the number of uppercase letters in the given text."""
+    return sum([1 for char in text if char.isupper()])
+
+
+def lowercase_count(text):
+    """Count the number of lowercase letters in the given text."""
+    return sum([1 for char in text if char.islower()])
+
+
+def lowercase(item):
+    return _handle_casing(item, "lower")
+
+
+# TODO: we should be able to validate the values of the `casing` argument
+def _handle_casing(item, casing):
+    available_casing_types = ("lower", "title", "upper")
+    if casing not in available_casing_types:
+        message = "! Invalid casing type given: {}\nAvailable casing types are: {}".format(
+            casing, available_casing_types
+        )
+        raise ValueError(message)
+    if isinstance(item, (str, bytes)):
+        return eval("item.{}()".format(casing))  # nosec # pylint: disable=W0123
+    else:
+        print("! Democritus cannot yet {}-case an item of type {}".format(casing, type(item)))
+        return item
@@ -0,0 +1,152 @@
+import functools
+import re
+from typing import Callable, Iterable
+
+from .codecs import bytes_decode_as_string, string_encode_as_bytes
+from .core import text_join
+from .whitespace import string_has_whitespace_run
+
+
+def string_remove_before(string: str, stop_string: str):
+    """Remove everything from the start of the given string until the stop_string."""
+    # we have to re-add the stop_string because otherwise it would not be included
+    return f"{stop_string}{string.split(stop_string, maxsplit=1)[-1]}"
+
+
+def string_remove_after(string: str, start_string: str):
+    """Remove everything after the start_string to the end of the given string."""
+    split_string = string.split(start_string)
+    if len(split_string) > 1:
+        # we have to re-add the start_string to the next-to-last item, otherwise, it will not be included
+        split_string[-2] += start_string
+    return text_join(start_string, *split_string[:-1])
+
+
+def string_has_multiple_consecutive_spaces(string):
+    """Return True if the given string has multiple, consecutive spaces."""
+    return string_has_whitespace_run(string, "space", 2)
+
+
+# def string_remove_non_alphabetic_characters(string: str):
+#     """."""
+#     pass
+
+
+# def string_remove_non_numeric_characters(string: str):
+#     """."""
+#     pass
+
+
+NON_ALPHA_NUMERIC_CHARACTERS_REGEX = r"[^a-zA-Z\d\s]"
+NUMBERS_REGEX = r"\d+"
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+# the re module caches (at most) 512 compiled patterns internally - our cache is larger so that pipelines using many
+# patterns do not thrash it
+PATTERN_CACHE_SIZE = 4096
+
+
+def string_remove_non_alpha_numeric_characters(string: str):
+    """."""
+    if string.isascii():
+        return string.translate(_ASCII_NON_ALPHA_NUMERIC_DELETION_TABLE)
+    string_after_removal = string_remove(NON_ALPHA_NUMERIC_CHARACTERS_REGEX, string)
+    return string_after_removal
+
+
+def string_remove_non_alpha_numeric_characters_many(strings: Iterable[str]) -> Iterable[str]:
+    """Remove all non-alpha-numeric characters from each of the given strings."""
+    for string in strings:
+        yield string_remove_non_alpha_numeric_characters(string)
+
+
+def string_remove(regex_pattern, input_string, **kwargs):
+    """Remove the regex_pattern from the input_string."""
+    string_after_removal = _string_remover(regex_pattern, **kwargs)(input_string)
+    return string_after_removal
+
+
+def string_remove_many(regex_pattern, input_strings: Iterable, **kwargs) -> Iterable:
+    """Remove the regex_pattern from each of the input_strings (compiling the regex_pattern only once)."""
+    remover = _string_remover(regex_pattern, **kwargs)
+    for input_string in input_strings:
+        yield remover(input_string)
+
+
+def string_remove_cache_info() -> dict:
+    """Return statistics about the cache of compiled patterns used by the string_remove functions."""
+    cache_info = _compiled_pattern.cache_info()
+    lookups = cache_info.hits + cache_info.misses
+    return {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "maxsize": cache_info.maxsize,
+        "currsize": cache_info.currsize,
+        "hit_rate": cache_info.hits / lookups if lookups else 0.0,
+    }
+
+
+def _string_remover(regex_pattern, *, count: int = 0, flags=0) -> Callable:
+    """Return a function which removes the regex_pattern from a given string."""
+    if isinstance(regex_pattern, str) and not flags and not REGEX_METACHARACTERS.intersection(regex_pattern):
+        # the pattern is a plain string, so we don't need a regex at all
+        return lambda input_string: input_string.replace(regex_pattern, "", count or -1)
+
+    pattern = _compiled_pattern(regex_pattern, flags)
+    return functools.partial(pattern.sub, "", count=count)
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compiled_pattern(regex_pattern, flags=0) -> re.Pattern:
+    """Return the compiled form of the given regex_pattern."""
+    return re.compile(regex_pattern, flags)
+
+
+def _ascii_deletion_table(regex_pattern: str) -> dict:
+    """Return a str.translate table deleting every ascii character matched by the regex_pattern."""
+    pattern = re.compile(regex_pattern)
+    return {code_point: None for code_point in range(128) if pattern.match(chr(code_point))}
+
+
+_ASCII_NON_ALPHA_NUMERIC_DELETION_TABLE = _ascii_deletion_table(NON_ALPHA_NUMERIC_CHARACTERS_REGEX)
+_ASCII_NUMBERS_DELETION_TABLE = _ascii_deletion_table(NUMBERS_REGEX)
+
+
+def string_remove_unicode(string: str):
+    """Remove all Unicode characters from the given string."""
+    string_with_unicode_removed = bytes_decode_as_string(
+        string_encode_as_bytes(string, encoding="ascii", errors="ignore")
+    )
+    return string_with_unicode_removed
+
+
+def string_remove_numbers(input_string: str, replacement: str = " "):
+    """Remove all numbers from the input_strings."""
+    if not replacement and input_string.isascii():
+        return input_string.translate(_ASCII_NUMBERS_DELETION_TABLE)
+    new_string_without_numbers = _compiled_pattern(NUMBERS_REGEX).sub(replacement, input_string)
+    return new_string_without_numbers
+
+
+def string_remove_numbers_many(input_strings: Iterable[str], replacement: str = " ") -> Iterable[str]:
+    """Remove all numbers from each of the input_strings."""
+    for input_string in input_strings:
+        yield string_remove_numbers(input_string, replacement)
+
+
+def string_remove_from_start(input_string, string_to_remove):
+    """Remove the string_to_remove from the start of the input_string."""
+    if input_string.startswith(string_to_remove):
+        updated_string = input_string[len(string_to_remove) :]
+        return updated_string
+    else:
+        return input_string
+
+
+def string_remove_from_end(input_string, string_to_remove):
+    """Remove the string_to_remove from the end of the input_string."""
+    if input_string.endswith(string_to_remove):
+        desired_string_final_index = len(input_string) - len(string_to_remove)
+        updated_string = input_string[:desired_string_final_index]
+        return updated_string
+    else:
+        return input_string
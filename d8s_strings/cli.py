@@ -0,0 +1,165 @@
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import d8s_strings
+
+from ._parallel import _ordered_parallel_map
+from .core import text_input_lines
+
+# the number of lines sent to a worker at a time
+DEFAULT_CHUNKSIZE = 1024
+
+
+def _apply_functions(funcs: Tuple[Callable, ...], value):
+    for func in funcs:
+        value = func(value)
+    return value
+
+
+def _output_line(result) -> str:
+    """Return the result of applying the functions to a line as a line of output (results which are not strings are
+    written as JSON)."""
+    if isinstance(result, str):
+        return result
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
+def _process_lines(funcs: Tuple[Callable, ...], lines: List[str]) -> List[str]:
+    return [_output_line(_apply_functions(funcs, line)) for line in lines]
+
+
+def _process_jsonl_lines(funcs: Tuple[Callable, ...], fields: Tuple[str, ...], lines: List[str]) -> List[str]:
+    """Apply the funcs to the given fields (or every string field if no fields are given) of each JSON object."""
+    output_lines = []
+    for line in lines:
+        if not line.strip():
+            output_lines.append(line)
+            continue
+
+        record = json.loads(line)
+        for key in fields or [key for key, value in record.items() if isinstance(value, str)]:
+            if key in record:
+                record[key] = _apply_functions(funcs, record[key])
+        output_lines.append(json.dumps(record, ensure_ascii=False, default=str))
+    return output_lines
+
+
+def _file_lines(path: str, encoding: str) -> Iterator[str]:
+    """Yield each line (without its line ending) of the file as it is read."""
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            yield line[:-1] if line.endswith("\n") else line
+
+
+def _chunks(lines: Iterable[str], chunksize: int, statistics: dict) -> Iterator[List[str]]:
+    """Split the lines into chunks (counting the lines and characters read)."""
+    import more_itertools
+
+    for chunk in more_itertools.chunked(lines, chunksize):
+        statistics["lines"] += len(chunk)
+        statistics["characters"] += sum(map(len, chunk))
+        yield chunk
+
+
+def process(
+    funcs: Sequence[Callable],
+    lines: Iterable[str],
+    output: TextIO,
+    *,
+    jsonl: bool = False,
+    fields: Sequence[str] = (),
+    workers: int = 1,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> dict:
+    """Apply the chain of funcs to each of the lines (or to the fields of each JSON line if jsonl is True) and write the
+    results to the output in the same order as the lines.
+
+    The lines are processed in chunks by a pool of the given number of worker processes and only a few chunks per worker
+    are held in memory at a time. Return the number of lines and characters processed and the seconds taken."""
+    if jsonl:
+        chunk_func = functools.partial(_process_jsonl_lines, tuple(funcs), tuple(fields))
+    else:
+        chunk_func = functools.partial(_process_lines, tuple(funcs))
+
+    statistics: dict = {"lines": 0, "characters": 0}
+    start = time.perf_counter()
+    for output_lines in _ordered_parallel_map(chunk_func, _chunks(lines, chunksize, statistics), workers):
+        if output_lines:
+            output.write("\n".join(output_lines) + "\n")
+    output.flush()
+    statistics["seconds"] = time.perf_counter() - start
+    return statistics
+
+
+def format_statistics(statistics: dict) -> str:
+    """Return a report of the throughput of the given statistics (see process)."""
+    seconds = max(statistics["seconds"], 1e-9)
+    lines_per_second = statistics["lines"] / seconds
+    characters_per_second = statistics["characters"] / seconds / 1e6
+    return (
+        f"Processed {statistics['lines']:,} lines ({statistics['characters']:,} characters) in {seconds:.2f} s: "
+        f"{lines_per_second:,.0f} lines/s, {characters_per_second:,.2f} million characters/s\n"
+    )
+
+
+def _function(name: str) -> Callable:
+    if name not in d8s_strings.__all__ or not callable(getattr(d8s_strings, name)):
+        raise argparse.ArgumentTypeError(f"Invalid function given: {name}\nRun with --list to see the functions.")
+    return getattr(d8s_strings, name)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Apply d8s_strings functions to text from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="d8s-strings",
+        description="Apply a chain of d8s_strings functions to each line of a file (or stdin).",
+        epilog="example: d8s-strings unicode_to_ascii string_remove_numbers snake_case -i names.txt",
+    )
+    parser.add_argument("functions", nargs="*", type=_function, help="names of the functions to apply (in order)")
+    parser.add_argument("-i", "--input", help="the file to read (defaults to stdin)")
+    parser.add_argument("-o", "--output", help="the file to write (defaults to stdout)")
+    parser.add_argument("--encoding", default="utf-8", help="the encoding of the input and output files")
+    parser.add_argument("--jsonl", action="store_true", help="treat each line as a JSON object")
+    parser.add_argument(
+        "-f", "--field", action="append", default=[], help="a JSON field to apply the functions to (defaults to all)"
+    )
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="the number of processes")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="lines sent to a process at a time")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report the throughput (on stderr)")
+    parser.add_argument("--list", action="store_true", help="list the functions which can be applied")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(name for name in d8s_strings.__all__ if callable(getattr(d8s_strings, name))))
+        return 0
+    if not args.functions:
+        parser.error("at least one function is required")
+
+    lines = _file_lines(args.input, args.encoding) if args.input else text_input_lines()
+    output = open(args.output, "w", encoding=args.encoding) if args.output else sys.stdout
+    try:
+        statistics = process(
+            args.functions,
+            lines,
+            output,
+            jsonl=args.jsonl,
+            fields=args.field,
+            workers=args.workers,
+            chunksize=args.chunksize,
+        )
+    finally:
+        if args.output:
+            output.close()
+
+    if not args.quiet:
+        sys.stderr.write(format_statistics(statistics))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,509 @@
+import functools
+import re
+import string as string_module
+import unicodedata
+from array import array
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from d8s_dicts import dict_delistify_values, dict_flip
+
+from .codepoints import _UTF_32_CODEC, CodePoints, _code_points_xor
+
+
+def xor(message, key):
+    """."""
+    # credits for inspiration to:
+    # https://stackoverflow.com/a/25475760 and
+    # https://en.wikipedia.org/wiki/XOR_cipher#Example_implementation
+    from itertools import cycle
+
+    if isinstance(message, CodePoints):
+        return _code_points_xor(message, key if isinstance(key, CodePoints) else CodePoints(key))
+    elif isinstance(message, str):
+        # Text strings contain single characters
+        return "".join(chr(ord(a) ^ ord(b)) for a, b in zip(message, cycle(key)))
+    else:
+        # Python 3 bytes objects contain integer values in the range 0-255
+        return bytes_decode_as_string(bytes([a ^ b for a, b in zip(message, cycle(key))]))
+
+
+# the number of bytes at the start of a ciphertext which are compared to rank the possible key sizes
+_XOR_KEYSIZE_SAMPLE_SIZE = 2**18
+
+
+def xor_recover_key(ciphertext, max_keysize: int = 40, *, candidates: int = 3) -> List[Tuple[bytes, float]]:
+    """Recover the repeating key which most likely encrypted the English ciphertext (bytes) using xor.
+
+    The key sizes up to max_keysize are ranked by the normalized hamming distance between the start of the ciphertext
+    and itself shifted by the key size (which is lowest when the shift matches the key). Each byte of the key is then
+    found for the given number of the best key sizes (and their divisors) by scoring every possible byte against the
+    frequencies of the bytes in each column of the ciphertext. Return up to the given number of candidate keys and their
+    scores (the average number of bits per byte needed to encode the key and the decrypted text using a simple model of
+    English, so lower scores are more likely) ranked from the most to the least likely."""
+    import collections
+
+    data = ciphertext.encode("latin-1") if isinstance(ciphertext, str) else bytes(ciphertext)
+    if not data:
+        return []
+
+    sample = data[:_XOR_KEYSIZE_SAMPLE_SIZE]
+    keysizes = sorted(
+        range(1, min(max_keysize, len(sample) - 1) + 1), key=lambda keysize: _xor_distance(sample, keysize)
+    )
+    if not keysizes:
+        keysizes = [1]
+
+    # a multiple of the real key size is often ranked above it (especially for short ciphertexts), so the divisors of
+    # the best key sizes are tried as well
+    tried_keysizes = sorted(
+        {divisor for keysize in keysizes[:candidates] for divisor in range(1, keysize + 1) if not keysize % divisor}
+    )
+    byte_costs = _english_byte_costs()
+    keys = {}
+    for keysize in tried_keysizes:
+        key_bytes = bytearray()
+        cost = 0.0
+        for column_index in range(keysize):
+            column_counts = collections.Counter(data[column_index::keysize]).items()
+            key_byte, column_cost = min(
+                (
+                    (key_byte, sum(count * byte_costs[byte ^ key_byte] for byte, count in column_counts))
+                    for key_byte in range(256)
+                ),
+                key=lambda key_cost: key_cost[1],
+            )
+            key_bytes.append(key_byte)
+            cost += column_cost
+        # a key which repeats a shorter key (e.g. when the key size is a multiple of the real key size) is that key
+        key = _shortest_repeating_unit(bytes(key_bytes))
+        # each byte of the key costs 8 bits to encode as well, so that a longer key (which always fits the ciphertext at
+        # least as well as a shorter one) is only more likely if it saves more bits than it costs
+        keys[key] = (cost + 8 * len(key)) / len(data)
+    return sorted(keys.items(), key=lambda key_score: key_score[1])[:candidates]
+
+
+def _xor_distance(data: bytes, keysize: int) -> float:
+    """Return the average number of bits which differ between each byte of the data and the byte keysize bytes later."""
+    # xoring the data as (arbitrarily large) integers compares all of the bytes at once
+    shifted_xor = int.from_bytes(data[keysize:], "little") ^ int.from_bytes(data[:-keysize], "little")
+    return shifted_xor.bit_count() / (len(data) - keysize)
+
+
+def _shortest_repeating_unit(data: bytes) -> bytes:
+    """Return the shortest bytes which repeated a whole number of times are the data (e.g. b"ab" for b"ababab")."""
+    for size in range(1, len(data)):
+        if not len(data) % size and data[:size] * (len(data) // size) == data:
+            return data[:size]
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _english_byte_costs() -> Tuple[float, ...]:
+    """Return the number of bits needed to encode each byte using a simple model of English text."""
+    import math
+
+    # the 158 bytes which are neither letters, spaces, nor other printable characters share a probability of 0.1%
+    probabilities = [0.001 / 158] * 256
+    other_printable_characters = set(string_module.printable) - set(string_module.ascii_letters) - {" ", "\x0b", "\x0c"}
+    for character in other_printable_characters:
+        probabilities[ord(character)] = 0.099 / len(other_printable_characters)
+    probabilities[ord(" ")] = 0.15
+    for letter, frequency in ENGLISH_LETTER_FREQUENCIES.items():
+        probabilities[ord(letter)] = 0.72 * frequency
+        probabilities[ord(letter.upper())] = 0.03 * frequency
+    return tuple(-math.log2(probability) for probability in probabilities)
+
+
+def base64_encode(input_string):
+    """Base64 encode the string."""
+    import base64
+
+    return bytes_decode_as_string(base64.b64encode(string_encode_as_bytes(input_string)))
+
+
+def base64_decode(input_string):
+    """Base64 decode the string."""
+    import base64
+
+    return bytes_decode_as_string(base64.b64decode(input_string), "latin-1")
+
+
+def hex_to_string(hex_string):
+    """Convert the given hex string to ascii."""
+    hex_string = hex_string.replace("0x", "").replace(",", "").replace(" ", "")
+
+    return bytes_decode_as_string(bytes.fromhex(hex_string), "latin-1")
+
+
+def string_to_hex(ascii_string: str, seperator="") -> str:
+    """Convert the given ascii string to hex."""
+    hex_string = ""
+    for char in ascii_string:
+        hex_string += str(hex(character_to_unicode_number(char))).split("x")[-1] + seperator
+    hex_string = hex_string.strip(seperator)
+    return hex_string
+
+
+def character_to_unicode_number(character):
+    """Convert the given character to its Unicode number. This is the same as the `ord` function in python."""
+    return ord(character)
+
+
+def unicode_number_to_character(unicode_number):
+    """Convert the given unicode_number to it's unicode character form.
+
+    This is the same as the `chr` function in python."""
+    return chr(unicode_number)
+
+
+def from_char_code(integer_list):
+    """Convert the given code points (a list, array('I'), or numpy array) to a string."""
+    if isinstance(integer_list, array) and integer_list.itemsize == 4:
+        # the array's memory is already utf-32 encoded text
+        return integer_list.tobytes().decode(_UTF_32_CODEC, "surrogatepass")
+    elif hasattr(integer_list, "dtype") and hasattr(integer_list, "astype"):
+        return integer_list.astype("=u4").tobytes().decode(_UTF_32_CODEC, "surrogatepass")
+    return "".join(map(chr, map(int, integer_list)))
+
+
+def string_char_codes(input_string: Union[str, bytes], *, numpy: bool = False):
+    """Return the code point of each character in the input_string as an array('I') (or a numpy array if numpy is
+    True). Bytes are decoded as latin-1 (so each byte, including those >= 0x80, is its own code point). This is the
+    inverse of from_char_code."""
+    if isinstance(input_string, bytes):
+        codes = _widened(input_string)
+    elif input_string.isascii():
+        codes = _widened(input_string.encode("ascii"))
+    else:
+        codes = array("I", input_string.encode(_UTF_32_CODEC, "surrogatepass"))
+    return _as_numpy(codes) if numpy else codes
+
+
+def _widened(data: bytes) -> array:
+    """Return an array("I") with each of the bytes in the given data."""
+    # latin-1 maps each byte to the code point with the same value, so this widens the bytes without a python loop
+    return array("I", data.decode("latin-1").encode(_UTF_32_CODEC))
+
+
+def _as_numpy(codes: array):
+    """Convert the array('I') to a numpy array (numpy is an optional dependency)."""
+    import numpy
+
+    return numpy.frombuffer(codes, dtype=numpy.uintc).copy()
+
+
+def text_ascii_characters(text: str) -> Iterable[str]:
+    """."""
+    if text.isascii():
+        yield from text
+        return
+
+    for run in text_ascii_runs(text):
+        yield from run
+
+
+def text_non_ascii_characters(text: str) -> Iterable[str]:
+    """."""
+    if text.isascii():
+        return
+
+    for run in text_non_ascii_runs(text):
+        yield from run
+
+
+def text_ascii_runs(text: Union[str, bytes], *, spans: bool = False) -> Iterable:
+    """Yield each run of consecutive ascii characters in the text (or the (start, end) indexes of each run if spans is
+    True). If the text is bytes, it is scanned directly (without being decoded)."""
+    if text.isascii():
+        if text:
+            yield (0, len(text)) if spans else text
+        return
+
+    pattern: re.Pattern = _ASCII_RUNS_BYTES_REGEX if isinstance(text, bytes) else _ASCII_RUNS_REGEX
+    for match in pattern.finditer(text):
+        yield match.span() if spans else match.group()
+
+
+def text_non_ascii_runs(text: Union[str, bytes], *, spans: bool = False) -> Iterable:
+    """Yield each run of consecutive non-ascii characters in the text (or the (start, end) indexes of each run if spans
+    is True). If the text is bytes, it is scanned directly (without being decoded)."""
+    if text.isascii():
+        return
+
+    pattern: re.Pattern = _NON_ASCII_RUNS_BYTES_REGEX if isinstance(text, bytes) else _NON_ASCII_RUNS_REGEX
+    for match in pattern.finditer(text):
+        yield match.span() if spans else match.group()
+
+
+def text_ascii_character_count(text: Union[str, bytes]) -> int:
+    """Count the number of ascii characters in the text."""
+    if text.isascii():
+        return len(text)
+
+    if isinstance(text, bytes):
+        return len(text) - len(text.translate(None, _ASCII_BYTES))
+    return len(text.encode("ascii", "ignore"))
+
+
+def text_non_ascii_character_count(text: Union[str, bytes]) -> int:
+    """Count the number of non-ascii characters in the text. If the text is bytes, it is assumed to be utf-8 encoded."""
+    if text.isascii():
+        return 0
+
+    if isinstance(text, bytes):
+        # every non-ascii character in utf-8 starts with exactly one byte >= 0xC0 (the rest are continuation bytes)
+        return len(text.translate(None, _ASCII_AND_CONTINUATION_BYTES))
+    return len(text) - text_ascii_character_count(text)
+
+
+_ASCII_RUNS_REGEX = re.compile(r"[\x00-\x7f]+")
+_ASCII_RUNS_BYTES_REGEX = re.compile(rb"[\x00-\x7f]+")
+_NON_ASCII_RUNS_REGEX = re.compile(r"[^\x00-\x7f]+")
+_NON_ASCII_RUNS_BYTES_REGEX = re.compile(rb"[^\x00-\x7f]+")
+_ASCII_BYTES = bytes(range(0x80))
+_ASCII_AND_CONTINUATION_BYTES = bytes(range(0xC0))
+
+
+# the position of each letter in the alphabet (the same for upper and lowercase letters) and 0 for everything else
+_LETTER_NUMBERS = bytes(
+    string_module.ascii_lowercase.find(chr(byte).lower()) + 1 if chr(byte) in string_module.ascii_letters else 0
+    for byte in range(256)
+)
+_LETTER_NUMBERS_RANGE = bytes(range(1, 27))
+_NUMBER_LETTERS = bytes.maketrans(_LETTER_NUMBERS_RANGE, string_module.ascii_lowercase.encode("ascii"))
+
+
+def _invalid_letter(letter):
+    message = f"Invalid letter given: {letter!r}\nAvailable letters are: {string_module.ascii_letters}"
+    return ValueError(message)
+
+
+# TODO: rename this function
+def letter_as_number(letter):
+    """Return the position of the given letter in the alphabet (e.g. 1 for "a" or "A")."""
+    number = _LETTER_NUMBERS[ord(letter)] if len(letter) == 1 and letter.isascii() else 0
+    if not number:
+        raise _invalid_letter(letter)
+    return number
+
+
+def _letter_numbers(input_string: Union[str, bytes]) -> bytes:
+    """Return the position of each letter of the input_string in the alphabet as bytes."""
+    if isinstance(input_string, CodePoints):
+        input_string = input_string.codes.tobytes() if input_string.typecode == "B" else str(input_string)
+    if isinstance(input_string, str):
+        if not input_string.isascii():
+            raise _invalid_letter(next(char for char in input_string if not char.isascii()))
+        input_string = input_string.encode("ascii")
+
+    numbers = input_string.translate(_LETTER_NUMBERS)
+    if 0 in numbers:
+        raise _invalid_letter(chr(input_string[numbers.index(0)]))
+    return numbers
+
+
+def string_as_numbers(input_string: str):
+    """Return the position of each letter of the input_string in the alphabet."""
+    return list(_letter_numbers(input_string))
+
+
+def string_as_numbers_array(input_string: Union[str, bytes], *, numpy: bool = False):
+    """Return the position of each letter of the input_string in the alphabet as an array('I') (or a numpy array if
+    numpy is True)."""
+    numbers = _widened(_letter_numbers(input_string))
+    return _as_numpy(numbers) if numpy else numbers
+
+
+def numbers_as_string(numbers) -> str:
+    """Convert the position of each letter in the alphabet (a list, array, or numpy array) back to lowercase letters.
+    This is the inverse of string_as_numbers."""
+    number_bytes = array("B", numbers).tobytes()
+    invalid_numbers = number_bytes.translate(None, _LETTER_NUMBERS_RANGE)
+    if invalid_numbers:
+        raise ValueError(f"Invalid letter number given: {invalid_numbers[0]}\nLetter numbers must be between 1 and 26.")
+    return number_bytes.translate(_NUMBER_LETTERS).decode("ascii")
+
+
+def string_encode_as_bytes(input_string, encoding="utf-8", **kwargs):
+    if isinstance(input_string, str):
+        return input_string.encode(encoding, **kwargs)
+    else:
+        return input_string
+
+
+def bytes_decode_as_string(bytes_text, encoding="utf-8", **kwargs):
+    if isinstance(bytes_text, bytes):
+        return bytes_text.decode(encoding, **kwargs)
+    else:
+        return bytes_text
+
+
+def string_rotate(text, rot=13):
+    """Return the text (or bytes) converted using a Caesar cipher in which the text is rotated by the given amount.
+
+    See https://en.wikipedia.org/wiki/Caesar_cipher for more details."""
+    if isinstance(text, (bytes, bytearray)):
+        return text.translate(_rotation_table(rot % 26))
+    if isinstance(text, CodePoints):
+        if text.typecode == "B":
+            return CodePoints.from_codes(array("B", text.codes.tobytes().translate(_rotation_table(rot % 26))))
+        return CodePoints(str(text).translate(_rotation_table(rot % 26).decode("latin-1")))
+
+    return text.translate(_rotation_table(rot % 26).decode("latin-1"))
+
+
+@functools.lru_cache(maxsize=26)
+def _rotation_table(rot: int) -> bytes:
+    """Return a bytes.translate table which rotates each ascii letter by the given amount."""
+    # credit for the algorithm: https://github.com/python/cpython/blob/master/Lib/this.py
+    table = bytearray(range(256))
+    for c in (65, 97):
+        for i in range(26):
+            table[i + c] = (i + rot) % 26 + c
+    return bytes(table)
+
+
+# the relative frequency of each letter in English text (see https://en.wikipedia.org/wiki/Letter_frequency)
+ENGLISH_LETTER_FREQUENCIES = {
+    "a": 0.08167,
+    "b": 0.01492,
+    "c": 0.02782,
+    "d": 0.04253,
+    "e": 0.12702,
+    "f": 0.02228,
+    "g": 0.02015,
+    "h": 0.06094,
+    "i": 0.06966,
+    "j": 0.00153,
+    "k": 0.00772,
+    "l": 0.04025,
+    "m": 0.02406,
+    "n": 0.06749,
+    "o": 0.07507,
+    "p": 0.01929,
+    "q": 0.00095,
+    "r": 0.05987,
+    "s": 0.06327,
+    "t": 0.09056,
+    "u": 0.02758,
+    "v": 0.00978,
+    "w": 0.02360,
+    "x": 0.00150,
+    "y": 0.01974,
+    "z": 0.00074,
+}
+
+
+def _letter_histogram(text) -> List[int]:
+    """Count each ascii letter (ignoring case) in the text (or bytes)."""
+    # non-ascii characters are encoded as bytes which are not ascii, so they are never counted as letters
+    data = text.encode("utf-8", "surrogatepass") if isinstance(text, str) else bytes(text)
+    data = data.lower()
+    return [data.count(code) for code in range(ord("a"), ord("z") + 1)]
+
+
+def _rotation_candidates(histogram: List[int]) -> List[Tuple[int, float]]:
+    """Score each rotation of the text with the given letter histogram and rank them from the most to least likely."""
+    total = sum(histogram)
+    if not total:
+        return [(rot, 0.0) for rot in range(26)]
+
+    expected_counts = [total * frequency for frequency in ENGLISH_LETTER_FREQUENCIES.values()]
+    candidates = []
+    for rot in range(26):
+        # rotating the text by rot turns the letter at index i - rot into the letter at index i
+        rotated_histogram = histogram[-rot:] + histogram[:-rot] if rot else histogram
+        chi_squared = sum(
+            (count - expected) ** 2 / expected for count, expected in zip(rotated_histogram, expected_counts)
+        )
+        candidates.append((rot, chi_squared))
+    return sorted(candidates, key=lambda candidate: candidate[1])
+
+
+def string_rotate_crack(text: Union[str, bytes]) -> Tuple[Union[str, bytes], List[Tuple[int, float]]]:
+    """Find the rotation which most likely decrypts the text or bytes (which were encrypted using a Caesar cipher - see
+    string_rotate).
+
+    Return the text (or bytes) rotated by the most likely rotation and a list of each rotation and its score ranked from
+    the most to the least likely. The score is the chi-squared statistic of the letter frequencies of the rotated text
+    compared to English (so lower scores are more likely). The letters in the text are only counted once (the counts are
+    rotated to score each rotation) and the text is only rotated by the most likely rotation."""
+    candidates = _rotation_candidates(_letter_histogram(text))
+    return string_rotate(text, candidates[0][0]), candidates
+
+
+def string_rotate_crack_many(
+    texts: Iterable[Union[str, bytes]],
+) -> Iterator[Tuple[Union[str, bytes], List[Tuple[int, float]]]]:
+    """Find the rotation which most likely decrypts each of the texts (see string_rotate_crack)."""
+    for text in texts:
+        yield string_rotate_crack(text)
+
+
+LEET_SPEAK_CONVERSIONS = {"1": "i", "3": "e", "4": "a", "5": "s", "9": "g", "0": "o"}
+
+
+def leet_speak_to_text(leet_speak_text):
+    """."""
+    translated_text = ""
+
+    for char in leet_speak_text:
+        translated_text += LEET_SPEAK_CONVERSIONS.get(char, char)
+
+    return translated_text
+
+
+def text_to_leet_speak(text):
+    """."""
+    conversion_dict = dict_flip(LEET_SPEAK_CONVERSIONS)
+    conversion_dict = dict_delistify_values(conversion_dict)
+    translated_text = ""
+
+    for char in text:
+        translated_text += conversion_dict.get(char, char)
+
+    return translated_text
+
+
+def unicode_to_ascii(text: str):
+    """Convert the text to ascii."""
+    # credit to
+    # https://stackoverflow.com/questions/1207457/convert-a-unicode-string-to-a-string-in-python-containing-extra-symbols#1207479
+    # for this one
+    if text.isascii():
+        return text
+    # only the runs of non-ascii characters need to be converted and the conversion of each character does not depend
+    # on the characters around it, so we convert them using a table built one character at a time
+    ascii_string = _NON_ASCII_RUNS_REGEX.sub(_unicode_run_to_ascii, text)
+    return ascii_string
+
+
+def unicode_to_ascii_many(texts: Iterable[str]) -> Iterable[str]:
+    """Convert each of the texts to ascii."""
+    for text in texts:
+        yield unicode_to_ascii(text)
+
+
+def unicode_to_ascii_stream(stream, chunk_size: int = 2**20) -> Iterable[str]:
+    """Convert the text from the given stream (a text file object or an iterable of strings) to ascii chunk by chunk."""
+    if hasattr(stream, "read"):
+        stream = iter(functools.partial(stream.read, chunk_size), "")
+    # each character is converted independently, so it is safe to convert each chunk on its own
+    return unicode_to_ascii_many(stream)
+
+
+class _UnicodeToAsciiTable(dict):
+    """A str.translate table which converts each character to ascii the first time it is seen."""
+
+    def __missing__(self, code_point: int) -> str:
+        ascii_string = unicodedata.normalize("NFKD", chr(code_point)).encode("ascii", "ignore").decode("ascii")
+        self[code_point] = ascii_string
+        return ascii_string
+
+
+_UNICODE_TO_ASCII_TABLE = _UnicodeToAsciiTable()
+
+
+def _unicode_run_to_ascii(match: re.Match) -> str:
+    """Convert the run of non-ascii characters in the given match to ascii."""
+    return match.group().translate(_UNICODE_TO_ASCII_TABLE)
@@ -0,0 +1,114 @@
+import sys
+from array import array
+from typing import Iterator
+
+# the codecs whose encodings are the same as an array("B"), array("H"), or array("I") of the code points
+_UTF_16_CODEC = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
+_UTF_32_CODEC = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+_TYPECODE_CODECS = {"B": "latin-1", "H": _UTF_16_CODEC, "I": _UTF_32_CODEC}
+_TYPECODES = tuple(_TYPECODE_CODECS)
+
+
+class CodePoints:
+    """A string stored as a compact array of its code points.
+
+    Like the strings themselves (see PEP 393), the narrowest of an array("B") (for latin-1 strings), array("H") (for
+    strings in the basic multilingual plane), or array("I") is used. The character-wise functions (e.g. string_rotate,
+    string_reverse_case, xor, and hamming_distance) operate on the whole array at once when given CodePoints and return
+    CodePoints, so the string only needs to be converted back (using str) at the end. Iterating over (or indexing)
+    CodePoints gives its characters like a string does."""
+
+    __slots__ = ("codes",)
+
+    def __init__(self, string: str = ""):
+        if string.isascii():
+            typecode, data = "B", string.encode("ascii")
+        else:
+            try:
+                typecode, data = "B", string.encode("latin-1")
+            except UnicodeEncodeError:
+                typecode, data = "H", string.encode(_UTF_16_CODEC, "surrogatepass")
+                # characters outside of the basic multilingual plane are encoded as two utf-16 code units
+                if len(data) != 2 * len(string):
+                    typecode, data = "I", string.encode(_UTF_32_CODEC, "surrogatepass")
+        self.codes = array(typecode, data)
+
+    @classmethod
+    def from_codes(cls, codes: array) -> "CodePoints":
+        """Create CodePoints from an array("B"), array("H"), or array("I") of code points (without copying it)."""
+        if codes.typecode not in _TYPECODES:
+            message = f"Invalid array typecode given: {codes.typecode}\nAvailable typecodes are: {_TYPECODES}"
+            raise ValueError(message)
+
+        code_points = cls.__new__(cls)
+        code_points.codes = codes
+        return code_points
+
+    @property
+    def typecode(self) -> str:
+        return self.codes.typecode
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(chr, self.codes)
+
+    def __getitem__(self, index):
+        """Return the character at the given index (or CodePoints for a slice)."""
+        if isinstance(index, slice):
+            return CodePoints.from_codes(self.codes[index])
+        return chr(self.codes[index])
+
+    def __str__(self) -> str:
+        return self.codes.tobytes().decode(_TYPECODE_CODECS[self.typecode], "surrogatepass")
+
+    def __repr__(self) -> str:
+        return f"CodePoints({str(self)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CodePoints):
+            return NotImplemented
+        return self.codes == other.codes
+
+    def widened(self, typecode: str) -> array:
+        """Return the code points as an array with the given (equally wide or wider) typecode."""
+        if typecode == self.typecode:
+            return self.codes
+        return array(typecode, str(self).encode(_TYPECODE_CODECS[typecode], "surrogatepass"))
+
+    def numpy(self):
+        """Return the code points as a numpy array which shares memory with the code points (numpy is an optional
+        dependency)."""
+        import numpy
+
+        return numpy.frombuffer(self.codes, dtype=numpy.dtype(self.typecode))
+
+
+def _widest_typecode(*code_points: CodePoints) -> str:
+    return max((code_point.typecode for code_point in code_points), key=_TYPECODES.index)
+
+
+def _xor_codes(codes_1: array, codes_2: array) -> array:
+    """XOR each code in codes_1 with the corresponding code in codes_2 (which have the same typecode and length)."""
+    # the xor of the two (arbitrarily large) integers is the xor of each of their bytes
+    xored = int.from_bytes(codes_1.tobytes(), "little") ^ int.from_bytes(codes_2.tobytes(), "little")
+    return array(codes_1.typecode, xored.to_bytes(len(codes_1) * codes_1.itemsize, "little"))
+
+
+def _code_points_xor(message: CodePoints, key: CodePoints) -> CodePoints:
+    """XOR the message with the (repeated) key."""
+    if not len(key):
+        return CodePoints()
+
+    typecode = _widest_typecode(message, key)
+    key_codes = key.widened(typecode)
+    key_stream = key_codes * (len(message) // len(key_codes) + 1)
+    return CodePoints.from_codes(_xor_codes(message.widened(typecode), key_stream[: len(message)]))
+
+
+def _code_points_hamming_distance(code_points_1: CodePoints, code_points_2: CodePoints) -> int:
+    """Return the number of positions at which the code points differ."""
+    typecode = _widest_typecode(code_points_1, code_points_2)
+    xored = _xor_codes(code_points_1.widened(typecode), code_points_2.widened(typecode))
+    return len(xored) - xored.count(0)
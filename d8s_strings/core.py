@@ -0,0 +1,733 @@
+import codecs
+import functools
+import re
+import sys
+from array import array
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from d8s_lists import deduplicate, has_index, truthy_items
+
+from .casing import lowercase, string_split_on_uppercase
+from .codecs import string_encode_as_bytes
+
+# from textblob import TextBlob
+
+# pylint: disable=C0415
+
+# the number of characters read from stdin (or bytes read from a given stream) at a time
+TEXT_INPUT_CHUNK_SIZE = 2**20
+
+# TODO: add a function to get a substring between two given characters
+# TODO: write function to split a given string up into subparts of a given length
+
+
+def string_modify_line(input_string: str, modifying_func: Callable[[str], str], line_num: int) -> str:
+    """Apply the modifying_func on the input_string at the given line_num.
+
+    The lines are split using str.splitlines and joined back together with "\\n" (so other line endings and a trailing
+    newline are not kept). To modify many lines of the same text, use LineIndex.modify_lines (which does not split the
+    text on each call), but note that its line indexes start from 0 (rather than 1) and that it splits lines on "\\n"
+    only, so it keeps a "\\r" at the end of each line, the other line endings, and a trailing newline."""
+    if line_num < 1:
+        raise ValueError(
+            "Please provide a line_num >= 1. The line number is NOT zero indexed - so a line_num of one specifies the \
+                 first line of the text."
+        )
+
+    updated_line_num = line_num - 1
+
+    lines = input_string.splitlines()
+    lines[updated_line_num] = modifying_func(lines[updated_line_num])
+    return "\n".join(lines)
+
+
+def string_chars_at_start(string: str, chars: Iterable) -> Iterable[str]:
+    """."""
+    for char in string:
+        if char in chars:
+            yield char
+        else:
+            break
+
+
+def string_chars_at_start_len(string: str, chars: Iterable) -> int:
+    """."""
+    return len(list(string_chars_at_start(string, chars)))
+
+
+def a10n(string: str) -> str:
+    """."""
+    if len(string) <= 3:
+        return string
+
+    abbreviation = f"{string[0]}{len(string[1:-1])}{string[-1]}"
+    return abbreviation
+
+
+def string_remove_index(string: str, index: int) -> str:
+    """Remove the item from the string at the given index."""
+    # this raises an IndexError if the index is not in the string
+    index = range(len(string))[index]
+    return string[:index] + string[index + 1 :]
+
+
+def string_replace_index(string: str, index: int, replacement: str) -> str:
+    """Replace the character in the string at the given index with the replacement."""
+    # this raises an IndexError if the index is not in the string
+    index = range(len(string))[index]
+    return string[:index] + replacement + string[index + 1 :]
+
+
+# def _string_blobify(string: str) -> TextBlob:
+#     """Return a textblob for the given string."""
+#     return TextBlob(string)
+
+
+# def string_words(string: str) -> List[str]:
+#     blob = _string_blobify(string)
+#     return blob.words
+
+
+def string_is_palindrome(string: str) -> bool:
+    """Return whether or not the given string is a palindrome."""
+    is_palindrome = string == string_reverse(string)
+    return is_palindrome
+
+
+def string_reverse(string: str) -> str:
+    """Reverse the given string."""
+    return string[::-1]
+
+
+def string_left_pad(string, length: int, *, padding_characters=" "):
+    """Pad the string with padding_characters such that the resulting string is the given length.
+
+    Adapted from the javascript code here: https://www.theregister.co.uk/2016/03/23/npm_left_pad_chaos/."""
+    from d8s_math import number_evenly_divides
+
+    padding_length = length - len(string)
+    # pylint: disable=R1720
+    if padding_length and not number_evenly_divides(len(padding_characters), padding_length):
+        message = f"The length of the padding_characters ({len(padding_characters)}) must evenly divide the desired \
+            length of the final string ({length})."
+        raise ValueError(message)
+    else:
+        padding_length = int(padding_length / len(padding_characters))
+
+    left_padded_string = padding_characters * padding_length + string
+
+    return left_padded_string
+
+
+def string_to_bool(string: str) -> bool:
+    """."""
+    if lowercase(string) == "false":
+        return False
+    else:
+        return True
+
+
+def text_examples(n=10, *, seed: Optional[int] = None):
+    """Create n example texts.
+
+    If a seed is given, the texts are taken from the (much faster) reproducible corpus rather than hypothesis."""
+    if seed is not None:
+        from .corpus import corpus_texts
+
+        return corpus_texts(n, seed)
+
+    from d8s_hypothesis import hypothesis_get_strategy_results
+    from hypothesis.strategies import text
+
+    return hypothesis_get_strategy_results(text, n=n)
+
+
+def character_examples(n=10, *, seed: Optional[int] = None):
+    """Create n example characters.
+
+    If a seed is given, the characters are taken from the (much faster) reproducible corpus rather than hypothesis."""
+    if seed is not None:
+        from .corpus import corpus_characters
+
+        return corpus_characters(n, seed)
+
+    from d8s_hypothesis import hypothesis_get_strategy_results
+    from hypothesis.strategies import characters as chars
+
+    return hypothesis_get_strategy_results(chars, n=n)
+
+
+def text_abbreviate(text):
+    """Abbreviate the given text."""
+    if " " not in text:
+        # split the word based on uppercased characters
+        words = string_split_on_uppercase(text, include_uppercase_characters=True)
+    else:
+        words = text.split(" ")
+
+    first_letters_of_sufficiently_long_words = [word[0] for word in words if len(word) > 3]
+    return "".join(first_letters_of_sufficiently_long_words).upper()
+
+
+def text_input_is_yes(message):
+    """Get yes/no input from the user and return `True` if the input is yes and `False` if the input is no."""
+    message = text_ensure_ends_with(message.rstrip(".").rstrip("?"), " (y/n)")
+    result = input(message).strip()
+    return string_is_yes(result)
+
+
+def text_input_is_no(message):
+    """Get yes/no input from the user and return `True` if the input is no and `False` if the input is yes."""
+    message = text_ensure_ends_with(message.rstrip(".").rstrip("?"), " (y/n)")
+    result = input(message).strip()
+    return string_is_no(result)
+
+
+def string_is_yes(string):
+    """Check if a string is some form of `y` or `yes`."""
+    return bool(lowercase(string) == "y" or lowercase(string) == "yes")
+
+
+def string_is_no(string):
+    """Check if a string is some form of `n` or `no`."""
+    return lowercase(string) == "n" or lowercase(string) == "no"
+
+
+def text_join(join_character, *args):
+    """Join all of the arguments around the given join_character."""
+    sections_to_join = []
+
+    for arg in args:
+        sections_to_join.append(arg)
+
+    return join_character.join(sections_to_join)
+
+
+def string_insert(existing_string, new_string, index):
+    """Insert the new_string into the existing_string at the given index."""
+    first_section = existing_string[:index]
+    second_section = existing_string[index:]
+    complete_string = new_string.join([first_section, second_section])
+    return complete_string
+
+
+def string_add_to_start_of_each_line(string: str, string_to_add_to_each_line: str):
+    """Add the given string_to_add_to_each_line to the beginning of each line in the string."""
+    replacement = f"\n{string_to_add_to_each_line}"
+    string_with_added_value = re.sub("\n", replacement, string)
+    return string_with_added_value
+
+
+def characters(input_string):
+    """Return all of the characters in the given string."""
+    return tuple(input_string)
+
+
+def letter_frequency(letter, text):
+    """Find the frequency of the given letter in the given text."""
+    return text.count(letter) / len(text)
+
+
+def string_entropy(text, ignore_case=False):
+    """Find the shannon entropy of the text.
+
+    Inspired by the algorithm here:
+    https://web.archive.org/web/20160320142455/https://deadhacker.com/2007/05/13/finding-entropy-in-binary-files/
+
+    You can see more here: https://en.wikipedia.org/wiki/Entropy_(information_theory)"""
+    import math
+
+    if ignore_case:
+        text = text.lower()
+
+    character_code_set = deduplicate([ord(char) for char in text])
+
+    if not text:
+        return 0
+    entropy = 0
+    for char_code in character_code_set:
+        p_char = letter_frequency(chr(char_code), text)
+        if p_char > 0:
+            entropy += -p_char * math.log(p_char, 2)
+    return entropy
+
+
+def substrings(iterable):
+    """Find all substrings in the given string."""
+    import more_itertools
+
+    return more_itertools.substrings(iterable)
+
+
+def string_in_iterable_fuzzy(input_string, iterable):
+    """Find if the given input_string is in one of the strings in an iterable.
+
+    If you are searching the same iterable many times, create a ContainmentIndex from it and pass that as the iterable
+    so that the whole iterable is not scanned for each search."""
+    if isinstance(iterable, ContainmentIndex):
+        return input_string in iterable
+
+    for item in iterable:
+        if input_string in item:
+            return True
+    return False
+
+
+class ContainmentIndex:
+    """An index of strings which quickly finds the strings containing a given substring.
+
+    Each string is broken into trigrams (substrings of length three) and the index keeps a list of the strings in
+    which each trigram occurs. When searching for a substring, only the strings containing all of the substring's
+    trigrams are checked (substrings shorter than three characters are checked against every string). Strings can be
+    added to the index at any time and the index can be pickled to share it with other processes."""
+
+    def __init__(self, iterable: Iterable[str] = ()):
+        self.items: List[str] = []
+        self._postings: Dict[str, array] = {}
+        self.update(iterable)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, substring: str) -> bool:
+        return self.contains(substring)
+
+    def add(self, item: str):
+        """Add the given item to the index."""
+        item_index = len(self.items)
+        self.items.append(item)
+        for trigram in _trigrams(item):
+            postings = self._postings.get(trigram)
+            if postings is None:
+                postings = self._postings[trigram] = array("I")
+            postings.append(item_index)
+
+    def update(self, iterable: Iterable[str]):
+        """Add all of the items in the given iterable to the index."""
+        for item in iterable:
+            self.add(item)
+
+    def contains(self, substring: str) -> bool:
+        """Return whether or not the substring is in any of the indexed items."""
+        return any(True for _ in self.matches(substring))
+
+    def matches(self, substring: str) -> Iterable[str]:
+        """Yield every indexed item containing the substring (in the order in which the items were added)."""
+        if len(substring) < 3:
+            candidates: Iterable[int] = range(len(self.items))
+        else:
+            candidates = self._candidates(substring)
+
+        for item_index in candidates:
+            item = self.items[item_index]
+            if substring in item:
+                yield item
+
+    def _candidates(self, substring: str) -> List[int]:
+        """Return the indexes of the items which contain every trigram in the substring."""
+        postings = []
+        for trigram in _trigrams(substring):
+            trigram_postings = self._postings.get(trigram)
+            if trigram_postings is None:
+                return []
+            postings.append(trigram_postings)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for trigram_postings in postings[1:]:
+            # once there are only a few candidates, it is faster to check them directly than to keep intersecting
+            if len(candidates) <= 32:
+                break
+            candidates.intersection_update(trigram_postings)
+        return sorted(candidates)
+
+
+def _trigrams(string: str) -> set:
+    """Return the set of trigrams in the given string."""
+    return {string[index : index + 3] for index in range(len(string) - 2)}
+
+
+def string_find_between(input_string: str, start_string: str, end_string: str, *args, greedy: bool = True):
+    """Find the string in the input_string that is between the start_string and the end_string.
+
+    If greedy is False, the shortest string between the start_string and end_string is found."""
+    pattern = _string_find_between_pattern(start_string, end_string, greedy, *args)
+    match = pattern.search(input_string)
+    if match:
+        return match.group(1)
+    else:
+        return ""
+
+
+def string_find_between_iter(
+    input_string: str, start_string: str, end_string: str, flags=0, *, greedy: bool = False, spans: bool = False
+):
+    """Yield every string in the input_string that is between the start_string and the end_string.
+
+    Unlike string_find_between, the matching is not greedy by default. If spans is True, the (start, end) indexes of
+    each string in the input_string are yielded instead of the strings themselves."""
+    pattern = _string_find_between_pattern(start_string, end_string, greedy, flags)
+    for match in pattern.finditer(input_string):
+        if spans:
+            yield match.span(1)
+        else:
+            yield match.group(1)
+
+
+def string_find_between_stream(
+    stream, start_string, end_string, *, greedy: bool = False, spans: bool = False, chunk_size: int = 2**20
+):
+    """Yield every string between the start_string and the end_string in the given stream.
+
+    The stream can be a file object (in text or binary mode), in which case it is read chunk_size at a time, or a
+    str or bytes-like object (e.g. a mmap.mmap), in which case it is searched in place. If spans is True, the
+    (start, end) offsets from the start of the stream are yielded instead of the strings themselves.
+
+    The string between the delimiters never contains a newline (as with string_find_between), so when neither of the
+    delimiters contains a newline, only the part of the current line which can still contain a match is kept between
+    chunks: everything from the first start_string which has not been matched yet or, if there is none, the last
+    len(start_string) - 1 characters. A long line without a start_string is never held in memory, but a long match (or,
+    if greedy is True, the rest of the line after its start) is. When a delimiter contains a newline, matches can span
+    lines, so the text is kept until it reaches a newline which no match can cross (see _find_between_cut)."""
+    if not hasattr(stream, "read") or _is_mmap(stream):
+        if not isinstance(stream, str):
+            start_string, end_string = string_encode_as_bytes(start_string), string_encode_as_bytes(end_string)
+        yield from string_find_between_iter(stream, start_string, end_string, greedy=greedy, spans=spans)
+        return
+
+    pattern = None
+    # the kept part of the current line (which starts at offset in the stream) and whether or not it starts with a
+    # start_string which has not been matched yet
+    parts: list = []
+    offset = 0
+    pending = False
+    while True:
+        chunk = stream.read(chunk_size)
+        if pattern is None:
+            if isinstance(chunk, bytes):
+                start_string, end_string = string_encode_as_bytes(start_string), string_encode_as_bytes(end_string)
+            pattern = _string_find_between_pattern(start_string, end_string, greedy)
+            empty = chunk[:0]
+            newline = "\n" if isinstance(chunk, str) else b"\n"
+            if newline in start_string or newline in end_string:
+                yield from _find_between_multiline_stream(
+                    stream, chunk, pattern, start_string, end_string, spans, chunk_size
+                )
+                return
+
+        cut = chunk.rfind(newline) + 1
+        if cut or not chunk:
+            # the kept part of the line is complete (or we have reached the end of the stream) so it can be searched
+            parts.append(chunk[:cut])
+            buffer = empty.join(parts)
+            for match in pattern.finditer(buffer):
+                # an empty match at the end of the buffer is found again at the start of the next one
+                if match.start() < len(buffer) or not chunk:
+                    yield (offset + match.start(1), offset + match.end(1)) if spans else match.group(1)
+            if not chunk:
+                break
+            offset += len(buffer)
+            parts, pending, chunk = [], False, chunk[cut:]
+
+        if pending:
+            # an end_string may have been split between the previous chunk and this one
+            tail = parts[-1][max(len(parts[-1]) - len(end_string) + 1, 0) :]
+            if greedy or end_string not in tail + chunk:
+                # the pending start_string can not have been matched yet (or, if greedy is True, it can not be matched
+                # until the line ends)
+                parts.append(chunk)
+                continue
+        buffer = empty.join(parts) + chunk
+
+        # non-greedy matches in an unfinished line are final (but greedy matches can still be made longer)
+        match_end = 0
+        if not greedy:
+            for match in pattern.finditer(buffer):
+                if match.start() == len(buffer):
+                    break
+                yield (offset + match.start(1), offset + match.end(1)) if spans else match.group(1)
+                match_end = match.end()
+        keep = buffer.find(start_string, match_end)
+        pending = keep >= 0
+        if not pending:
+            keep = max(match_end, len(buffer) - len(start_string) + 1)
+        parts = [buffer[keep:]]
+        offset += keep
+
+
+def _find_between_multiline_stream(stream, chunk, pattern, start_string, end_string, spans: bool, chunk_size: int):
+    """Yield every match of the pattern in the stream (from the given first chunk on) when one of the delimiters
+    contains a newline (see string_find_between_stream)."""
+    buffer = chunk
+    # the text before this index in the buffer has already been checked for a cut
+    checked = 0
+    offset = 0
+    while True:
+        cut = _find_between_cut(buffer, start_string, end_string, checked) if chunk else len(buffer)
+        if cut:
+            for match in pattern.finditer(buffer, 0, cut):
+                yield (offset + match.start(1), offset + match.end(1)) if spans else match.group(1)
+            buffer = buffer[cut:]
+            offset += cut
+        if not chunk:
+            break
+
+        checked = len(buffer)
+        chunk = stream.read(chunk_size)
+        buffer += chunk
+
+
+def _find_between_cut(buffer, start_string, end_string, checked: int) -> int:
+    """Return the last index in the buffer at which no match between the start_string and the end_string can be split
+    (or 0 if there is none), only checking the indexes which could not be checked before the last checked characters
+    were added to the buffer.
+
+    The string between the delimiters never contains a newline, so no match can be split at an index just after a
+    newline (unless a start_string ends there) or just before a newline (unless an end_string starts there) as long as
+    neither of the delimiters is split by the index."""
+    newline = "\n" if isinstance(buffer, str) else b"\n"
+    longest = max(len(start_string), len(end_string), 1)
+    index = len(buffer)
+    while True:
+        index = buffer.rfind(newline, max(checked - longest - 1, 0), index)
+        if index < 0:
+            return 0
+
+        for cut in (index + 1, index):
+            if not cut or cut + longest > len(buffer):
+                # there is not enough text after the index to check it yet
+                continue
+            if any(
+                len(delimiter) > 1
+                and buffer.find(delimiter, max(cut - len(delimiter) + 1, 0), cut + len(delimiter) - 1) >= 0
+                for delimiter in (start_string, end_string)
+            ):
+                continue
+            if cut > index:
+                if not start_string or not buffer.endswith(start_string, 0, cut):
+                    return cut
+            elif not end_string or not buffer.startswith(end_string, cut):
+                return cut
+
+
+def _is_mmap(stream) -> bool:
+    """Return whether or not the given stream is a memory-mapped file."""
+    import mmap
+
+    return isinstance(stream, mmap.mmap)
+
+
+@functools.lru_cache(maxsize=256)
+def _string_find_between_pattern(start_string, end_string, greedy: bool = True, flags=0):
+    """Return a compiled regex matching anything between the start_string and end_string (which may be str or bytes)."""
+    group = "(.*)" if greedy else "(.*?)"
+    if isinstance(start_string, bytes):
+        regex = re.escape(start_string) + group.encode() + re.escape(end_string)
+    else:
+        regex = re.escape(start_string) + group + re.escape(end_string)
+    return re.compile(regex, flags)
+
+
+def switch(a, b, text):
+    """Switch a and b in the text."""
+    from d8s_uuids import uuid4
+
+    a_replacement = str(uuid4())
+    b_replacement = str(uuid4())
+
+    text = text.replace(a, a_replacement)
+    text = text.replace(b, b_replacement)
+
+    text = text.replace(a_replacement, b)
+    text = text.replace(b_replacement, a)
+
+    return text
+
+
+def string_shorten(input_string, length, suffix="..."):
+    """Shorten the given input_string to the given length."""
+    if len(input_string) > length:
+        return "{}{}".format(input_string[: length - len(suffix)], suffix)
+    else:
+        return input_string
+
+
+def string_split_without_empty(input_string, split_char):
+    """Split a input_string on split_char and remove empty entries."""
+    return truthy_items(input_string.split(split_char))
+
+
+def string_has_index(string: str, index: Union[str, int]) -> bool:
+    """."""
+    string_characters = characters(string)
+    index = int(index)
+    return has_index(string_characters, index)
+
+
+def string_split_multiple(string, *splitting_characters):
+    """Split a string up based on multiple splitting_characters."""
+    split_strings = []
+
+    if splitting_characters:
+        # split the string based on the first character we are splitting on
+        first_splitting_character = splitting_characters[0]
+        split_string = string.split(first_splitting_character)
+
+        # record the other splitting characters
+        other_splitting_characters = splitting_characters[1:]
+
+        # split each substring based on the other_splitting_characters and record the results
+        for substring in split_string:
+            split_strings.extend(string_split_multiple(substring, *other_splitting_characters))
+    else:
+        # if there are no more characters to split on, record the string - we're done!
+        split_strings.append(string)
+    return split_strings
+
+
+def text_vowels(text):
+    """Return all of the vowels in the text."""
+    vowels = []
+    for character in text:
+        if character in "aeiou":
+            vowels.append(character)
+    return vowels
+
+
+def text_vowel_count(text):
+    """Count the number of vowels in the text."""
+    vowels = text_vowels(text)
+    return len(vowels)
+
+
+def text_consonants(text):
+    """Return all of the consonants in the text."""
+    consonants = []
+    for character in text:
+        if character not in "aeiou":
+            consonants.append(character)
+    return consonants
+
+
+def text_consonant_count(text):
+    """Count the number of consonants in the text."""
+    consonants = text_consonants(text)
+    return len(consonants)
+
+
+def text_input(message="Enter/Paste your content."):
+    """."""
+    # TODO: multiline support is nice, but it breaks jupyter notebooks
+    print("{} (<NEWLINE> + Ctrl-D or Ctrl-Z ( windows ) to save it)".format(message))
+    if sys.stdin.isatty():
+        return "\n".join(_interactive_lines())
+
+    # when the input is piped in, read it all at once (rather than line by line) and join the lines as above
+    text = "".join(text_input_chunks()).replace("\r\n", "\n")
+    return text[:-1] if text.endswith("\n") else text
+
+
+def text_input_chunks(
+    chunk_size: int = TEXT_INPUT_CHUNK_SIZE,
+    *,
+    stream: Optional[BinaryIO] = None,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+) -> Iterator[str]:
+    """Yield the text from stdin (or the given binary stream) in chunks as it is read.
+
+    Stdin is read up to chunk_size characters at a time (so the text which has already been read from it, e.g. by
+    input(), is not skipped). The given stream is read up to chunk_size bytes at a time and decoded incrementally (so
+    multi-byte characters split across reads are decoded correctly) using the given encoding and errors. When stdin is
+    an interactive terminal, each line is yielded as it is entered."""
+    if stream is None:
+        if sys.stdin.isatty():
+            for line in _interactive_lines():
+                yield line + "\n"
+            return
+        yield from iter(functools.partial(sys.stdin.read, chunk_size), "")
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    # read1 returns whatever is available (up to chunk_size) rather than waiting for chunk_size bytes
+    read = getattr(stream, "read1", stream.read)
+    while True:
+        data = read(chunk_size)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def text_input_lines(
+    chunk_size: int = TEXT_INPUT_CHUNK_SIZE,
+    *,
+    stream: Optional[BinaryIO] = None,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+) -> Iterator[str]:
+    """Yield each line (without its line ending) from stdin (or the given binary stream) as it is read.
+
+    See text_input_chunks for how the input is read."""
+    if stream is None and sys.stdin.isatty():
+        yield from _interactive_lines()
+        return
+
+    # the start of a line which has not been ended in the chunks read so far
+    line_parts: List[str] = []
+    for chunk in text_input_chunks(chunk_size, stream=stream, encoding=encoding, errors=errors):
+        if "\n" not in chunk:
+            line_parts.append(chunk)
+            continue
+
+        lines = chunk.split("\n")
+        if line_parts:
+            line_parts.append(lines[0])
+            lines[0] = "".join(line_parts)
+        line_parts = [lines.pop()]
+        if "\r" in chunk or lines[0].endswith("\r"):
+            lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+        yield from lines
+
+    last_line = "".join(line_parts)
+    if last_line:
+        yield last_line[:-1] if last_line.endswith("\r") else last_line
+
+
+def _interactive_lines() -> Iterator[str]:
+    """Yield each line entered in the terminal until the end of the input."""
+    while True:
+        try:
+            yield input()
+        except EOFError:
+            break
+
+
+def text_ensure_starts_with(text: str, prefix: str):
+    """Make sure the given text starts with the given prefix."""
+    if text.startswith(prefix):
+        return text
+    else:
+        return "{}{}".format(prefix, text)
+
+
+def text_ensure_ends_with(text: str, suffix: str):
+    """Make sure the given text ends with the given suffix."""
+    if text.endswith(suffix):
+        return text
+    else:
+        return "{}{}".format(text, suffix)
+
+
+# def text_is_english_sentence(text: str) -> bool:
+#     """Determine whether or not the sentence is likely English."""
+#     language_detection_data = text_languages(text)
+
+#     if language_detection_data[0]['language'] == 'en' and language_detection_data[0]['probability'] >= 0.5:
+#         return True
+
+#     return False
@@ -0,0 +1,211 @@
+import functools
+import mmap
+import os
+import pathlib
+import random
+import string as string_module
+import unicodedata
+from typing import Callable, Dict, List, Tuple
+
+# increment this whenever the generated corpora change so that outdated cached corpora are not used
+CORPUS_VERSION = 1
+CORPUS_CACHE_ENVIRONMENT_VARIABLE = "D8S_STRINGS_CACHE_DIR"
+
+CORPUS_WORDS = (
+    "the quick brown fox jumps over the lazy dog and a zebra with an acronym like HTTP or JSON "
+    "naïve café résumé straße İstanbul ǅemal ﬁle ｗｉｄｅ Ωmega δέλτα привет 東京 서울 مرحبا"
+).split()
+# the unicode categories which characters are sampled from (surrogates, private use, and unassigned code points are
+# left out because they cannot be encoded or have no meaning)
+UNICODE_CATEGORIES = "Lu Ll Lt Lm Lo Mn Mc Me Nd Nl No Pc Pd Ps Pe Pi Pf Po Sm Sc Sk So Zs Zl Zp Cc Cf".split()
+_EMOJI = ("😀", "👍🏽", "👩‍💻", "👨‍👩‍👧‍👦", "🇳🇿", "❤️", "🏳️‍🌈", "1️⃣")
+_WHITESPACE = (" ", "  ", "\t", " ", "　", "\r\n", "\n\n", " ", " \t ")
+_REGEX_METACHARACTERS = ".^$*+?{}[]\\|()"
+
+
+def corpus_text(size: int, seed: int = 0, *, cache: bool = True) -> str:
+    """Return a reproducible text of the given size (in characters) generated from the seed.
+
+    The text mixes words with varied casing, identifiers, numbers, characters from every unicode category, combining
+    sequences, emoji, unusual whitespace, long lines, and inputs which are adversarial for regexes. If cache is True,
+    the text is read from (or written to) the corpus cache directory."""
+    if not cache:
+        return _generate(random.Random(seed), size)
+
+    return corpus_file(size, seed).read_bytes().decode("utf-8")
+
+
+def corpus_file(size: int, seed: int = 0) -> pathlib.Path:
+    """Return the path to the utf-8 encoded file containing corpus_text(size, seed), creating it if needed."""
+    file_path = corpus_cache_directory() / (
+        f"corpus-v{CORPUS_VERSION}-unicode{unicodedata.unidata_version}-seed{seed}-{size}.txt"
+    )
+    if not file_path.exists():
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so other processes never read a partially written corpus
+        temporary_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+        temporary_path.write_bytes(_generate(random.Random(seed), size).encode("utf-8"))
+        os.replace(temporary_path, file_path)
+    return file_path
+
+
+def corpus_mmap(size: int, seed: int = 0) -> mmap.mmap:
+    """Return a read-only memory map of the utf-8 encoded file containing corpus_text(size, seed)."""
+    with open(corpus_file(size, seed), "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def corpus_texts(n: int, seed: int = 0, *, max_size: int = 100) -> List[str]:
+    """Return n reproducible texts (each of a random size up to max_size) generated from the seed."""
+    rng = random.Random(seed)
+    return [_generate(rng, rng.randint(0, max_size)) for _ in range(n)]
+
+
+def corpus_characters(n: int, seed: int = 0) -> List[str]:
+    """Return n reproducible characters (half ascii and half from every other unicode category) from the seed."""
+    rng = random.Random(seed)
+    return [_character(rng) for _ in range(n)]
+
+
+def corpus_cache_directory() -> pathlib.Path:
+    """Return the directory in which generated corpora are cached."""
+    directory = os.environ.get(CORPUS_CACHE_ENVIRONMENT_VARIABLE)
+    if not directory:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(cache_home, "d8s_strings")
+    return pathlib.Path(directory)
+
+
+@functools.lru_cache(maxsize=None)
+def _category_characters() -> Dict[str, Tuple[str, ...]]:
+    """Return the characters in the first two unicode planes grouped by their unicode category."""
+    characters: Dict[str, List[str]] = {category: [] for category in UNICODE_CATEGORIES}
+    for code_point in range(0x20000):
+        character = chr(code_point)
+        category_characters = characters.get(unicodedata.category(character))
+        if category_characters is not None:
+            category_characters.append(character)
+    return {category: tuple(category_characters) for category, category_characters in characters.items()}
+
+
+def _character(rng: random.Random) -> str:
+    """Return a random character."""
+    if rng.random() < 0.5:
+        return rng.choice(string_module.printable)
+    return rng.choice(_category_characters()[rng.choice(UNICODE_CATEGORIES)])
+
+
+def _cased(rng: random.Random, word: str) -> str:
+    """Return the word with a random casing."""
+    casing = rng.random()
+    if casing < 0.6:
+        return word
+    elif casing < 0.75:
+        return word.title()
+    elif casing < 0.85:
+        return word.upper()
+    return "".join(rng.choice((char.lower(), char.upper())) for char in word)
+
+
+def _words_segment(rng: random.Random) -> str:
+    words = [_cased(rng, rng.choice(CORPUS_WORDS)) for _ in range(rng.randint(3, 15))]
+    return " ".join(words) + rng.choice((". ", ", ", "; ", "! ", "? ", "\n", " "))
+
+
+def _identifier_segment(rng: random.Random) -> str:
+    words = [rng.choice(CORPUS_WORDS[:20]) for _ in range(rng.randint(2, 4))]
+    style = rng.randrange(5)
+    if style == 0:
+        identifier = words[0] + "".join(word.title() for word in words[1:])
+    elif style == 1:
+        identifier = "".join(word.title() for word in words)
+    elif style == 2:
+        identifier = "_".join(words)
+    elif style == 3:
+        identifier = "-".join(words)
+    else:
+        identifier = "".join(word.upper() for word in words[:-1]) + words[-1].title()
+    return identifier + " "
+
+
+def _number_segment(rng: random.Random) -> str:
+    kind = rng.randrange(4)
+    if kind == 0:
+        number = str(rng.randint(0, 1000))
+    elif kind == 1:
+        number = f"{rng.uniform(-1000, 1000):.3f}"
+    elif kind == 2:
+        number = "".join(rng.choice(string_module.digits) for _ in range(rng.randint(20, 100)))
+    else:
+        number = f"{rng.randint(0, 255):#x}"
+    return number + " "
+
+
+def _unicode_segment(rng: random.Random) -> str:
+    category_characters = _category_characters()[rng.choice(UNICODE_CATEGORIES)]
+    return "".join(rng.choice(category_characters) for _ in range(rng.randint(1, 20))) + " "
+
+
+def _combining_segment(rng: random.Random) -> str:
+    marks = _category_characters()["Mn"]
+    base = rng.choice(string_module.ascii_letters)
+    return base + "".join(rng.choice(marks) for _ in range(rng.randint(1, 5))) + " "
+
+
+def _emoji_segment(rng: random.Random) -> str:
+    return "".join(rng.choice(_EMOJI) for _ in range(rng.randint(1, 5))) + " "
+
+
+def _whitespace_segment(rng: random.Random) -> str:
+    return "".join(rng.choice(_WHITESPACE) for _ in range(rng.randint(1, 5)))
+
+
+def _long_line_segment(rng: random.Random) -> str:
+    return " ".join(rng.choice(CORPUS_WORDS) for _ in range(rng.randint(200, 4000))) + "\n"
+
+
+def _adversarial_segment(rng: random.Random) -> str:
+    length = rng.randint(10, 1000)
+    kind = rng.randrange(6)
+    if kind == 0:
+        # long runs of spaces without the end of the pattern being matched
+        return "x" + " " * length + "x"
+    elif kind == 1:
+        # unbalanced delimiters
+        return rng.choice(("<", "(", "[", "{", '"')) * length
+    elif kind == 2:
+        return "".join(rng.choice(_REGEX_METACHARACTERS) for _ in range(length))
+    elif kind == 3:
+        # repeated characters which can cause backtracking
+        return "a" * length + "!"
+    elif kind == 4:
+        return "".join(chr(rng.randrange(0x20)) for _ in range(rng.randint(1, 10)))
+    return "foo" + "o" * length + "bar" * rng.randint(1, 10)
+
+
+# the segments which generated texts are made of and their relative frequencies
+_SEGMENT_WEIGHTS: Dict[Callable[[random.Random], str], int] = {
+    _words_segment: 40,
+    _identifier_segment: 10,
+    _number_segment: 8,
+    _unicode_segment: 10,
+    _combining_segment: 4,
+    _emoji_segment: 4,
+    _whitespace_segment: 8,
+    _long_line_segment: 1,
+    _adversarial_segment: 6,
+}
+
+
+def _generate(rng: random.Random, size: int) -> str:
+    """Generate a text of the given size."""
+    segment_functions = list(_SEGMENT_WEIGHTS)
+    weights = list(_SEGMENT_WEIGHTS.values())
+    segments = []
+    generated_size = 0
+    while generated_size < size:
+        segment_function = rng.choices(segment_functions, weights)[0]
+        segment = segment_function(rng)
+        segments.append(segment)
+        generated_size += len(segment)
+    return "".join(segments)[:size]
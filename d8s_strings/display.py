@@ -0,0 +1,259 @@
+import re
+import unicodedata
+from typing import IO, Iterable, Iterator, List, Sequence, Tuple, Union
+
+ALIGNMENTS = ("left", "right", "center")
+
+
+class _DisplayWidthTable(dict):
+    """A table of the display width of each character which is filled in the first time each character is seen."""
+
+    def __missing__(self, character: str) -> int:
+        width = _character_display_width(character)
+        self[character] = width
+        return width
+
+
+def _character_display_width(character: str) -> int:
+    """Find the number of terminal columns the given character occupies."""
+    category = unicodedata.category(character)
+    # combining marks, format characters (e.g. zero width joiners), and control characters take up no space (as do the
+    # hangul jamo medial vowels and final consonants which combine with the preceding character)
+    if category in ("Mn", "Me", "Cf", "Cc") or "ᅠ" <= character <= "ᇿ":
+        return 0
+    elif unicodedata.east_asian_width(character) in ("W", "F"):
+        return 2
+    return 1
+
+
+_DISPLAY_WIDTHS = _DisplayWidthTable()
+
+
+def character_display_width(character: str) -> int:
+    """Return the number of terminal columns the given character occupies (0, 1, or 2)."""
+    return _DISPLAY_WIDTHS[character]
+
+
+def string_display_width(string: str) -> int:
+    """Return the number of terminal columns the given string occupies.
+
+    East Asian wide and full-width characters occupy two columns while combining marks and control characters occupy
+    none."""
+    if string.isascii() and string.isprintable():
+        return len(string)
+    return sum(map(_DISPLAY_WIDTHS.__getitem__, string))
+
+
+# the grapheme cluster break properties which are used to avoid splitting a character from the marks, modifiers, and
+# joined characters which follow it
+_OTHER, _EXTEND, _ZERO_WIDTH_JOINER, _REGIONAL_INDICATOR = range(4)
+
+
+class _GraphemeBreakTable(dict):
+    """A table of the grapheme cluster break property of each character which is filled in the first time each
+    character is seen."""
+
+    def __missing__(self, character: str) -> int:
+        grapheme_break = _character_grapheme_break(character)
+        self[character] = grapheme_break
+        return grapheme_break
+
+
+def _character_grapheme_break(character: str) -> int:
+    """Find the grapheme cluster break property of the given character."""
+    if character == "\u200d":
+        return _ZERO_WIDTH_JOINER
+    elif "\U0001f1e6" <= character <= "\U0001f1ff":
+        return _REGIONAL_INDICATOR
+    elif (
+        unicodedata.category(character) in ("Mn", "Me", "Mc")
+        # variation selectors, emoji skin tone modifiers, and emoji tag characters
+        or "\ufe00" <= character <= "\ufe0f"
+        or "\U0001f3fb" <= character <= "\U0001f3ff"
+        or "\U000e0020" <= character <= "\U000e007f"
+    ):
+        return _EXTEND
+    return _OTHER
+
+
+_GRAPHEME_BREAKS = _GraphemeBreakTable()
+
+
+# printable characters before the combining diacritical marks block (i.e. ascii and latin characters) always occupy
+# one column and are never joined to the characters around them
+_NON_LATIN_CHARACTER_REGEX = re.compile("[^\\x00-\\u02ff]")
+
+
+def _continues_grapheme(string: str, index: int) -> bool:
+    """Return whether or not the character at the index is part of the same grapheme cluster as the one before it."""
+    if index == 0:
+        return False
+
+    grapheme_break = _GRAPHEME_BREAKS[string[index]]
+    if grapheme_break in (_EXTEND, _ZERO_WIDTH_JOINER) or _GRAPHEME_BREAKS[string[index - 1]] == _ZERO_WIDTH_JOINER:
+        return True
+    elif grapheme_break == _REGIONAL_INDICATOR:
+        # regional indicators (which make up flags) are paired up from the start of each run of them
+        preceding_count = 0
+        while index - preceding_count > 0 and _GRAPHEME_BREAKS[string[index - preceding_count - 1]] == grapheme_break:
+            preceding_count += 1
+        return preceding_count % 2 == 1
+    return string[index] == "\n" and string[index - 1] == "\r"
+
+
+def string_graphemes(string: str) -> List[str]:
+    """Split the string into grapheme clusters (user-perceived characters).
+
+    This handles combining marks, variation selectors, emoji modifiers and zero width joiner sequences, flags, and
+    CRLF line endings (but not the full set of rules in Unicode Standard Annex #29)."""
+    if string.isascii() and "\r\n" not in string:
+        return list(string)
+
+    graphemes = []
+    start = 0
+    for index in range(1, len(string)):
+        if not _continues_grapheme(string, index):
+            graphemes.append(string[start:index])
+            start = index
+    if string:
+        graphemes.append(string[start:])
+    return graphemes
+
+
+def _shortened(string: str, available_width: int, suffix: str) -> str:
+    """Shorten the string to the last grapheme cluster which ends within the available width and add the suffix."""
+    total_width = 0
+    cut_index = len(string)
+    for index, character in enumerate(string):
+        total_width += _DISPLAY_WIDTHS[character]
+        if total_width > available_width:
+            cut_index = index
+            break
+    # move back to the start of the grapheme cluster the first character which did not fit is part of
+    while _continues_grapheme(string, cut_index):
+        cut_index -= 1
+    return string[:cut_index] + suffix
+
+
+def string_shorten_to_width(input_string: str, width: int, suffix: str = "...") -> str:
+    """Shorten the given input_string so that it occupies at most the given number of terminal columns.
+
+    Unlike string_shorten, the width is measured in display columns (see string_display_width) and grapheme clusters
+    (e.g. a letter and its combining marks or an emoji sequence) are never split. If the suffix itself is wider than
+    the width, the input_string is shortened without it."""
+    return next(string_shorten_to_width_many((input_string,), width, suffix))
+
+
+def string_shorten_to_width_many(input_strings: Iterable[str], width: int, suffix: str = "...") -> Iterator[str]:
+    """Shorten each of the input_strings so that it occupies at most the given number of terminal columns (see
+    string_shorten_to_width)."""
+    suffix_width = string_display_width(suffix)
+    if suffix_width > width:
+        suffix, suffix_width = "", 0
+    available_width = width - suffix_width
+
+    for input_string in input_strings:
+        # most strings (e.g. ascii and accented latin text) can be measured using len and shortened by slicing
+        if input_string.isprintable() and (
+            input_string.isascii() or not _NON_LATIN_CHARACTER_REGEX.search(input_string)
+        ):
+            yield input_string if len(input_string) <= width else input_string[:available_width] + suffix
+        elif sum(map(_DISPLAY_WIDTHS.__getitem__, input_string)) <= width:
+            yield input_string
+        else:
+            yield _shortened(input_string, available_width, suffix)
+
+
+def _validate_alignment(alignment: str):
+    if alignment not in ALIGNMENTS:
+        message = f"Invalid alignment given: {alignment}\nAvailable alignments are: {ALIGNMENTS}"
+        raise ValueError(message)
+
+
+def _padded(string: str, string_width: int, width: int, alignment: str, fill: str) -> str:
+    """Pad the string (which occupies string_width columns) to the given width."""
+    padding_width = width - string_width
+    if padding_width <= 0:
+        return string
+    elif alignment == "left":
+        return string + fill * padding_width
+    elif alignment == "right":
+        return fill * padding_width + string
+    left_padding_width = padding_width // 2
+    return fill * left_padding_width + string + fill * (padding_width - left_padding_width)
+
+
+def string_pad(string: str, width: int, *, alignment: str = "left", fill: str = " ") -> str:
+    """Pad the string with the fill character such that it occupies the given number of terminal columns.
+
+    Unlike string_left_pad, the width is measured in display columns (see string_display_width) and the string can be
+    aligned to the left, right, or center. Strings which are already wider than the width are returned unchanged."""
+    _validate_alignment(alignment)
+    return _padded(string, string_display_width(string), width, alignment, fill)
+
+
+def _measured_rows(rows: Iterable[Iterable]) -> Tuple[List[Tuple[List[str], List[int]]], List[int]]:
+    """Convert each cell in the rows to a string and find its display width along with the width of each column."""
+    measured_rows = []
+    column_widths: List[int] = []
+    for row in rows:
+        cells = [cell if isinstance(cell, str) else str(cell) for cell in row]
+        cell_widths = [string_display_width(cell) for cell in cells]
+        for index, cell_width in enumerate(cell_widths):
+            if index == len(column_widths):
+                column_widths.append(cell_width)
+            elif cell_width > column_widths[index]:
+                column_widths[index] = cell_width
+        measured_rows.append((cells, cell_widths))
+    return measured_rows, column_widths
+
+
+def text_column_widths(rows: Iterable[Iterable]) -> List[int]:
+    """Return the display width of each column (the width of the widest cell in it) in the given rows."""
+    return _measured_rows(rows)[1]
+
+
+def text_columns_format(
+    rows: Iterable[Iterable], *, alignment: Union[str, Sequence[str]] = "left", separator: str = " ", fill: str = " "
+) -> Iterator[str]:
+    """Yield each of the rows as a line of fixed-width columns.
+
+    The column widths are found in one pass over the rows (each cell is converted to a string and measured only once).
+    The alignment can be given for all columns or as a sequence with one alignment per column. Rows with fewer cells
+    than there are columns are padded with empty cells."""
+    measured_rows, column_widths = _measured_rows(rows)
+
+    alignments = [alignment] * len(column_widths) if isinstance(alignment, str) else list(alignment)
+    if len(alignments) < len(column_widths):
+        alignments.extend(["left"] * (len(column_widths) - len(alignments)))
+    for column_alignment in alignments:
+        _validate_alignment(column_alignment)
+
+    empty_cells = [fill * column_width for column_width in column_widths]
+    for cells, cell_widths in measured_rows:
+        padded_cells = [
+            _padded(cell, cell_width, column_width, column_alignment, fill)
+            for cell, cell_width, column_width, column_alignment in zip(cells, cell_widths, column_widths, alignments)
+        ]
+        padded_cells.extend(empty_cells[len(cells) :])
+        yield separator.join(padded_cells)
+
+
+def text_columns_write(
+    rows: Iterable[Iterable],
+    stream: IO[str],
+    *,
+    alignment: Union[str, Sequence[str]] = "left",
+    separator: str = " ",
+    fill: str = " ",
+) -> int:
+    """Write each of the rows to the stream as a line of fixed-width columns (see text_columns_format).
+
+    The lines are written as they are formatted rather than being joined into one string. Return the number of lines
+    written."""
+    line_count = 0
+    for line in text_columns_format(rows, alignment=alignment, separator=separator, fill=fill):
+        stream.write(line)
+        stream.write("\n")
+        line_count += 1
+    return line_count
@@ -0,0 +1,111 @@
+from .casing import camel_case, kebab_case, lowercase, pascal_case, snake_case, titlecase, uppercase
+
+
+def indefinite_article(word):
+    """Return the word with the appropriate indefinite article."""
+    inflect_engine = _inflect_engine()
+    return inflect_engine.a(word).split(" ")[0]
+
+
+def is_plural(possible_plural: str) -> bool:
+    """Return whether or not the possible_plural is plural."""
+    plural = False
+    inflect_engine = _inflect_engine()
+    pluralized_word = inflect_engine.plural(possible_plural)
+    # for possible results from inflect_engine.compare, see https://github.com/jazzband/inflect/blob/master/inflect.py
+    result = str(inflect_engine.compare(possible_plural, pluralized_word))
+    if ":" in result:
+        first_char = result.split(":")[0]
+        if first_char == "p":
+            plural = True
+    return plural
+
+
+def pluralize(word: str) -> str:
+    """Make the word plural."""
+    inflect_engine = _inflect_engine()
+    if is_plural(word):
+        return word
+    else:
+        return inflect_engine.plural(word)
+
+
+def is_singular(possible_singular: str) -> bool:
+    """Return whether or not the possible_singular is singular."""
+    # this is a repetition of the code from the is_plural function and does not simply return `not is_plural` because...
+    # there are many different responses possible from inflect_engine.compare and there are cases where
+    # inflect_engine.compare... cannot compare the two words
+    singular = False
+    inflect_engine = _inflect_engine()
+    pluralized_word = inflect_engine.plural(possible_singular)
+    # for possible results from inflect_engine.compare, see https://github.com/jazzband/inflect/blob/master/inflect.py
+    result = str(inflect_engine.compare(possible_singular, pluralized_word))
+    if ":" in result:
+        first_char = result.split(":")[0]
+        if first_char == "s":
+            singular = True
+    return singular
+
+
+def singularize(word: str) -> str:
+    """Make the word singular."""
+    inflect_engine = _inflect_engine()
+    if is_singular(word):
+        return word
+    else:
+        return str(inflect_engine.singular_noun(word))
+
+
+def cardinalize(word: str, count: int) -> str:
+    """Return the appropriate form of the given word for the count."""
+    inflect_engine = _inflect_engine()
+    if is_singular(word):
+        # if the word is singular and the count is one, we can return the word
+        if count == 1:
+            return word
+        word = pluralize(word)
+    # I know this is using the singular_noun function, but it will return either singular or plural nouns
+    # based on the count argument
+    return str(inflect_engine.singular_noun(word, count=count))
+
+
+def ordinalize(number: int) -> str:
+    """Return the appropriate form for the ordinal form of the given number."""
+    inflect_engine = _inflect_engine()
+    return inflect_engine.ordinal(number)
+
+
+def string_forms(text):
+    """Return multiple forms for the given text."""
+    # it is important to lowercase the text before we start so that we can avoid problems when making the text plural
+    text = lowercase(text)
+
+    forms = {
+        "lowercase": lowercase(text),
+        "titlecase": titlecase(text),
+        "uppercase": uppercase(text),
+        "lowercasePlural": lowercase(pluralize(text)),
+        "titlecasePlural": titlecase(pluralize(text)),
+        "uppercasePlural": uppercase(pluralize(text)),
+        "kebab_case": kebab_case(text),
+        "kebab_casePlural": kebab_case(pluralize(text)),
+        "snake_case": snake_case(text),
+        "snake_casePlural": snake_case(pluralize(text)),
+        "camel_case": camel_case(text),
+        "camel_casePlural": camel_case(pluralize(text)),
+        "pascal_case": pascal_case(text),
+        "pascal_casePlural": pascal_case(pluralize(text)),
+        "lowercaseIndefiniteArticle": lowercase(indefinite_article(text)),
+        "titlecaseIndefiniteArticle": titlecase(indefinite_article(text)),
+        "uppercaseIndefiniteArticle": uppercase(indefinite_article(text)),
+    }
+
+    return forms
+
+
+def _inflect_engine():
+    """Return an inflect engine."""
+    import inflect
+
+    p = inflect.engine()
+    return p
@@ -0,0 +1,298 @@
+import bisect
+import contextlib
+import contextvars
+import functools
+import inspect
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+INSTRUMENTATION_ENVIRONMENT_VARIABLE = "D8S_STRINGS_INSTRUMENTATION"
+# the upper bounds of the latency histogram buckets (from 100ns to 5s) and input size histogram buckets
+LATENCY_BUCKETS = tuple(float(f"{multiplier}e{exponent}") for exponent in range(-7, 1) for multiplier in (1, 2, 5))
+INPUT_SIZE_BUCKETS = tuple(10**exponent for exponent in range(10))
+PERCENTILES = (50, 90, 99)
+
+
+class FunctionStats:
+    """Statistics about the calls to one function."""
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.input_size_counts = [0] * (len(INPUT_SIZE_BUCKETS) + 1)
+
+    def record(self, seconds: float, input_size: Optional[int]):
+        """Record a call which took the given number of seconds with an input of the given size."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.latency_counts[_bucket_index(LATENCY_BUCKETS, seconds)] += 1
+        if input_size is not None:
+            self.input_size_counts[_bucket_index(INPUT_SIZE_BUCKETS, input_size)] += 1
+
+    def percentile(self, percentile: float) -> float:
+        """Estimate the latency (in seconds) at the given percentile."""
+        if not self.calls:
+            return 0.0
+
+        rank = self.calls * percentile / 100
+        cumulative_count = 0
+        for index, count in enumerate(self.latency_counts):
+            if count and cumulative_count + count >= rank:
+                lower_bound = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper_bound = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else lower_bound
+                # assume the latencies are spread evenly across the bucket
+                return lower_bound + (upper_bound - lower_bound) * (rank - cumulative_count) / count
+            cumulative_count += count
+        return LATENCY_BUCKETS[-1]  # pragma: no cover
+
+    def as_dict(self) -> dict:
+        """Return the statistics as a dictionary."""
+        stats = {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+        }
+        for percentile in PERCENTILES:
+            stats[f"p{percentile}_seconds"] = self.percentile(percentile)
+        stats["input_sizes"] = {
+            str(upper_bound): count
+            for upper_bound, count in zip((*INPUT_SIZE_BUCKETS, "+Inf"), self.input_size_counts)
+            if count
+        }
+        return stats
+
+
+class InstrumentationStats:
+    """Statistics about the calls to each of the instrumented functions."""
+
+    def __init__(self):
+        self.functions: Dict[str, FunctionStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, input_size: Optional[int]):
+        """Record a call to the function with the given name."""
+        with self._lock:
+            function_stats = self.functions.get(name)
+            if function_stats is None:
+                function_stats = self.functions[name] = FunctionStats()
+            function_stats.record(seconds, input_size)
+
+    def reset(self):
+        """Remove all of the recorded statistics."""
+        with self._lock:
+            self.functions.clear()
+
+    def as_dict(self) -> dict:
+        """Return the statistics of each function as a dictionary."""
+        with self._lock:
+            return {name: function_stats.as_dict() for name, function_stats in sorted(self.functions.items())}
+
+    def as_prometheus(self) -> str:
+        """Return the statistics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP d8s_strings_calls_total Number of calls to each d8s_strings function.",
+            "# TYPE d8s_strings_calls_total counter",
+        ]
+        with self._lock:
+            functions = sorted(self.functions.items())
+            for name, function_stats in functions:
+                lines.append(f'd8s_strings_calls_total{{function="{name}"}} {function_stats.calls}')
+
+            lines.extend(
+                [
+                    "# HELP d8s_strings_latency_seconds Latency of each d8s_strings function.",
+                    "# TYPE d8s_strings_latency_seconds histogram",
+                ]
+            )
+            for name, function_stats in functions:
+                lines.extend(
+                    _prometheus_histogram(
+                        "d8s_strings_latency_seconds",
+                        name,
+                        LATENCY_BUCKETS,
+                        function_stats.latency_counts,
+                        function_stats.total_seconds,
+                    )
+                )
+
+            lines.extend(
+                [
+                    "# HELP d8s_strings_input_size Size of the largest input to each d8s_strings function.",
+                    "# TYPE d8s_strings_input_size histogram",
+                ]
+            )
+            for name, function_stats in functions:
+                lines.extend(
+                    _prometheus_histogram(
+                        "d8s_strings_input_size", name, INPUT_SIZE_BUCKETS, function_stats.input_size_counts
+                    )
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_histogram(
+    metric: str, name: str, buckets: Sequence[float], counts: List[int], total: Optional[float] = None
+) -> List[str]:
+    """Return the lines of a Prometheus histogram with the given (non-cumulative) counts per bucket."""
+    lines = []
+    cumulative_count = 0
+    for upper_bound, count in zip((*buckets, "+Inf"), counts):
+        cumulative_count += count
+        lines.append(f'{metric}_bucket{{function="{name}",le="{upper_bound}"}} {cumulative_count}')
+    if total is not None:
+        lines.append(f'{metric}_sum{{function="{name}"}} {total}')
+    lines.append(f'{metric}_count{{function="{name}"}} {cumulative_count}')
+    return lines
+
+
+def _bucket_index(buckets: Sequence[float], value: float) -> int:
+    """Return the index of the first bucket whose upper bound is >= the value."""
+    return bisect.bisect_left(buckets, value)
+
+
+STATS = InstrumentationStats()
+_scope_stats: contextvars.ContextVar[Optional[InstrumentationStats]] = contextvars.ContextVar(
+    "d8s_strings_instrumentation_scope", default=None
+)
+# the number of open instrumentation scopes and whether or not the first of them enabled instrumentation (in which case
+# it is disabled when the last of them is closed)
+_scope_lock = threading.Lock()
+_open_scopes = 0
+_scopes_enabled_instrumentation = False
+
+
+def _input_size(args: tuple, kwargs: dict) -> Optional[int]:
+    """Return the length of the largest str, bytes, or list in the given arguments."""
+    sizes = [len(arg) for arg in (*args, *kwargs.values()) if isinstance(arg, (str, bytes, list, tuple))]
+    return max(sizes) if sizes else None
+
+
+class _InstrumentedFunction:
+    """A wrapper around a function which records the statistics of each call to it.
+
+    The wrapper is pickled as the function it wraps (so it can be sent to a process pool) and is instrumented again
+    when it is unpickled."""
+
+    __d8s_instrumented__ = True
+
+    def __init__(self, name: str, func: Callable):
+        functools.update_wrapper(self, func)
+        self.name = name
+        self.func = func
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            input_size = _input_size(args, kwargs)
+            STATS.record(self.name, seconds, input_size)
+            scope_stats = _scope_stats.get()
+            if scope_stats is not None:
+                scope_stats.record(self.name, seconds, input_size)
+
+    def __reduce__(self):
+        return instrumented, (self.name, self.func)
+
+    def __repr__(self) -> str:
+        return f"<instrumented {self.func!r}>"
+
+
+def instrumented(name: str, func: Callable) -> Callable:
+    """Return a wrapper around the func which records the statistics of each call to it."""
+    return _InstrumentedFunction(name, func)
+
+
+def _instrument_attribute(name: str, value):
+    """Return the instrumented form of the given d8s_strings attribute (if it is a function)."""
+    if inspect.isfunction(value) and not getattr(value, "__d8s_instrumented__", False):
+        return instrumented(name, value)
+    return value
+
+
+def enable_instrumentation():
+    """Record statistics about the calls to the d8s_strings functions.
+
+    Only the functions accessed as attributes of the d8s_strings package (e.g. using `from d8s_strings import ...`)
+    after instrumentation is enabled are instrumented - set the D8S_STRINGS_INSTRUMENTATION environment variable to
+    enable instrumentation when d8s_strings is first imported. Names which were already bound (e.g. by
+    `from d8s_strings import snake_case` before instrumentation was enabled) and the calls the d8s_strings functions
+    make to each other are not instrumented. For generator functions, the latency is the time it takes to create the
+    generator."""
+    package = sys.modules["d8s_strings"]
+    package._instrument = _instrument_attribute
+
+    package_attributes = vars(package)
+    for name in package._ATTRIBUTE_SUBMODULES:
+        if name in package_attributes:
+            package_attributes[name] = _instrument_attribute(name, package_attributes[name])
+
+
+def disable_instrumentation():
+    """Stop recording statistics about the calls to the d8s_strings functions.
+
+    When instrumentation is disabled, the d8s_strings functions are not wrapped at all (so there is no overhead)."""
+    package = sys.modules["d8s_strings"]
+    package._instrument = None
+
+    package_attributes = vars(package)
+    for name in package._ATTRIBUTE_SUBMODULES:
+        value = package_attributes.get(name)
+        if getattr(value, "__d8s_instrumented__", False):
+            package_attributes[name] = value.__wrapped__  # type: ignore
+
+
+def instrumentation_enabled() -> bool:
+    """Return whether or not instrumentation is enabled."""
+    return sys.modules["d8s_strings"]._instrument is not None
+
+
+def instrumentation_stats() -> dict:
+    """Return the statistics of each instrumented function which has been called as a dictionary."""
+    return STATS.as_dict()
+
+
+def instrumentation_prometheus() -> str:
+    """Return the statistics of each instrumented function in the Prometheus text exposition format."""
+    return STATS.as_prometheus()
+
+
+def instrumentation_reset():
+    """Remove all of the recorded statistics."""
+    STATS.reset()
+
+
+@contextlib.contextmanager
+def instrumentation_scope() -> Iterator[InstrumentationStats]:
+    """Collect statistics about the calls made within this context (e.g. while handling one request).
+
+    Instrumentation is enabled while any scope is open if it was not enabled already (so scopes can overlap, e.g. in
+    different threads or tasks). Only calls to instrumented functions are collected and functions are only instrumented
+    when they are accessed as attributes of the d8s_strings package while instrumentation is enabled (see
+    enable_instrumentation): a name bound by `from d8s_strings import ...` before the scope is opened refers to the
+    function itself, so calls to it are NOT collected. To collect the calls made using such names, set the
+    D8S_STRINGS_INSTRUMENTATION environment variable (or call enable_instrumentation before they are imported)."""
+    global _open_scopes, _scopes_enabled_instrumentation
+
+    with _scope_lock:
+        if not _open_scopes:
+            _scopes_enabled_instrumentation = not instrumentation_enabled()
+            if _scopes_enabled_instrumentation:
+                enable_instrumentation()
+        _open_scopes += 1
+
+    scope_stats = InstrumentationStats()
+    token = _scope_stats.set(scope_stats)
+    try:
+        yield scope_stats
+    finally:
+        _scope_stats.reset(token)
+        with _scope_lock:
+            _open_scopes -= 1
+            if not _open_scopes and _scopes_enabled_instrumentation:
+                disable_instrumentation()
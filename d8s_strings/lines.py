@@ -0,0 +1,69 @@
+import bisect
+from array import array
+from typing import AnyStr, Callable, Dict, Iterable, Iterator, Tuple
+
+from .rope import apply_edits
+
+
+class LineIndex:
+    """An index of where each line starts in a str, bytes, or memory-mapped file for fast random access to lines.
+
+    Lines are split on "\\n" (which is not included in the lines) and are indexed from zero. The offsets of the start of
+    each line are stored in an array('Q') (8 bytes per line) so getting any line does not need to split the text."""
+
+    def __init__(self, text):
+        self.text = text
+        newline = "\n" if isinstance(text, str) else b"\n"
+
+        self.offsets = array("Q")
+        if len(text):
+            self.offsets.append(0)
+        find = text.find
+        end = len(text) - 1
+        position = find(newline)
+        # a newline at the end of the text does not start another line (just like str.splitlines)
+        while -1 < position < end:
+            self.offsets.append(position + 1)
+            position = find(newline, position + 1)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, line_index: int):
+        start, end = self.line_span(line_index)
+        return self.text[start:end]
+
+    def __iter__(self) -> Iterator:
+        for line_index in range(len(self)):
+            yield self[line_index]
+
+    def line_span(self, line_index: int) -> Tuple[int, int]:
+        """Return the start and end offset of the line at the given index (without its newline)."""
+        offsets = self.offsets
+        line_index = range(len(offsets))[line_index]
+        start = offsets[line_index]
+        if line_index + 1 < len(offsets):
+            return start, offsets[line_index + 1] - 1
+
+        end = len(self.text)
+        if self.text[end - 1 : end] in ("\n", b"\n"):
+            end -= 1
+        return start, end
+
+    def line_at(self, offset: int) -> int:
+        """Return the index of the line containing the character at the given offset."""
+        if not 0 <= offset < len(self.text):
+            raise IndexError(f"The offset {offset} is not in the text.")
+        return bisect.bisect_right(self.offsets, offset) - 1
+
+    def replace_lines(self, replacements: Dict[int, AnyStr]) -> AnyStr:
+        """Return the text with the lines at each of the given indexes replaced (the text is only rebuilt once)."""
+        edits = []
+        for line_index, line in replacements.items():
+            start, end = self.line_span(line_index)
+            edits.append((start, end, line))
+        return apply_edits(self.text, edits)
+
+    def modify_lines(self, modifying_func: Callable[[AnyStr], AnyStr], line_indexes: Iterable[int]) -> AnyStr:
+        """Return the text with the modifying_func applied to the lines at each of the given indexes."""
+        return self.replace_lines({line_index: modifying_func(self[line_index]) for line_index in line_indexes})
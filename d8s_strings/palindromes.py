@@ -0,0 +1,112 @@
+from array import array
+from typing import AnyStr, Iterable, Iterator, Tuple
+
+
+def _palindrome_radii(string) -> Tuple[array, array]:
+    """Find the palindromes centered at each position of the string using Manacher's algorithm.
+
+    The first array has the number of odd-length palindromes centered on each character and the second has the number
+    of even-length palindromes centered just before each character. The string is never copied or transformed."""
+    length = len(string)
+
+    odd_radii = array("I", bytes(4 * length))
+    left, right = 0, -1
+    for center in range(length):
+        radius = 1 if center > right else min(odd_radii[left + right - center], right - center + 1)
+        while center - radius >= 0 and center + radius < length and string[center - radius] == string[center + radius]:
+            radius += 1
+        odd_radii[center] = radius
+        if center + radius - 1 > right:
+            left, right = center - radius + 1, center + radius - 1
+
+    even_radii = array("I", bytes(4 * length))
+    left, right = 0, -1
+    for center in range(length):
+        radius = 0 if center > right else min(even_radii[left + right - center + 1], right - center + 1)
+        while (
+            center - radius - 1 >= 0
+            and center + radius < length
+            and string[center - radius - 1] == string[center + radius]
+        ):
+            radius += 1
+        even_radii[center] = radius
+        if center + radius - 1 > right:
+            left, right = center - radius, center + radius - 1
+
+    return odd_radii, even_radii
+
+
+def _longest_palindrome_span(odd_radii: array, even_radii: array) -> Tuple[int, int]:
+    """Find the start and end of the first of the longest palindromes from the radii found by _palindrome_radii."""
+    best_start, best_length = 0, 0
+    for center, (odd_radius, even_radius) in enumerate(zip(odd_radii, even_radii)):
+        if 2 * odd_radius - 1 > best_length:
+            best_start, best_length = center - odd_radius + 1, 2 * odd_radius - 1
+        if 2 * even_radius > best_length:
+            best_start, best_length = center - even_radius, 2 * even_radius
+    return best_start, best_start + best_length
+
+
+def string_longest_palindrome_span(string: AnyStr) -> Tuple[int, int]:
+    """Return the start and end index of the (first) longest palindromic substring of the string in linear time."""
+    return _longest_palindrome_span(*_palindrome_radii(string))
+
+
+def string_longest_palindrome(string: AnyStr) -> AnyStr:
+    """Return the (first) longest palindromic substring of the string (or bytes) in linear time."""
+    start, end = string_longest_palindrome_span(string)
+    return string[start:end]
+
+
+def string_palindrome_count(string: AnyStr) -> int:
+    """Return the number of palindromic substrings in the string (counting each occurrence and each single character)
+    in linear time."""
+    odd_radii, even_radii = _palindrome_radii(string)
+    return sum(odd_radii) + sum(even_radii)
+
+
+def string_longest_palindrome_many(strings: Iterable[AnyStr]) -> Iterator[AnyStr]:
+    """Yield the longest palindromic substring of each of the strings."""
+    for string in strings:
+        yield string_longest_palindrome(string)
+
+
+def string_palindrome_count_many(strings: Iterable[AnyStr]) -> Iterator[int]:
+    """Yield the number of palindromic substrings in each of the strings."""
+    for string in strings:
+        yield string_palindrome_count(string)
+
+
+def string_is_palindrome_normalized(
+    string: str, *, ignore_case: bool = True, ignore_non_alpha_numeric: bool = True
+) -> bool:
+    """Return whether or not the string is a palindrome when case and non-alphanumeric characters (e.g. spaces and
+    punctuation) are ignored.
+
+    The ignored characters are skipped while comparing characters from each end of the string (rather than making a
+    cleaned copy of the string)."""
+    start, end = 0, len(string) - 1
+    while start < end:
+        start_character, end_character = string[start], string[end]
+        if ignore_non_alpha_numeric and not start_character.isalnum():
+            start += 1
+        elif ignore_non_alpha_numeric and not end_character.isalnum():
+            end -= 1
+        elif start_character == end_character or (
+            ignore_case and start_character.casefold() == end_character.casefold()
+        ):
+            start += 1
+            end -= 1
+        else:
+            return False
+    return True
+
+
+def string_is_palindrome_normalized_many(
+    strings: Iterable[str], *, ignore_case: bool = True, ignore_non_alpha_numeric: bool = True
+) -> Iterator[bool]:
+    """Yield whether or not each of the strings is a palindrome (see string_is_palindrome_normalized)."""
+    for string in strings:
+        yield string_is_palindrome_normalized(
+            string, ignore_case=ignore_case, ignore_non_alpha_numeric=ignore_non_alpha_numeric
+        )
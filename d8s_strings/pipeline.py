@@ -0,0 +1,231 @@
+import functools
+import re
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .casing import kebab_case, snake_case, uppercase
+from .cleaning import (
+    string_remove_non_alpha_numeric_characters,
+    string_remove_numbers,
+    string_remove_unicode,
+)
+from .codecs import unicode_to_ascii
+
+# functions which change each character of a string independently of the characters around it (so applying them to a
+# string gives the same result as applying them to each of its characters and joining the results)
+_CHARACTER_FUNCTIONS = frozenset(
+    {
+        kebab_case,
+        snake_case,
+        string_remove_non_alpha_numeric_characters,
+        string_remove_unicode,
+        unicode_to_ascii,
+        uppercase,
+    }
+)
+# lowercase is not one of them because str.lower lowercases a capital sigma depending on whether it ends a word (and it
+# is already a single fast pass over the text)
+
+# regexes which always match exactly one character (without looking at the characters around it)
+_CHARACTER_PATTERN_REGEX = re.compile(
+    r"""
+    \[\^?\]?(?:\\.|[^\]\\])*\]                              # a character set
+    | \\x[0-9a-fA-F]{2} | \\u[0-9a-fA-F]{4} | \\U[0-9a-fA-F]{8}
+    | \\[^AbBZ0-9xuUN]                                      # an escaped character or a class like \d
+    | [^.^$*+?{}\[\]\\|()] | \.                             # a literal or any character
+    """,
+    re.VERBOSE,
+)
+
+
+class _Step:
+    """One of the steps in a Pipeline: either a function (called with the text and the given arguments) or the removal
+    of a regex pattern."""
+
+    __slots__ = ("func", "args", "kwargs", "pattern", "is_character_step")
+
+    def __init__(self, func: Optional[Callable], args: tuple = (), kwargs: Optional[dict] = None, pattern=None):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.pattern: Optional[re.Pattern] = pattern
+        self.is_character_step = self._is_character_step()
+
+    def _is_character_step(self) -> bool:
+        if self.pattern is not None:
+            return not self.pattern.flags & re.VERBOSE and bool(
+                _CHARACTER_PATTERN_REGEX.fullmatch(self.pattern.pattern)
+            )
+        elif self.func is string_remove_numbers:
+            # numbers are only removed one character at a time when they are not replaced
+            return self.args == ("",) or (not self.args and self.kwargs == {"replacement": ""})
+        return self.func in _CHARACTER_FUNCTIONS and not self.args and not self.kwargs
+
+    def __call__(self, text):
+        if self.pattern is not None:
+            return self.pattern.sub("", text)
+        return self.func(text, *self.args, **self.kwargs)  # type: ignore
+
+    def __repr__(self) -> str:
+        if self.pattern is not None:
+            return f"remove({self.pattern.pattern!r})"
+        arguments = [repr(arg) for arg in self.args] + [f"{key}={value!r}" for key, value in self.kwargs.items()]
+        return f"{getattr(self.func, '__name__', repr(self.func))}({', '.join(arguments)})"
+
+
+class _CharacterTable(dict):
+    """A str.translate table which applies each of the steps to a character the first time it is seen."""
+
+    def __init__(self, steps: Tuple[_Step, ...]):
+        super().__init__()
+        self.steps = steps
+
+    def __missing__(self, code_point: int) -> Optional[str]:
+        text = chr(code_point)
+        for step in self.steps:
+            text = step(text)
+        # str.translate deletes characters mapped to None much faster than those mapped to ""
+        self[code_point] = text or None
+        return self[code_point]
+
+
+class _CharacterPass:
+    """Apply adjacent character steps to a text at once using str.translate."""
+
+    def __init__(self, steps: Tuple[_Step, ...]):
+        self.steps = steps
+        self.table = _CharacterTable(steps)
+
+    def __call__(self, text: str) -> str:
+        return text.translate(self.table)
+
+
+class _RemovalPass:
+    """Remove a regex pattern and the following single character patterns from a text at once using one regex.
+
+    Removing a single character pattern never creates a new match of itself, so removing the patterns one after the
+    other is the same as removing any of them wherever they match first."""
+
+    def __init__(self, steps: Tuple[_Step, ...]):
+        self.steps = steps
+        self.pattern = re.compile(
+            "|".join(f"(?:{step.pattern.pattern})" for step in steps),  # type: ignore
+            steps[0].pattern.flags,  # type: ignore
+        )
+
+    def __call__(self, text: str) -> str:
+        return self.pattern.sub("", text)
+
+
+def _passes(steps: Tuple[_Step, ...]) -> List[Callable]:
+    """Group the steps into as few passes over the text as possible."""
+    groups: List[Tuple[str, List[_Step]]] = []
+    for step in steps:
+        kind = "character" if step.is_character_step else "removal" if step.pattern is not None else "function"
+        previous_kind, previous_steps = groups[-1] if groups else (None, [])
+        if kind == "character" and previous_kind == "character":
+            previous_steps.append(step)
+        elif (
+            kind == "character"
+            and step.pattern is not None
+            and previous_kind == "removal"
+            and step.pattern.flags == previous_steps[0].pattern.flags  # type: ignore
+        ):
+            previous_steps.append(step)
+        else:
+            groups.append((kind, [step]))
+
+    passes: List[Callable] = []
+    for kind, group_steps in groups:
+        if len(group_steps) == 1:
+            # a single step is faster on its own (e.g. snake_case uses str.replace rather than str.translate)
+            passes.append(group_steps[0])
+        elif kind == "character":
+            passes.append(_CharacterPass(tuple(group_steps)))
+        else:
+            # only character steps and removals are grouped with other steps
+            try:
+                passes.append(_RemovalPass(tuple(group_steps)))
+            except re.error:
+                # the pattern can not be combined with the others (e.g. it has global inline flags)
+                passes.extend(group_steps)
+    return passes
+
+
+class Pipeline:
+    """A chain of functions applied to strings in as few passes over each string as possible.
+
+    For example, Pipeline(lowercase, unicode_to_ascii, snake_case).apply(text) gives the same result as
+    snake_case(unicode_to_ascii(lowercase(text))). Adjacent functions which change each character independently (i.e.
+    uppercase, unicode_to_ascii, snake_case, kebab_case, string_remove_unicode,
+    string_remove_non_alpha_numeric_characters, and string_remove_numbers with a replacement of "") are combined into
+    one str.translate table and adjacent regex removals (see remove) are combined into one regex where doing so does not
+    change the result. Any other function is applied on its own."""
+
+    def __init__(self, *funcs: Callable):
+        self._steps = tuple(_Step(func) for func in funcs)
+        self._passes = _passes(self._steps)
+
+    @classmethod
+    def _from_steps(cls, steps: Tuple[_Step, ...]) -> "Pipeline":
+        pipeline = cls.__new__(cls)
+        pipeline._steps = steps
+        pipeline._passes = _passes(steps)
+        return pipeline
+
+    def then(self, func: Callable, *args, **kwargs) -> "Pipeline":
+        """Return a new pipeline which also applies the func (called with the text and the given arguments)."""
+        return self._from_steps(self._steps + (_Step(func, args, kwargs),))
+
+    def remove(self, regex_pattern, *, flags=0) -> "Pipeline":
+        """Return a new pipeline which also removes the regex_pattern (like string_remove)."""
+        if isinstance(regex_pattern, re.Pattern):
+            pattern = regex_pattern if not flags else re.compile(regex_pattern.pattern, regex_pattern.flags | flags)
+        else:
+            pattern = re.compile(regex_pattern, flags)
+        return self._from_steps(self._steps + (_Step(None, pattern=pattern),))
+
+    @property
+    def passes(self) -> int:
+        """The number of passes made over each string."""
+        return len(self._passes)
+
+    def __repr__(self) -> str:
+        return f"Pipeline({', '.join(map(repr, self._steps))})"
+
+    def __call__(self, text: str):
+        return self.apply(text)
+
+    def apply(self, text: str):
+        """Apply each of the steps to the text."""
+        for text_pass in self._passes:
+            text = text_pass(text)
+        return text
+
+    def apply_many(self, texts: Iterable[str]) -> Iterator:
+        """Apply each of the steps to each of the texts."""
+        for text in texts:
+            yield self.apply(text)
+
+    def apply_stream(self, stream, chunk_size: int = 2**20) -> Iterator[str]:
+        """Apply the pipeline to the text from the given stream (a text file object or an iterable of strings) chunk by
+        chunk.
+
+        The text is split into chunks which end with a newline, so the joined results are the same as applying the
+        pipeline to the whole text unless one of its steps depends on text from more than one line."""
+        if hasattr(stream, "read"):
+            stream = iter(functools.partial(stream.read, chunk_size), "")
+
+        parts: List[str] = []
+        for chunk in stream:
+            end = chunk.rfind("\n") + 1
+            if not end:
+                parts.append(chunk)
+                continue
+
+            parts.append(chunk[:end])
+            yield self.apply("".join(parts))
+            parts = [chunk[end:]]
+
+        text = "".join(parts)
+        if text:
+            yield self.apply(text)
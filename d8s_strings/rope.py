@@ -0,0 +1,169 @@
+import random
+from typing import AnyStr, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class _Piece:
+    """A node in the treap of pieces which make up a StringRope.
+
+    Each piece refers to the characters text[start:stop] (so splitting a piece does not copy any characters) and the
+    nodes are ordered by their position in the rope and heap-ordered by their (random) priority."""
+
+    __slots__ = ("text", "start", "stop", "priority", "left", "right", "size")
+
+    def __init__(self, text: str, start: int, stop: int):
+        self.text = text
+        self.start = start
+        self.stop = stop
+        self.priority = random.random()
+        self.left: Optional[_Piece] = None
+        self.right: Optional[_Piece] = None
+        self.size = stop - start
+
+    def update_size(self):
+        self.size = (
+            (self.left.size if self.left else 0) + (self.stop - self.start) + (self.right.size if self.right else 0)
+        )
+
+
+def _merge(left: Optional[_Piece], right: Optional[_Piece]) -> Optional[_Piece]:
+    """Join the two treaps (with all of the characters in left before those in right)."""
+    if left is None:
+        return right
+    elif right is None:
+        return left
+    elif left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update_size()
+        return left
+    right.left = _merge(left, right.left)
+    right.update_size()
+    return right
+
+
+def _split(node: Optional[_Piece], index: int) -> Tuple[Optional[_Piece], Optional[_Piece]]:
+    """Split the treap into one with the first index characters and one with the rest."""
+    if node is None:
+        return None, None
+
+    left_size = node.left.size if node.left else 0
+    piece_size = node.stop - node.start
+    if index <= left_size:
+        left, node.left = _split(node.left, index)
+        node.update_size()
+        return left, node
+    elif index >= left_size + piece_size:
+        node.right, right = _split(node.right, index - left_size - piece_size)
+        node.update_size()
+        return node, right
+
+    # the split is within this node's piece, so the piece is split into two nodes
+    split_point = node.start + index - left_size
+    right_piece = _Piece(node.text, split_point, node.stop)
+    # the new node takes the place of this node above its right subtree, so it needs the same priority to keep the heap
+    # order
+    right_piece.priority = node.priority
+    right_piece.right = node.right
+    right_piece.update_size()
+    node.stop = split_point
+    node.right = None
+    node.update_size()
+    return node, right_piece
+
+
+def _pieces(node: Optional[_Piece]) -> Iterator[str]:
+    """Yield the text of each piece in the treap in order."""
+    stack: List[_Piece] = []
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node.text[node.start : node.stop]
+            node = node.right
+
+
+class StringRope:
+    """A mutable string which supports inserting, deleting, replacing, and slicing in logarithmic time.
+
+    The rope is a piece table: it keeps references to the original string and the inserted strings (rather than copying
+    them) in a balanced tree. Use str(rope) to build the final string once all of the edits have been made."""
+
+    def __init__(self, string: str = ""):
+        self._root: Optional[_Piece] = _Piece(string, 0, len(string)) if string else None
+
+    def __len__(self) -> int:
+        return self._root.size if self._root else 0
+
+    def __str__(self) -> str:
+        return "".join(_pieces(self._root))
+
+    def __repr__(self) -> str:
+        return f"StringRope({str(self)!r})"
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        if isinstance(key, int):
+            index = range(len(self))[key]
+            start, stop = index, index + 1
+        else:
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return str(self)[key]
+            stop = max(start, stop)
+
+        left, rest = _split(self._root, start)
+        middle, right = _split(rest, stop - start)
+        text = "".join(_pieces(middle))
+        self._root = _merge(_merge(left, middle), right)
+        return text
+
+    def _index(self, index: int) -> int:
+        """Convert the index (which may be negative) into a position within the rope."""
+        return slice(index, None).indices(len(self))[0]
+
+    def insert(self, index: int, string: str):
+        """Insert the string at the given index."""
+        if not string:
+            return
+
+        left, right = _split(self._root, self._index(index))
+        self._root = _merge(_merge(left, _Piece(string, 0, len(string))), right)
+
+    def append(self, string: str):
+        """Add the string to the end of the rope."""
+        self.insert(len(self), string)
+
+    def delete(self, start: int, stop: int):
+        """Delete the characters from start up to (but not including) stop."""
+        self.replace(start, stop, "")
+
+    def replace(self, start: int, stop: int, string: str):
+        """Replace the characters from start up to (but not including) stop with the string."""
+        start = self._index(start)
+        stop = max(start, self._index(stop))
+        left, rest = _split(self._root, start)
+        _, right = _split(rest, stop - start)
+        if string:
+            left = _merge(left, _Piece(string, 0, len(string)))
+        self._root = _merge(left, right)
+
+
+def apply_edits(string: AnyStr, edits: Iterable[Tuple[int, int, AnyStr]]) -> AnyStr:
+    """Apply each of the edits to the string (or bytes) in one pass.
+
+    Each edit is a tuple of (start, stop, replacement) which replaces string[start:stop] with the replacement (so an
+    insertion has start == stop and a deletion has an empty replacement). All positions refer to the original string
+    (so the edits do not need to account for the changes in length caused by the other edits). Edits at the same
+    position are applied in the order they are given and overlapping edits raise a ValueError."""
+    pieces = []
+    position = 0
+    for start, stop, replacement in sorted(edits, key=lambda edit: edit[0]):
+        if start < position or stop < start or stop > len(string):
+            edit = (start, stop, replacement)
+            message = f"Invalid edit given: {edit}\nEdits must be within the string and must not overlap."
+            raise ValueError(message)
+        pieces.append(string[position:start])
+        pieces.append(replacement)
+        position = stop
+    pieces.append(string[position:])
+    return string[:0].join(pieces)
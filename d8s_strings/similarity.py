@@ -0,0 +1,172 @@
+import functools
+import os
+from typing import Iterable, Optional
+
+from d8s_lists import shortest
+
+from ._parallel import _default_chunksize, _ordered_parallel_map
+from .codepoints import CodePoints, _code_points_hamming_distance
+from .core import string_reverse
+
+
+def string_sequence_matcher(string_a, string_b):
+    """Create a difflib.SequenceMatcher for the given string."""
+    import difflib
+
+    return difflib.SequenceMatcher(None, string_a, string_b)
+
+
+def strings_diff(string_a, string_b):
+    """Return the diff of the two strings."""
+    import difflib
+
+    if not isinstance(string_a, list):
+        string_a = string_a.splitlines()
+
+    if not isinstance(string_b, list):
+        string_b = string_b.splitlines()
+
+    d = difflib.Differ()
+    diff = d.compare(string_a, string_b)
+    return "\n".join(diff)
+
+
+def string_get_closes_matches(word, possible_matches, maximum_matches=3, cutoff=0.6):
+    """Return the words from the list of possible matches that are closest to the given word."""
+    import difflib
+
+    return difflib.get_close_matches(word, possible_matches, n=maximum_matches, cutoff=cutoff)
+
+
+# TODO: this can also be used for fuzzy matching... add a tag/rename the function to capture this possibility
+def strings_similarity(a: str, b: str):
+    """Return the ratio of similarity between the two strings."""
+    sequence_matcher = string_sequence_matcher(a, b)
+
+    return sequence_matcher.ratio()
+
+
+def strings_matching_blocks(a: str, b: str):
+    """Return the matching blocks in the given strings."""
+    sequence_matcher = string_sequence_matcher(a, b)
+
+    # this function has to be run first so that the sequence_matcher.matching_blocks property is populated
+    sequence_matcher.get_opcodes()
+
+    return sequence_matcher.matching_blocks  # type: ignore
+
+
+def strings_longest_matching_block(a: str, b: str):
+    """Return the longest matching block in the string."""
+    sequence_matcher = string_sequence_matcher(a, b)
+
+    return sequence_matcher.find_longest_match(0, len(sequence_matcher.a), 0, len(sequence_matcher.b))  # type: ignore
+
+
+# TODO: I think I want to singularize the strings_... functions
+def strings_diff_opcodes(a: str, b: str):
+    """Return the opcodes representing the differences/similarities between two strings."""
+    sequence_matcher = string_sequence_matcher(a, b)
+
+    return sequence_matcher.get_opcodes()
+
+
+STRINGS_DIFF_MANY_OUTPUTS = ("diff", "opcodes", "ratio")
+
+
+def strings_diff_many(
+    pairs: Iterable, workers: Optional[int] = None, *, output="diff", chunksize: Optional[int] = None
+):
+    """Compare each (a, b) pair in the given pairs and yield the results in the same order as the pairs.
+
+    The output can be "diff" (see strings_diff), "opcodes" (see strings_diff_opcodes), or "ratio" (see
+    strings_similarity). The pairs are spread across a pool of worker processes (by default, one per cpu) in chunks of
+    the given chunksize; if workers is 1, the pairs are compared in this process."""
+    if output not in STRINGS_DIFF_MANY_OUTPUTS:
+        message = f"Invalid output given: {output}\nAvailable outputs are: {STRINGS_DIFF_MANY_OUTPUTS}"
+        raise ValueError(message)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if chunksize is None:
+        chunksize = _default_chunksize(pairs, workers)
+
+    import more_itertools
+
+    chunk_func = functools.partial(_strings_diff_many_chunk, output=output)
+    chunks = more_itertools.chunked(pairs, chunksize)
+    chunk_results = _ordered_parallel_map(chunk_func, chunks, workers)
+    return more_itertools.flatten(chunk_results)
+
+
+def _strings_diff_many_chunk(chunk, output):
+    """Compare each of the pairs in the given chunk."""
+    return [_strings_diff_pair(a, b, output) for a, b in chunk]
+
+
+def _strings_diff_pair(a, b, output):
+    """Compare a and b and return the given output form."""
+    if _strings_are_identical(a, b):
+        # identical strings do not need a SequenceMatcher - we can build the result directly
+        if output == "ratio":
+            return 1.0
+        elif output == "opcodes":
+            return [("equal", 0, len(a), 0, len(b))] if a else []
+        else:
+            lines = a if isinstance(a, list) else a.splitlines()
+            return "\n".join(f"  {line}" for line in lines)
+
+    if output == "ratio":
+        return strings_similarity(a, b)
+    elif output == "opcodes":
+        return strings_diff_opcodes(a, b)
+    else:
+        return strings_diff(a, b)
+
+
+def _strings_are_identical(a, b) -> bool:
+    """Return whether or not a and b are identical (checking the cheaper length and hash first)."""
+    if len(a) != len(b):
+        return False
+    # str hashes are cached on the object, so this is usually free and avoids a full comparison of unequal strings
+    if isinstance(a, str) and isinstance(b, str) and hash(a) != hash(b):
+        return False
+    return a == b
+
+
+def string_common_prefix(a: str, b: str) -> str:
+    """Returns the common prefix string from left to right between a and b."""
+    common_prefix = ""
+
+    for index in range(len(shortest([a, b]))):
+        if a[index] == b[index]:
+            common_prefix += a[index]
+        else:
+            break
+
+    return common_prefix
+
+
+def string_common_suffix(a: str, b: str):
+    """Returns the common suffix string from left to right between a and b."""
+    return string_reverse(string_common_prefix(string_reverse(a), string_reverse(b)))
+
+
+def hamming_distance(string_1, string_2, as_percent=False):
+    """Return the number of positions at which corresponding symbols in string_1 and string_2 are different (this is
+    known as the Hamming Distance). See https://en.wikipedia.org/wiki/Hamming_distance."""
+    if len(string_1) != len(string_2):
+        raise ValueError("The length of the two strings must be the same")
+
+    if isinstance(string_1, CodePoints) and isinstance(string_2, CodePoints):
+        distance = _code_points_hamming_distance(string_1, string_2)
+    else:
+        distance = sum(el1 != el2 for el1, el2 in zip(string_1, string_2))
+
+    if as_percent:
+        from d8s_math import percent
+
+        return percent(distance / len(string_1))
+    else:
+        return distance
@@ -0,0 +1,226 @@
+import functools
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# the kinds of whitespace which runs are made of and the regexes matching one of their characters
+WHITESPACE_KINDS = ("space", "tab", "blank", "inline", "unicode")
+_WHITESPACE_KIND_PATTERNS = {
+    "space": " ",
+    "tab": "\\t",
+    # spaces and tabs
+    "blank": "[ \\t]",
+    # any whitespace except for line breaks ("\r" and "\n")
+    "inline": "[^\\S\\r\\n]",
+    "unicode": "\\s",
+}
+# the kinds of whitespace which are a single character (so their runs can be found without a regex)
+_WHITESPACE_KIND_CHARACTERS = {"space": " ", "tab": "\t"}
+TRIM_SIDES = ("trailing", "leading", "both")
+
+_INLINE_WHITESPACE_PATTERN = _WHITESPACE_KIND_PATTERNS["inline"]
+
+
+def _kind_pattern(kind: str) -> str:
+    if kind not in WHITESPACE_KINDS:
+        message = f"Invalid kind given: {kind}\nAvailable kinds are: {WHITESPACE_KINDS}"
+        raise ValueError(message)
+    return _WHITESPACE_KIND_PATTERNS[kind]
+
+
+class WhitespaceNormalizer:
+    """Normalize the whitespace in texts in one pass over each text.
+
+    Trim inline whitespace from the given side(s) of each line (see TRIM_SIDES), replace each line ending ("\\r\\n",
+    "\\r", or "\\n") with the given line_ending, and replace each run of the given kind of whitespace (see
+    WHITESPACE_KINDS) with the replacement. The result is the same as doing each of these (in this order) one after the
+    other, but all of them are done using a single compiled regex. When doing the steps one after the other would join
+    the whitespace around line breaks (e.g. when the line_ending is a space and runs of spaces are collapsed), each run
+    of whitespace containing line breaks is matched as a whole and normalized on its own."""
+
+    def __init__(
+        self,
+        *,
+        collapse: Optional[str] = None,
+        replacement: str = " ",
+        trim: Optional[str] = None,
+        line_ending: Optional[str] = None,
+    ):
+        if trim is not None and trim not in TRIM_SIDES:
+            message = f"Invalid trim given: {trim}\nAvailable trims are: {TRIM_SIDES}"
+            raise ValueError(message)
+        kind_pattern = _kind_pattern(collapse) if collapse is not None else None
+
+        self.collapse = collapse
+        self.replacement = replacement
+        self.trim = trim
+        self.line_ending = line_ending
+        # each run of whitespace containing line breaks is normalized on its own (rather than by the other alternatives)
+        # when the steps can join parts of it: trimming can join a "\r" and a "\n" into one line ending and a
+        # line_ending which is empty or has characters of the collapsed kind (or any line break when collapsing unicode
+        # whitespace) can join the whitespace around it into one run
+        self._normalizes_line_break_runs = collapse == "unicode" and trim is not None
+        if line_ending is not None:
+            self._normalizes_line_break_runs |= trim is not None or collapse == "unicode"
+            if kind_pattern is not None:
+                self._normalizes_line_break_runs |= not line_ending or re.search(kind_pattern, line_ending) is not None
+        self._line_break_run_replacements: Dict[Tuple[bool, str, bool], str] = {}
+
+        alternatives: List[Tuple[str, Optional[str]]] = []
+        line_start, line_end = "(?:^|(?<=[\\r\\n]))", "(?=[\\r\\n]|\\Z)"
+        if self._normalizes_line_break_runs:
+            # the whole run of whitespace around one or more line breaks (which is replaced using _line_break_run), so
+            # only the start and end of the text need to be trimmed by the other alternatives
+            inline_run = f"{_INLINE_WHITESPACE_PATTERN}*"
+            line_break_run = f"[\\r\\n](?:{inline_run}[\\r\\n])*{inline_run}"
+            # like trailing whitespace, a run which starts with inline whitespace must start after a character which is
+            # not inline whitespace
+            inline_start = f"(?<!{_INLINE_WHITESPACE_PATTERN}){_INLINE_WHITESPACE_PATTERN}+"
+            alternatives.append((f"{inline_start}{line_break_run}|{line_break_run}", None))
+            line_start, line_end = "^", "\\Z"
+        if trim in ("trailing", "both"):
+            # the run must start after a character which is not inline whitespace so that a long run which does not end
+            # a line is only checked once (rather than once from each of its characters)
+            alternatives.append((f"(?<!{_INLINE_WHITESPACE_PATTERN}){_INLINE_WHITESPACE_PATTERN}+{line_end}", ""))
+        if trim in ("leading", "both"):
+            alternatives.append((f"{line_start}{_INLINE_WHITESPACE_PATTERN}+", ""))
+        if line_ending is not None and not self._normalizes_line_break_runs:
+            alternatives.append(("\\r\\n|\\r|\\n", line_ending))
+        if kind_pattern is not None:
+            if len(replacement) == 1:
+                # a run of one character which is already the replacement does not need to be replaced
+                run_pattern = f"(?:{kind_pattern}){{2,}}|(?!{re.escape(replacement)}){kind_pattern}"
+            else:
+                run_pattern = f"(?:{kind_pattern})+"
+            alternatives.append((run_pattern, replacement))
+
+        self._pattern = re.compile("|".join(f"({pattern})" for pattern, _ in alternatives)) if alternatives else None
+        self._replacements: List[Optional[str]] = ["", *(replacement for _, replacement in alternatives)]
+        self._replace: Union[str, Callable[[re.Match], str]]
+        if len(alternatives) == 1 and alternatives[0][1] is not None:
+            # backslashes are the only special characters in a replacement template
+            self._replace = alternatives[0][1].replace("\\", "\\\\")
+        else:
+            self._replace = self._replacement
+
+    def _replacement(self, match: re.Match) -> str:
+        replacement = self._replacements[match.lastindex]  # type: ignore
+        if replacement is None:
+            return self._line_break_run(match)
+        return replacement
+
+    def _line_break_run(self, match: re.Match) -> str:
+        """Return the normalized form of a run of whitespace containing line breaks by doing each of the steps on it.
+
+        The characters around the run are not whitespace, so they are only replaced by a placeholder (which matters for
+        trimming) and the normalized runs are cached (as there are usually only a few different ones in a text)."""
+        start, end = match.span()
+        key = (start > 0, match.group(), end < len(match.string))
+        result = self._line_break_run_replacements.get(key)
+        if result is None:
+            before, after = ("x" if key[0] else ""), ("x" if key[2] else "")
+            text = before + key[1] + after
+            if self.trim is not None:
+                text = _normalizer(trim=self.trim).normalize(text)
+            if self.line_ending is not None:
+                text = _normalizer(line_ending=self.line_ending).normalize(text)
+            if self.collapse is not None:
+                text = _normalizer(collapse=self.collapse, replacement=self.replacement).normalize(text)
+            result = self._line_break_run_replacements[key] = text[len(before) : len(text) - len(after)]
+        return result
+
+    def __call__(self, text: str) -> str:
+        return self.normalize(text)
+
+    def normalize(self, text: str) -> str:
+        """Normalize the whitespace in the text."""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replace, text)
+
+    def normalize_many(self, texts: Iterable[str]) -> Iterator[str]:
+        """Normalize the whitespace in each of the texts."""
+        for text in texts:
+            yield self.normalize(text)
+
+    def normalize_stream(self, stream, chunk_size: int = 2**20) -> Iterator[str]:
+        """Normalize the whitespace in the text from the given stream (a text file object or an iterable of strings)
+        chunk by chunk (the joined results are the same as normalizing the whole text).
+
+        The text is split after a line break (or, when collapsing unicode whitespace, before a character which is not
+        whitespace) so that no run of whitespace is split between two chunks. When runs of whitespace containing line
+        breaks are normalized on their own (see WhitespaceNormalizer), the text is split after a character which is not
+        whitespace instead (and the rest of the text is normalized as if it followed that character)."""
+        if hasattr(stream, "read"):
+            stream = iter(functools.partial(stream.read, chunk_size), "")
+
+        parts: List[str] = []
+        # the placeholder for the character before the text which has not been normalized yet
+        before = ""
+        for chunk in stream:
+            if self._normalizes_line_break_runs:
+                end = len(chunk.rstrip())
+            elif self.collapse == "unicode":
+                end = len(chunk.rstrip()) - 1
+            else:
+                # a "\r" at the end of the chunk may be the start of a "\r\n"
+                end = chunk.rfind("\n") + 1
+            if end <= 0:
+                parts.append(chunk)
+                continue
+
+            parts.append(chunk[:end])
+            yield self.normalize(before + "".join(parts))[len(before) :]
+            parts = [chunk[end:]]
+            if self._normalizes_line_break_runs:
+                before = "x"
+
+        text = "".join(parts)
+        if text:
+            yield self.normalize(before + text)[len(before) :]
+
+
+@functools.lru_cache(maxsize=64)
+def _normalizer(**kwargs) -> WhitespaceNormalizer:
+    return WhitespaceNormalizer(**kwargs)
+
+
+@functools.lru_cache(maxsize=64)
+def _whitespace_run_regex(kind: str, minimum: int) -> re.Pattern:
+    if minimum < 1:
+        raise ValueError(f"The minimum length of a run must be at least 1 (not {minimum}).")
+    return re.compile(f"(?:{_kind_pattern(kind)}){{{minimum},}}")
+
+
+def string_whitespace_runs(string: str, kind: str = "space", minimum: int = 2) -> Iterator[Tuple[int, int]]:
+    """Yield the start and end index of each run of at least minimum characters of the given kind of whitespace (see
+    WHITESPACE_KINDS) in the string."""
+    for match in _whitespace_run_regex(kind, minimum).finditer(string):
+        yield match.span()
+
+
+def string_has_whitespace_run(string: str, kind: str = "space", minimum: int = 2) -> bool:
+    """Return whether or not the string has a run of at least minimum characters of the given kind of whitespace."""
+    if kind in _WHITESPACE_KIND_CHARACTERS and minimum >= 1:
+        # a run of a single character can be found in linear time without a regex
+        return _WHITESPACE_KIND_CHARACTERS[kind] * minimum in string
+    return _whitespace_run_regex(kind, minimum).search(string) is not None
+
+
+def string_whitespace_run_count(string: str, kind: str = "space", minimum: int = 2) -> int:
+    """Return the number of runs of at least minimum characters of the given kind of whitespace in the string."""
+    return sum(1 for _ in _whitespace_run_regex(kind, minimum).finditer(string))
+
+
+def string_collapse_whitespace(string: str, kind: str = "space", replacement: str = " ") -> str:
+    """Replace each run of the given kind of whitespace (see WHITESPACE_KINDS) in the string with the replacement."""
+    return _normalizer(collapse=kind, replacement=replacement).normalize(string)
+
+
+def string_trim_lines(string: str, side: str = "trailing") -> str:
+    """Remove the whitespace from the given side(s) of each line in the string (see TRIM_SIDES)."""
+    return _normalizer(trim=side).normalize(string)
+
+
+def string_normalize_line_endings(string: str, line_ending: str = "\n") -> str:
+    """Replace each line ending ("\\r\\n", "\\r", or "\\n") in the string with the given line_ending."""
+    return _normalizer(line_ending=line_ending).normalize(string)
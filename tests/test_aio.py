@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from d8s_strings import (
+    aio,
+    cardinalize,
+    is_plural,
+    pluralize,
+    singularize,
+    string_get_closes_matches,
+    strings_diff,
+    strings_similarity,
+)
+from d8s_strings.aio import AsyncRunner
+
+
+@pytest.fixture(autouse=True)
+def _thread_runner():
+    aio.configure("thread", workers=2)
+    yield
+    aio.shutdown()
+
+
+def test_awaitable_functions():
+    async def _main():
+        return await asyncio.gather(
+            aio.strings_diff("abc", "abd"),
+            aio.strings_similarity("abc", "abd"),
+            aio.string_get_closes_matches("appel", ["ape", "apple", "peach"]),
+            aio.pluralize("goose"),
+            aio.singularize("geese"),
+            aio.is_plural("geese"),
+            aio.ordinalize(3),
+            aio.cardinalize("goose", 2),
+        )
+
+    assert asyncio.run(_main()) == [
+        strings_diff("abc", "abd"),
+        strings_similarity("abc", "abd"),
+        string_get_closes_matches("appel", ["ape", "apple", "peach"]),
+        pluralize("goose"),
+        singularize("geese"),
+        is_plural("geese"),
+        "3rd",
+        cardinalize("goose", 2),
+    ]
+
+
+def test_awaitable_function_metadata():
+    assert aio.pluralize.__name__ == "pluralize"
+    assert aio.pluralize.__module__ == "d8s_strings.aio"
+    assert asyncio.iscoroutinefunction(aio.strings_diff)
+
+
+def test_process_backend():
+    aio.configure("process", workers=2)
+
+    async def _main():
+        return await asyncio.gather(*(aio.strings_similarity("abc", b) for b in ["abc", "abd", "xyz"]))
+
+    assert asyncio.run(_main()) == [strings_similarity("abc", b) for b in ["abc", "abd", "xyz"]]
+
+
+def test_runner_is_reusable_across_event_loops():
+    assert asyncio.run(aio.run(str.upper, "a")) == "A"
+    assert asyncio.run(aio.run(str.upper, "b")) == "B"
+    aio.shutdown()
+    assert asyncio.run(aio.run(str.upper, "c")) == "C"
+
+
+def test_max_concurrency():
+    runner = AsyncRunner("thread", workers=4, max_concurrency=2)
+    lock = threading.Lock()
+    running = []
+    most_running = 0
+
+    def _func(item):
+        nonlocal most_running
+        with lock:
+            running.append(item)
+            most_running = max(most_running, len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(item)
+        return item
+
+    async def _main():
+        return await asyncio.gather(*(runner.run(_func, item) for item in range(10)))
+
+    assert asyncio.run(_main()) == list(range(10))
+    assert most_running == 2
+    runner.shutdown()
+
+
+def test_cancellation():
+    runner = AsyncRunner("thread", workers=1, max_concurrency=1)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _func(item):
+        calls.append(item)
+        started.set()
+        release.wait(5)
+        return item
+
+    async def _main():
+        tasks = [asyncio.ensure_future(runner.run(_func, item)) for item in range(3)]
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        for task in tasks:
+            task.cancel()
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(_main())
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    # only the call which had already started was run
+    assert calls == [0]
+    runner.shutdown()
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        AsyncRunner("serial")
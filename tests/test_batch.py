@@ -0,0 +1,84 @@
+import pytest
+
+from d8s_strings import pluralize, snake_case, strings_diff, strings_similarity
+from d8s_strings.batch import batch, default_backend
+
+WORDS = ["Hello World", "foo bar", "Hello World", "a b c"] * 10
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_batch_backends(backend):
+    assert list(batch(snake_case, WORDS, workers=2, chunksize=3, backend=backend)) == [snake_case(w) for w in WORDS]
+
+
+def test_batch_unpack():
+    pairs = [("abc", "abd"), ("abc", "abc")]
+    assert list(batch(strings_similarity, pairs, unpack=True, backend="serial")) == [
+        strings_similarity(a, b) for a, b in pairs
+    ]
+    assert list(batch(strings_diff, pairs, workers=2, unpack=True)) == [strings_diff(a, b) for a, b in pairs]
+
+
+def test_batch_deduplicates_within_chunks():
+    calls = []
+
+    def _func(item):
+        calls.append(item)
+        return item * 2
+
+    items = [1, 1, 1.0, "a", "a", [1], [1]]
+    assert list(batch(_func, items, chunksize=10)) == [2, 2, 2.0, "aa", "aa", [1, 1], [1, 1]]
+    assert calls == [1, 1.0, "a", [1], [1]]
+
+    calls.clear()
+    # items are only deduplicated within each chunk
+    assert list(batch(_func, iter(items), chunksize=2)) == [2, 2, 2.0, "aa", "aa", [1, 1], [1, 1]]
+    assert calls == [1, 1.0, "a", "a", [1], [1]]
+
+
+def test_batch_deduplicates_by_element_types():
+    assert list(batch(str, [(1,), (True,), (1.0,)], unpack=True, chunksize=10)) == ["1", "True", "1.0"]
+    assert list(batch(repr, [(1,), (True,)], chunksize=10)) == ["(1,)", "(True,)"]
+    assert list(batch(repr, [((1,),), ((1.0,),), (1, [1])], chunksize=10)) == ["((1,),)", "((1.0,),)", "(1, [1])"]
+    assert list(batch(repr, [frozenset({1}), frozenset({1.0})], chunksize=10)) == [
+        "frozenset({1})",
+        "frozenset({1.0})",
+    ]
+
+
+def test_batch_does_not_share_mutable_results():
+    calls = []
+
+    def _func(item):
+        calls.append(item)
+        return [item]
+
+    results = list(batch(_func, ["a", "a", "b"], chunksize=10))
+    assert results == [["a"], ["a"], ["b"]]
+    assert results[0] is not results[1]
+    assert calls == ["a", "a", "b"]
+
+    # tuples are only shared if all of their items are immutable
+    results = list(batch(lambda item: (item, [item]), ["a", "a"], chunksize=10))
+    assert results[0][1] is not results[1][1]
+    results = list(batch(lambda item: (item, (1, 2.0, None)), ["a", "a"], chunksize=10))
+    assert results[0] is results[1]
+
+
+def test_batch_streams_results():
+    results = batch(snake_case, (f"word {index}" for index in range(10**9)), backend="thread", workers=2)
+    assert next(results) == "word_0"
+    assert next(results) == "word_1"
+
+
+def test_default_backend():
+    assert default_backend(pluralize) == "process"
+    assert default_backend(strings_diff) == "process"
+    assert default_backend(snake_case) == "serial"
+    assert default_backend(len) == "serial"
+    assert default_backend(lambda text: text) == "serial"
+
+
+def test_batch_invalid_backend():
+    with pytest.raises(ValueError):
+        batch(snake_case, WORDS, backend="gpu")
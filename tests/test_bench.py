@@ -0,0 +1,115 @@
+import json
+import math
+
+import pytest
+
+import d8s_strings
+from d8s_strings.bench import (
+    BENCHMARK_ARGUMENTS,
+    SKIPPED_FUNCTIONS,
+    benchmark,
+    benchmark_function,
+    benchmark_text,
+    benchmarked_functions,
+    compare_results,
+    fit_complexity,
+    format_result,
+    main,
+)
+from d8s_strings.corpus import CORPUS_CACHE_ENVIRONMENT_VARIABLE
+
+SIZES = [10**exponent for exponent in range(1, 7)]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def corpus_cache_directory(tmp_path_factory):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(CORPUS_CACHE_ENVIRONMENT_VARIABLE, str(tmp_path_factory.mktemp("corpus")))
+        yield
+
+
+def test_benchmark_text_1():
+    assert len(benchmark_text(10)) == 10
+    assert len(benchmark_text(1000)) == 1000
+
+
+@pytest.mark.parametrize(
+    "f,expected",
+    [
+        (lambda n: 0, "O(1)"),
+        (lambda n: 100 * math.log(n), "O(log n)"),
+        (lambda n: n, "O(n)"),
+        (lambda n: n * math.log(n), "O(n log n)"),
+        (lambda n: n * n, "O(n^2)"),
+    ],
+)
+def test_fit_complexity_1(f, expected):
+    # each timing includes a constant overhead
+    assert fit_complexity(SIZES, [2e-7 + 1e-9 * f(size) for size in SIZES]) == expected
+
+
+def test_benchmarked_functions_1():
+    public_functions = {name for name in d8s_strings.__all__ if callable(getattr(d8s_strings, name))}
+    assert set(benchmarked_functions()) == public_functions - set(SKIPPED_FUNCTIONS)
+    assert set(BENCHMARK_ARGUMENTS) <= public_functions
+
+
+@pytest.mark.parametrize("name", benchmarked_functions())
+def test_benchmark_function_arguments(name):
+    result = benchmark_function(name, [10], min_time=0)
+    assert "error" not in result
+    assert len(result["timings"]) == 1
+
+
+def test_benchmark_function_failure_modes(monkeypatch):
+    monkeypatch.setitem(BENCHMARK_ARGUMENTS, "a10n", lambda text: ())
+    result = benchmark_function("a10n", [10], min_time=0)
+    assert result["error"].startswith("TypeError")
+    assert format_result("a10n", result).startswith("a10n: TypeError")
+
+
+def test_benchmark_1():
+    results = benchmark(["snake_case", "string_remove_many"], [10, 100, 1000], min_time=0.001)
+    assert set(results["results"]) == {"snake_case", "string_remove_many"}
+    assert [size for size, _ in results["results"]["snake_case"]["timings"]] == [10, 100, 1000]
+    assert results["results"]["snake_case"]["complexity"] in ("O(1)", "O(log n)", "O(n)", "O(n log n)", "O(n^2)")
+
+
+def test_benchmark_max_seconds():
+    result = benchmark_function("snake_case", [10, 100, 1000], min_time=0, max_seconds=0)
+    assert len(result["timings"]) == 1
+
+
+def test_compare_results_1():
+    baseline = {"results": {"foo": {"complexity": "O(n)", "timings": [[10, 1.0], [100, 10.0]]}}}
+
+    results = {"results": {"foo": {"complexity": "O(n)", "timings": [[10, 1.0], [100, 11.0]]}}}
+    assert compare_results(results, baseline, threshold=0.25) == []
+
+    results = {"results": {"foo": {"complexity": "O(n)", "timings": [[10, 1.0], [100, 20.0]]}}}
+    assert compare_results(results, baseline, threshold=0.25) == [
+        "foo: 2.00x slower than the baseline with 100 characters"
+    ]
+
+    results = {"results": {"foo": {"complexity": "O(n^2)", "timings": [[10, 1.0]]}}}
+    assert compare_results(results, baseline, threshold=0.25) == ["foo: complexity went from O(n) to O(n^2)"]
+
+    results = {"results": {"bar": {"complexity": "O(n)", "timings": [[10, 1.0]]}}}
+    assert compare_results(results, baseline) == []
+
+
+def test_main_1(tmp_path, capsys):
+    baseline_path = tmp_path / "baseline.json"
+    assert main(["snake_case", "--max-size", "100", "--min-time", "0.001", "--save", str(baseline_path)]) == 0
+    assert "snake_case: " in capsys.readouterr().out
+
+    baseline = json.loads(baseline_path.read_text())
+    assert list(baseline["results"]) == ["snake_case"]
+
+    # make the baseline much faster than the function can possibly be
+    for timing in baseline["results"]["snake_case"]["timings"]:
+        timing[1] /= 1000
+    baseline_path.write_text(json.dumps(baseline))
+
+    assert main(["snake_case", "--max-size", "100", "--min-time", "0.001", "--compare", str(baseline_path)]) == 1
+    assert "REGRESSION snake_case" in capsys.readouterr().out
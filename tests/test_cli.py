@@ -0,0 +1,92 @@
+import io
+import json
+import sys
+
+import pytest
+
+from d8s_strings import snake_case, string_remove_numbers, unicode_to_ascii
+from d8s_strings.cli import format_statistics, main, process
+
+LINES = ["Héllo Wörld 42", "", "FooBar 7 baz", "déjà vu"]
+
+
+def test_process_lines():
+    output = io.StringIO()
+    statistics = process([unicode_to_ascii, string_remove_numbers, snake_case], iter(LINES), output, chunksize=3)
+    expected = [snake_case(string_remove_numbers(unicode_to_ascii(line))) for line in LINES]
+    assert output.getvalue() == "\n".join(expected) + "\n"
+    assert statistics["lines"] == 4
+    assert statistics["characters"] == sum(map(len, LINES))
+
+
+def test_process_lines_in_parallel_keeps_order():
+    lines = [f"Line Number {index}" for index in range(500)]
+    output = io.StringIO()
+    process([snake_case], lines, output, workers=2, chunksize=7)
+    assert output.getvalue().splitlines() == [snake_case(line) for line in lines]
+
+
+def test_process_non_string_results():
+    output = io.StringIO()
+    process([str.split], ["a b"], output)
+    assert output.getvalue() == '["a", "b"]\n'
+
+
+def test_process_jsonl():
+    records = [{"name": "Héllo Wörld", "id": 1, "tag": "FooBar"}, {"id": 2}]
+    lines = [json.dumps(record) for record in records] + [""]
+
+    output = io.StringIO()
+    process([unicode_to_ascii, snake_case], lines, output, jsonl=True)
+    assert [json.loads(line) for line in output.getvalue().splitlines() if line] == [
+        {"name": snake_case(unicode_to_ascii("Héllo Wörld")), "id": 1, "tag": snake_case("FooBar")},
+        {"id": 2},
+    ]
+
+    output = io.StringIO()
+    process([snake_case], lines, output, jsonl=True, fields=["tag"])
+    assert json.loads(output.getvalue().splitlines()[0]) == {
+        "name": "Héllo Wörld",
+        "id": 1,
+        "tag": snake_case("FooBar"),
+    }
+
+
+def test_format_statistics():
+    report = format_statistics({"lines": 2000, "characters": 4_000_000, "seconds": 2.0})
+    assert (
+        report == "Processed 2,000 lines (4,000,000 characters) in 2.00 s: 1,000 lines/s, 2.00 million characters/s\n"
+    )
+
+
+def test_main_files(tmp_path, capsys):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    output_path = tmp_path / "output.txt"
+
+    assert main(["unicode_to_ascii", "snake_case", "-i", str(input_path), "-o", str(output_path), "-w", "1"]) == 0
+    assert output_path.read_text(encoding="utf-8").splitlines() == [
+        snake_case(unicode_to_ascii(line)) for line in LINES
+    ]
+    assert capsys.readouterr().err.startswith("Processed 4 lines")
+
+
+def test_main_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"Foo Bar\r\nBaz Qux"), encoding="utf-8"))
+    assert main(["snake_case", "-q", "-w", "1"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == f"{snake_case('Foo Bar')}\n{snake_case('Baz Qux')}\n"
+    assert captured.err == ""
+
+
+def test_main_list(capsys):
+    assert main(["--list"]) == 0
+    names = capsys.readouterr().out.splitlines()
+    assert "snake_case" in names
+    assert "CORPUS_WORDS" not in names
+
+
+@pytest.mark.parametrize("argv", [[], ["not_a_function"], ["CORPUS_WORDS"]])
+def test_main_invalid_functions(argv):
+    with pytest.raises(SystemExit):
+        main(argv)
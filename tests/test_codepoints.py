@@ -0,0 +1,71 @@
+from array import array
+
+import pytest
+
+from d8s_strings import characters, hamming_distance, string_as_numbers, string_reverse_case, string_rotate, xor
+from d8s_strings.codepoints import CodePoints
+
+STRINGS = ["", "Hello World", "Straße ÿ µ", "Ωmega δέλτα ΑΣ", "東京 and 😀 emoji", "lone \ud800 surrogate"]
+
+
+@pytest.mark.parametrize(
+    "string,typecode",
+    [("", "B"), ("abc", "B"), ("café", "B"), ("δέλτα", "H"), ("\ud800", "H"), ("😀", "I"), ("a😀δ", "I")],
+)
+def test_code_points_1(string, typecode):
+    code_points = CodePoints(string)
+    assert code_points.typecode == typecode
+    assert len(code_points) == len(string)
+    assert list(code_points.codes) == [ord(char) for char in string]
+    assert str(code_points) == string
+    assert repr(code_points) == f"CodePoints({string!r})"
+    assert code_points == CodePoints(string)
+    assert code_points != string
+    assert list(code_points) == list(string)
+    assert characters(code_points) == characters(string)
+    assert [code_points[index] for index in range(-len(string), len(string))] == list(string + string)
+    assert code_points[1:] == CodePoints(string[1:])
+    assert code_points[::-1].typecode == typecode
+
+
+def test_code_points_from_codes():
+    codes = array("H", [104, 105])
+    code_points = CodePoints.from_codes(codes)
+    assert code_points.codes is codes
+    assert str(code_points) == "hi"
+    assert list(code_points.widened("I")) == [104, 105]
+
+    with pytest.raises(ValueError):
+        CodePoints.from_codes(array("d", [1.0]))
+
+
+def test_code_points_numpy():
+    pytest.importorskip("numpy")
+    assert list(CodePoints("δέλτα").numpy()) == [ord(char) for char in "δέλτα"]
+
+
+@pytest.mark.parametrize("string", STRINGS)
+def test_code_points_functions_match_strings(string):
+    code_points = CodePoints(string)
+    for rot in (0, 1, 13, -3):
+        assert string_rotate(code_points, rot) == CodePoints(string_rotate(string, rot))
+    assert string_reverse_case(code_points) == CodePoints(string_reverse_case(string))
+    assert str(xor(code_points, "key")) == xor(string, "key")
+    assert str(xor(code_points, CodePoints("東😀"))) == xor(string, "東😀")
+    assert str(xor(code_points, "")) == xor(string, "")
+
+    mutated_string = string[::-1]
+    assert hamming_distance(code_points, CodePoints(mutated_string)) == hamming_distance(string, mutated_string)
+
+
+def test_string_reverse_case_sigma():
+    # each character is swapped on its own (unlike str.swapcase which uses the final form of sigma)
+    assert string_reverse_case("ΑΣ") == "ασ"
+    assert string_reverse_case("ǅ Σ ß") == "ǅ σ SS"
+
+
+def test_string_as_numbers_code_points():
+    assert string_as_numbers(CodePoints("London")) == [12, 15, 14, 4, 15, 14]
+
+    with pytest.raises(ValueError):
+        string_as_numbers(CodePoints("δ"))
@@ -0,0 +1,78 @@
+import unicodedata
+
+import pytest
+
+from d8s_strings import character_examples, text_examples
+from d8s_strings.corpus import (
+    CORPUS_CACHE_ENVIRONMENT_VARIABLE,
+    UNICODE_CATEGORIES,
+    corpus_cache_directory,
+    corpus_characters,
+    corpus_file,
+    corpus_mmap,
+    corpus_text,
+    corpus_texts,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv(CORPUS_CACHE_ENVIRONMENT_VARIABLE, str(tmp_path))
+    return tmp_path
+
+
+def test_corpus_text_1():
+    text = corpus_text(10_000, cache=False)
+    assert len(text) == 10_000
+    assert text == corpus_text(10_000, cache=False)
+    assert text != corpus_text(10_000, seed=1, cache=False)
+    # the text does not depend on the size it is generated with
+    assert text[:100] == corpus_text(100, cache=False)
+    assert corpus_text(0, cache=False) == ""
+
+
+def test_corpus_text_coverage():
+    text = corpus_text(1_000_000, cache=False)
+    assert {unicodedata.category(char) for char in text} == set(UNICODE_CATEGORIES)
+    assert "  " in text
+    assert "\r\n" in text
+    assert max(len(line) for line in text.splitlines()) > 1000
+
+
+def test_corpus_text_cache(cache_directory):
+    text = corpus_text(1000)
+    assert text == corpus_text(1000, cache=False)
+    assert [path.name for path in cache_directory.iterdir()] == [corpus_file(1000).name]
+
+    # the cached file is used rather than generating the text again
+    corpus_file(1000).write_text("foo")
+    assert corpus_text(1000) == "foo"
+
+
+def test_corpus_mmap_1():
+    with corpus_mmap(1000, seed=2) as corpus:
+        assert corpus[:].decode("utf-8") == corpus_text(1000, seed=2, cache=False)
+
+
+def test_corpus_cache_directory(monkeypatch, tmp_path):
+    assert corpus_cache_directory() == tmp_path
+
+    monkeypatch.delenv(CORPUS_CACHE_ENVIRONMENT_VARIABLE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    assert corpus_cache_directory() == tmp_path / "cache" / "d8s_strings"
+
+
+def test_corpus_texts_1():
+    texts = corpus_texts(20, max_size=50)
+    assert len(texts) == 20
+    assert all(len(text) <= 50 for text in texts)
+    assert texts == corpus_texts(20, max_size=50)
+    assert text_examples(20, seed=0) == corpus_texts(20)
+
+
+def test_corpus_characters_1():
+    characters = corpus_characters(100)
+    assert len(characters) == 100
+    assert all(len(character) == 1 for character in characters)
+    assert characters == corpus_characters(100)
+    assert character_examples(100, seed=0) == characters
@@ -0,0 +1,133 @@
+import io
+
+import pytest
+
+from d8s_strings.display import (
+    character_display_width,
+    string_display_width,
+    string_graphemes,
+    string_pad,
+    string_shorten_to_width,
+    string_shorten_to_width_many,
+    text_column_widths,
+    text_columns_format,
+    text_columns_write,
+)
+
+
+@pytest.mark.parametrize(
+    "character,expected",
+    [
+        ("a", 1),
+        ("é", 1),
+        ("東", 2),
+        ("Ａ", 2),
+        ("😀", 2),
+        ("́", 0),
+        ("‍", 0),
+        ("\x00", 0),
+    ],
+)
+def test_character_display_width_1(character, expected):
+    assert character_display_width(character) == expected
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("", 0),
+        ("abc", 3),
+        ("a\tb", 2),
+        ("東京", 4),
+        ("café", 4),
+        ("ｗｉｄｅ text", 13),
+    ],
+)
+def test_string_display_width_1(string, expected):
+    assert string_display_width(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("", []),
+        ("ab\r\n", ["a", "b", "\r\n"]),
+        ("e\u0301a", ["e\u0301", "a"]),
+        ("\U0001f44d\U0001f3fdx", ["\U0001f44d\U0001f3fd", "x"]),
+        ("\U0001f469\u200d\U0001f4bb!", ["\U0001f469\u200d\U0001f4bb", "!"]),
+        ("\U0001f1f3\U0001f1ff\U0001f1e6\U0001f1fa", ["\U0001f1f3\U0001f1ff", "\U0001f1e6\U0001f1fa"]),
+    ],
+)
+def test_string_graphemes_1(string, expected):
+    assert string_graphemes(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string,width,expected",
+    [
+        ("hello world", 20, "hello world"),
+        ("hello world", 8, "hello..."),
+        ("hello world", 2, "he"),
+        ("東京都庁舎", 7, "東京..."),
+        ("東京都庁舎", 8, "東京..."),
+        ("cafe\u0301 au lait", 7, "cafe\u0301..."),
+        ("cafe\u0301 au lait", 6, "caf..."),
+        ("\U0001f469\u200d\U0001f4bb\U0001f469\u200d\U0001f4bb", 6, "..."),
+        ("\U0001f1f3\U0001f1ff\U0001f1f3\U0001f1ff\U0001f1f3\U0001f1ff", 5, "\U0001f1f3\U0001f1ff..."),
+    ],
+)
+def test_string_shorten_to_width_1(string, width, expected):
+    assert string_shorten_to_width(string, width) == expected
+    assert list(string_shorten_to_width_many([string], width)) == [expected]
+    assert string_display_width(expected) <= width
+
+
+def test_string_shorten_to_width_many_1():
+    strings = ["short", "a much longer title", "東京都庁舎", "e\u0301" * 10]
+    assert list(string_shorten_to_width_many(strings, 6, suffix="…")) == [
+        "short",
+        "a muc…",
+        "東京…",
+        "e\u0301" * 5 + "…",
+    ]
+
+
+def test_string_pad_1():
+    assert string_pad("ab", 5) == "ab   "
+    assert string_pad("ab", 5, alignment="right") == "   ab"
+    assert string_pad("ab", 5, alignment="center") == " ab  "
+    assert string_pad("東京", 6, alignment="right", fill=".") == "..東京"
+    assert string_pad("abcdef", 3) == "abcdef"
+
+    with pytest.raises(ValueError):
+        string_pad("ab", 5, alignment="middle")
+
+
+def test_text_column_widths_1():
+    assert text_column_widths([]) == []
+    assert text_column_widths([["a", "東京"], ["abc"], [1, 2, 3]]) == [3, 4, 1]
+
+
+def test_text_columns_format_1():
+    rows = [["name", "count"], ["東京", 12], ["café", 3]]
+    assert list(text_columns_format(rows)) == ["name count", "東京 12   ", "café 3    "]
+    assert list(text_columns_format(rows, alignment="right", separator=" | ")) == [
+        "name | count",
+        "東京 |    12",
+        "café |     3",
+    ]
+    assert list(text_columns_format(rows, alignment=["left", "center"])) == [
+        "name count",
+        "東京  12  ",
+        "café   3  ",
+    ]
+    assert list(text_columns_format([["a", "b"], ["c"]], fill=".")) == ["a b", "c ."]
+
+    with pytest.raises(ValueError):
+        list(text_columns_format(rows, alignment=["left", "middle"]))
+
+
+def test_text_columns_write_1():
+    stream = io.StringIO()
+    assert text_columns_write(iter([["a", "bb"], ["ccc", "d"]]), stream, alignment="right") == 2
+    assert stream.getvalue() == "  a bb\nccc  d\n"
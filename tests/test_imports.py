@@ -0,0 +1,71 @@
+import importlib
+import inspect
+import subprocess
+import sys
+
+import pytest
+
+import d8s_strings
+from d8s_strings import SUBMODULE_ATTRIBUTES
+
+HEAVY_DEPENDENCIES = ("d8s_hypothesis", "d8s_math", "difflib", "hypothesis", "inflect", "more_itertools")
+
+
+def _import_times(statement: str) -> dict:
+    """Run the statement in a new interpreter with `-X importtime` and return the cumulative import time (in
+    microseconds) of each module it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module_name = line.split("|")
+        import_times[module_name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize("submodule_name", SUBMODULE_ATTRIBUTES)
+def test_submodule_attributes_are_complete(submodule_name):
+    submodule = importlib.import_module(f"d8s_strings.{submodule_name}")
+    public_names = {
+        name
+        for name, value in vars(submodule).items()
+        if not name.startswith("_")
+        and not inspect.ismodule(value)
+        and getattr(value, "__module__", submodule.__name__) == submodule.__name__
+    }
+    assert public_names == set(SUBMODULE_ATTRIBUTES[submodule_name])
+
+
+def test_lazy_attributes():
+    assert d8s_strings.snake_case("a b") == "a_b"
+    assert d8s_strings.casing is importlib.import_module("d8s_strings.casing")
+    assert "snake_case" in dir(d8s_strings)
+
+    with pytest.raises(AttributeError):
+        d8s_strings.foo
+
+
+def test_import_time_package():
+    import_times = _import_times("import d8s_strings")
+    assert "d8s_strings" in import_times
+    assert not set(HEAVY_DEPENDENCIES).intersection(import_times)
+    assert not any(module_name.startswith("d8s_strings.") for module_name in import_times)
+
+
+def test_import_time_single_function():
+    import_times = _import_times("from d8s_strings import snake_case")
+    assert "d8s_strings.casing" in import_times
+    assert "d8s_strings.inflection" not in import_times
+    assert not set(HEAVY_DEPENDENCIES).intersection(import_times)
+
+
+def test_import_time_inflection():
+    import_times = _import_times("from d8s_strings import pluralize")
+    assert "d8s_strings.inflection" in import_times
+    # the inflect engine is only imported when it is first used
+    assert "inflect" not in import_times
+    assert "d8s_math" not in import_times
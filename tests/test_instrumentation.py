@@ -0,0 +1,179 @@
+import os
+import pickle
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import d8s_strings
+from d8s_strings.instrumentation import (
+    FunctionStats,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumentation_enabled,
+    instrumentation_prometheus,
+    instrumentation_reset,
+    instrumentation_scope,
+    instrumentation_stats,
+)
+
+
+@pytest.fixture
+def instrumentation():
+    instrumentation_reset()
+    enable_instrumentation()
+    yield
+    disable_instrumentation()
+    instrumentation_reset()
+
+
+def test_instrumentation_disabled():
+    from d8s_strings.casing import snake_case
+
+    assert not instrumentation_enabled()
+    # when disabled, the functions are not wrapped at all
+    assert d8s_strings.snake_case is snake_case
+
+
+def test_instrumentation_1(instrumentation):
+    assert instrumentation_enabled()
+    assert d8s_strings.snake_case("a b") == "a_b"
+    assert d8s_strings.snake_case("a b" * 100) == "a_b" * 100
+    # classes are not instrumented
+    assert isinstance(d8s_strings.ContainmentIndex(["foo"]), d8s_strings.ContainmentIndex)
+
+    stats = instrumentation_stats()
+    assert list(stats) == ["snake_case"]
+    assert stats["snake_case"]["calls"] == 2
+    assert stats["snake_case"]["total_seconds"] > 0
+    assert 0 < stats["snake_case"]["p50_seconds"] <= stats["snake_case"]["p99_seconds"]
+    assert stats["snake_case"]["input_sizes"] == {"10": 1, "1000": 1}
+
+    disable_instrumentation()
+    d8s_strings.snake_case("a b")
+    assert instrumentation_stats()["snake_case"]["calls"] == 2
+
+
+def test_instrumentation_process_backend(instrumentation):
+    from d8s_strings.batch import batch
+
+    strings_diff = d8s_strings.strings_diff
+    assert strings_diff.__name__ == "strings_diff"
+    assert repr(strings_diff).startswith("<instrumented <function strings_diff")
+    assert pickle.loads(pickle.dumps(strings_diff)).__wrapped__ is strings_diff.__wrapped__
+
+    pairs = [("a", "b"), ("c", "c")]
+    expected = [strings_diff.__wrapped__(a, b) for a, b in pairs]
+    assert list(batch(strings_diff, pairs, unpack=True, workers=2, backend="process")) == expected
+
+
+def test_instrumentation_not_rebound():
+    from d8s_strings import lowercase
+
+    instrumentation_reset()
+    with instrumentation_scope() as scope_stats:
+        # the name was bound before instrumentation was enabled, so it is not instrumented
+        lowercase("FOO")
+        d8s_strings.uppercase("foo")
+    assert list(scope_stats.as_dict()) == ["uppercase"]
+    instrumentation_reset()
+
+
+def test_instrumentation_errors(instrumentation):
+    with pytest.raises(ValueError):
+        d8s_strings.string_modify_line("a", str.upper, 0)
+
+    assert instrumentation_stats()["string_modify_line"]["calls"] == 1
+
+
+def test_instrumentation_prometheus(instrumentation):
+    d8s_strings.lowercase("FOO")
+    prometheus_text = instrumentation_prometheus()
+    assert 'd8s_strings_calls_total{function="lowercase"} 1' in prometheus_text
+    assert 'd8s_strings_latency_seconds_bucket{function="lowercase",le="+Inf"} 1' in prometheus_text
+    assert 'd8s_strings_latency_seconds_count{function="lowercase"} 1' in prometheus_text
+    assert 'd8s_strings_input_size_bucket{function="lowercase",le="1"} 0' in prometheus_text
+    assert 'd8s_strings_input_size_bucket{function="lowercase",le="10"} 1' in prometheus_text
+
+
+def test_instrumentation_scope():
+    instrumentation_reset()
+    d8s_strings.uppercase("foo")
+
+    with instrumentation_scope() as scope_stats:
+        assert instrumentation_enabled()
+        d8s_strings.uppercase("foo")
+        d8s_strings.kebab_case("a b")
+
+    assert not instrumentation_enabled()
+    assert set(scope_stats.as_dict()) == {"uppercase", "kebab_case"}
+    assert scope_stats.as_dict()["uppercase"]["calls"] == 1
+    instrumentation_reset()
+
+
+def test_instrumentation_scope_overlapping():
+    first_scope_entered = threading.Event()
+    first_scope_exited = threading.Event()
+    scopes_stats = {}
+
+    def first_request():
+        with instrumentation_scope() as scope_stats:
+            first_scope_entered.set()
+            d8s_strings.uppercase("foo")
+        scopes_stats["first"] = scope_stats.as_dict()
+        first_scope_exited.set()
+
+    def second_request():
+        first_scope_entered.wait()
+        with instrumentation_scope() as scope_stats:
+            first_scope_exited.wait()
+            # the first scope closing does not disable instrumentation while this scope is open
+            assert instrumentation_enabled()
+            d8s_strings.kebab_case("a b")
+        scopes_stats["second"] = scope_stats.as_dict()
+
+    threads = [threading.Thread(target=first_request), threading.Thread(target=second_request)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not instrumentation_enabled()
+    assert list(scopes_stats["first"]) == ["uppercase"]
+    assert list(scopes_stats["second"]) == ["kebab_case"]
+    instrumentation_reset()
+
+
+def test_instrumentation_scope_already_enabled(instrumentation):
+    with instrumentation_scope():
+        d8s_strings.uppercase("foo")
+    assert instrumentation_enabled()
+
+
+def test_function_stats_percentile():
+    function_stats = FunctionStats()
+    assert function_stats.percentile(50) == 0.0
+
+    for _ in range(99):
+        function_stats.record(1.5e-6, None)
+    function_stats.record(100, None)
+    assert 1e-6 <= function_stats.percentile(50) <= 2e-6
+    assert function_stats.percentile(100) == 5.0
+    assert function_stats.as_dict()["input_sizes"] == {}
+
+
+def test_instrumentation_environment_variable():
+    statement = (
+        "from d8s_strings import snake_case; snake_case('a b'); "
+        "from d8s_strings.instrumentation import instrumentation_stats; "
+        "print(instrumentation_stats()['snake_case']['calls'])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "D8S_STRINGS_INSTRUMENTATION": "1"},
+    )
+    assert result.stdout.strip() == "1"
@@ -0,0 +1,49 @@
+import mmap
+
+import pytest
+
+from d8s_strings.lines import LineIndex
+
+
+@pytest.mark.parametrize("text", ["", "a", "a\n", "a\nbc\n\nd", "\n\n", "a\r\nb\r\n"])
+def test_line_index_matches_split(text):
+    line_index = LineIndex(text)
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()
+    assert list(line_index) == (lines if text else [])
+    assert len(line_index) == len(lines if text else [])
+
+
+def test_line_index_1():
+    line_index = LineIndex("first\nsecond\nthird\n")
+    assert list(line_index.offsets) == [0, 6, 13]
+    assert line_index[1] == "second"
+    assert line_index[-1] == "third"
+    assert line_index.line_span(2) == (13, 18)
+    assert line_index.line_at(0) == 0
+    assert line_index.line_at(5) == 0
+    assert line_index.line_at(6) == 1
+    assert line_index.line_at(17) == 2
+
+    with pytest.raises(IndexError):
+        line_index[3]
+    with pytest.raises(IndexError):
+        line_index.line_at(19)
+
+
+def test_line_index_replace_lines():
+    line_index = LineIndex("first\nsecond\nthird\n")
+    assert line_index.replace_lines({}) == "first\nsecond\nthird\n"
+    assert line_index.replace_lines({0: "1st", 2: "3rd\nand more"}) == "1st\nsecond\n3rd\nand more\n"
+    assert line_index.modify_lines(str.upper, [1, -1]) == "first\nSECOND\nTHIRD\n"
+
+
+def test_line_index_mmap(tmp_path):
+    file_path = tmp_path / "log.txt"
+    file_path.write_bytes(b"one\ntwo\nthree")
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        line_index = LineIndex(mapped_file)
+        assert len(line_index) == 3
+        assert line_index[2] == b"three"
+        assert line_index.modify_lines(bytes.upper, [1]) == b"one\nTWO\nthree"
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from d8s_strings.palindromes import (
+    string_is_palindrome_normalized,
+    string_is_palindrome_normalized_many,
+    string_longest_palindrome,
+    string_longest_palindrome_many,
+    string_longest_palindrome_span,
+    string_palindrome_count,
+    string_palindrome_count_many,
+)
+
+
+def _palindromic_substrings(string):
+    return [
+        string[start:end]
+        for start in range(len(string))
+        for end in range(start + 1, len(string) + 1)
+        if string[start:end] == string[start:end][::-1]
+    ]
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("", ""),
+        ("a", "a"),
+        ("ab", "a"),
+        ("abba", "abba"),
+        ("babad", "bab"),
+        ("cbbd", "bb"),
+        ("forgeeksskeegfor", "geeksskeeg"),
+        (b"TTACGTTGCAA", b"ACGTTGCA"),
+    ],
+)
+def test_string_longest_palindrome_1(string, expected):
+    assert string_longest_palindrome(string) == expected
+
+
+def test_string_longest_palindrome_span_1():
+    assert string_longest_palindrome_span("xxabcbayy") == (2, 7)
+    assert string_longest_palindrome_span("") == (0, 0)
+
+
+@pytest.mark.parametrize("string,expected", [("", 0), ("a", 1), ("abc", 3), ("aaa", 6), ("abba", 6)])
+def test_string_palindrome_count_1(string, expected):
+    assert string_palindrome_count(string) == expected
+
+
+def test_palindromes_match_brute_force():
+    rng = random.Random(0)
+    for _ in range(200):
+        string = "".join(rng.choice("ACGT"[: rng.randint(1, 4)]) for _ in range(rng.randint(0, 30)))
+        palindromes = _palindromic_substrings(string)
+        assert string_palindrome_count(string) == len(palindromes)
+        assert len(string_longest_palindrome(string)) == max(map(len, palindromes), default=0)
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("", True),
+        ("A man, a plan, a canal: Panama!", True),
+        ("No 'x' in Nixon", True),
+        ("Was it a car or a cat I saw?", True),
+        ("race a car", False),
+        ("...", True),
+    ],
+)
+def test_string_is_palindrome_normalized_1(string, expected):
+    assert string_is_palindrome_normalized(string) == expected
+
+
+def test_string_is_palindrome_normalized_options():
+    assert not string_is_palindrome_normalized("Abba", ignore_case=False)
+    assert not string_is_palindrome_normalized("ab, ba", ignore_non_alpha_numeric=False)
+    assert string_is_palindrome_normalized("ab,ba", ignore_non_alpha_numeric=False)
+
+
+def test_palindromes_many():
+    strings = ["babad", "Step on no pets", "abc"]
+    assert list(string_longest_palindrome_many(strings)) == ["bab", "tep on no pet", "a"]
+    assert list(string_palindrome_count_many(strings)) == [7, 21, 3]
+    assert list(string_is_palindrome_normalized_many(strings)) == [False, True, False]
@@ -0,0 +1,125 @@
+import io
+import re
+
+import pytest
+
+from d8s_strings import (
+    Pipeline,
+    corpus_text,
+    corpus_texts,
+    kebab_case,
+    lowercase,
+    snake_case,
+    string_remove,
+    string_remove_non_alpha_numeric_characters,
+    string_remove_numbers,
+    string_remove_unicode,
+    string_reverse,
+    unicode_to_ascii,
+    uppercase,
+)
+
+TEXTS = [
+    "",
+    "Hello World 42",
+    "Héllo Wörld-foo_bar 123 ΟΔΥΣΣΕΥΣ",
+    "ΣΑΣ σας İstanbul straße ﬁ ½ 🎉\n\tend",
+    corpus_text(10_000, 3),
+] + list(corpus_texts(20, 5))
+
+STEPS = [
+    [lowercase, unicode_to_ascii, string_remove_non_alpha_numeric_characters, string_remove_numbers, snake_case],
+    [unicode_to_ascii, string_remove_non_alpha_numeric_characters, kebab_case, uppercase],
+    [uppercase, lowercase, string_remove_unicode, snake_case, kebab_case],
+    [snake_case, string_reverse, kebab_case, unicode_to_ascii],
+]
+
+
+def _apply_steps(steps, text):
+    for step in steps:
+        text = step(text)
+    return text
+
+
+@pytest.mark.parametrize("steps", STEPS)
+def test_pipeline_apply(steps):
+    pipeline = Pipeline(*steps)
+    for text in TEXTS:
+        assert pipeline.apply(text) == _apply_steps(steps, text)
+        assert pipeline(text) == _apply_steps(steps, text)
+
+
+def test_pipeline_passes():
+    assert Pipeline().passes == 0
+    assert Pipeline(unicode_to_ascii, string_remove_non_alpha_numeric_characters, snake_case).passes == 1
+    assert Pipeline(unicode_to_ascii, string_reverse, snake_case, kebab_case).passes == 3
+    assert Pipeline(lowercase, unicode_to_ascii, snake_case).passes == 2
+    # numbers are only removed character by character when they are not replaced
+    assert Pipeline(unicode_to_ascii).then(string_remove_numbers).passes == 2
+    assert Pipeline(unicode_to_ascii).then(string_remove_numbers, "").passes == 1
+    assert Pipeline(unicode_to_ascii).then(string_remove_numbers, replacement="").passes == 1
+
+
+def test_pipeline_then():
+    pipeline = Pipeline(unicode_to_ascii).then(string_remove_numbers, replacement="").then(snake_case)
+    assert pipeline.apply("Héllo 12 Wörld") == "Hello__World"
+    assert pipeline.passes == 1
+    assert repr(pipeline) == "Pipeline(unicode_to_ascii(), string_remove_numbers(replacement=''), snake_case())"
+
+
+@pytest.mark.parametrize(
+    "patterns,passes",
+    [
+        (["a", "[0-9]", r"\s", r"é"], 1),
+        (["ab", "[0-9]", "."], 1),
+        (["ab", "bc"], 2),
+        (["ab", "[0-9]", "bc", "x"], 2),
+        ([r"\bab", "b(?=c)"], 2),
+        (["(?i)ab", "[0-9]"], 2),
+    ],
+)
+def test_pipeline_remove(patterns, passes):
+    pipeline = Pipeline()
+    for pattern in patterns:
+        pipeline = pipeline.remove(pattern)
+    assert pipeline.passes == passes
+
+    for text in ["aXb", "abc ab12bc éab", "ab abbc bcab 0a1b2c"] + TEXTS[:4]:
+        expected = text
+        for pattern in patterns:
+            expected = string_remove(pattern, expected)
+        assert pipeline.apply(text) == expected
+
+
+def test_pipeline_remove_flags():
+    pipeline = Pipeline().remove("ab", flags=re.IGNORECASE).remove("[x]", flags=re.IGNORECASE)
+    assert pipeline.passes == 1
+    assert pipeline.apply("ABxXaBc") == "c"
+    assert Pipeline().remove("ab", flags=re.IGNORECASE).remove("[x]").passes == 2
+    assert Pipeline().remove(re.compile("ab"), flags=re.IGNORECASE).apply("aBc") == "c"
+    # global inline flags can only be at the start of a pattern, so these patterns are not combined
+    pipeline = Pipeline().remove("(?i)ab").remove("[x]", flags=re.IGNORECASE)
+    assert pipeline.passes == 2
+    assert pipeline.apply("ABxXaBc") == "c"
+    assert repr(pipeline) == "Pipeline(remove('(?i)ab'), remove('[x]'))"
+    assert Pipeline().remove(re.compile("a b", re.VERBOSE)).remove(" ").apply("ab a b") == "ab"
+    # whitespace is ignored in verbose patterns, so this pattern is empty (rather than a single character)
+    assert Pipeline(snake_case).remove(" ", flags=re.VERBOSE).apply("a b") == "a_b"
+
+
+def test_pipeline_apply_many():
+    steps = STEPS[0]
+    assert list(Pipeline(*steps).apply_many(TEXTS)) == [_apply_steps(steps, text) for text in TEXTS]
+
+
+@pytest.mark.parametrize("steps", STEPS[:3])
+def test_pipeline_apply_stream(steps):
+    pipeline = Pipeline(*steps)
+    text = "\n".join(TEXTS)
+    assert "".join(pipeline.apply_stream(io.StringIO(text), chunk_size=100)) == _apply_steps(steps, text)
+    chunks = [text[index : index + 7] for index in range(0, len(text), 7)]
+    assert "".join(pipeline.apply_stream(chunks)) == _apply_steps(steps, text)
+    assert list(pipeline.apply_stream(["ab", "c\nd", "e\n"])) == [
+        _apply_steps(steps, "abc\n"),
+        _apply_steps(steps, "de\n"),
+    ]
@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from d8s_strings.rope import StringRope, apply_edits
+
+
+def _assert_treap(node):
+    """Check that each node's priority is at least that of its children and that its size is correct."""
+    if node is None:
+        return
+    for child in (node.left, node.right):
+        if child is not None:
+            assert node.priority >= child.priority
+        _assert_treap(child)
+    assert node.size == (node.left.size if node.left else 0) + node.stop - node.start + (
+        node.right.size if node.right else 0
+    )
+
+
+def test_string_rope_1():
+    rope = StringRope("hello world")
+    assert len(rope) == 11
+    assert str(rope) == "hello world"
+    assert repr(rope) == "StringRope('hello world')"
+
+    rope.insert(5, ",")
+    rope.append("!")
+    rope.insert(0, ">> ")
+    assert str(rope) == ">> hello, world!"
+
+    rope.replace(10, 15, "there")
+    rope.delete(0, 3)
+    assert str(rope) == "hello, there!"
+    assert rope[0] == "h"
+    assert rope[-1] == "!"
+    assert rope[7:12] == "there"
+    assert rope[::-1] == "!ereht ,olleh"
+    assert rope[5:2] == ""
+    # reading does not change the rope
+    assert str(rope) == "hello, there!"
+
+    with pytest.raises(IndexError):
+        rope[13]
+
+
+def test_string_rope_empty():
+    rope = StringRope()
+    assert len(rope) == 0
+    assert str(rope) == ""
+    rope.insert(-5, "")
+    rope.insert(-5, "abc")
+    rope.delete(-2, -1)
+    assert str(rope) == "ac"
+
+
+def test_string_rope_random_edits():
+    rng = random.Random(0)
+    string = "".join(rng.choice("abcdef") for _ in range(1000))
+    rope = StringRope(string)
+    for _ in range(2000):
+        start = rng.randint(0, len(string))
+        stop = rng.randint(start, len(string))
+        replacement = "".join(rng.choice("xyz") for _ in range(rng.randint(0, 5)))
+        operation = rng.randrange(3)
+        if operation == 0:
+            rope.insert(start, replacement)
+            string = string[:start] + replacement + string[start:]
+        elif operation == 1:
+            rope.replace(start, stop, replacement)
+            string = string[:start] + replacement + string[stop:]
+        else:
+            assert rope[start:stop] == string[start:stop]
+        assert len(rope) == len(string)
+        _assert_treap(rope._root)
+    assert str(rope) == string
+
+
+@pytest.mark.parametrize(
+    "edits,expected",
+    [
+        ([], "hello world"),
+        ([(0, 5, "goodbye")], "goodbye world"),
+        ([(6, 11, "there"), (0, 0, "oh, "), (5, 5, ",")], "oh, hello, there"),
+        ([(5, 5, "a"), (5, 5, "b"), (5, 6, "")], "helloabworld"),
+        ([(0, 11, "")], ""),
+    ],
+)
+def test_apply_edits_1(edits, expected):
+    assert apply_edits("hello world", edits) == expected
+    encoded_edits = [(start, stop, replacement.encode()) for start, stop, replacement in edits]
+    assert apply_edits(b"hello world", encoded_edits) == expected.encode()
+
+
+@pytest.mark.parametrize("edits", [[(0, 5, ""), (4, 6, "")], [(-1, 2, "")], [(3, 2, "")], [(5, 12, "")]])
+def test_apply_edits_invalid(edits):
+    with pytest.raises(ValueError):
+        apply_edits("hello world", edits)
@@ -1,8 +1,15 @@
 import functools
+import io
+import itertools
+import random
+import re
+import sys
+from array import array
 
 import pytest
 
 from d8s_strings import (
+    ContainmentIndex,
     a10n,
     base64_decode,
     base64_encode,
@@ -25,18 +32,23 @@ from d8s_strings import (
     lowercase,
     lowercase_count,
     lowercase_first_letter,
+    numbers_as_string,
     pascal_case,
     pluralize,
     singularize,
     snake_case,
     string_add_to_start_of_each_line,
     string_as_numbers,
+    string_as_numbers_array,
+    string_char_codes,
     string_chars_at_start,
     string_common_prefix,
     string_common_suffix,
     string_encode_as_bytes,
     string_entropy,
     string_find_between,
+    string_find_between_iter,
+    string_find_between_stream,
     string_forms,
     string_get_closes_matches,
     string_has_index,
@@ -51,15 +63,21 @@ from d8s_strings import (
     string_remove,
     string_remove_after,
     string_remove_before,
+    string_remove_cache_info,
     string_remove_from_end,
     string_remove_from_start,
     string_remove_index,
+    string_remove_many,
     string_remove_non_alpha_numeric_characters,
+    string_remove_non_alpha_numeric_characters_many,
     string_remove_numbers,
+    string_remove_numbers_many,
     string_remove_unicode,
     string_replace_index,
     string_reverse_case,
     string_rotate,
+    string_rotate_crack,
+    string_rotate_crack_many,
     string_shorten,
     string_split_multiple,
     string_split_on_lowercase,
@@ -68,6 +86,7 @@ from d8s_strings import (
     string_to_bool,
     string_to_hex,
     strings_diff,
+    strings_diff_many,
     strings_diff_opcodes,
     strings_longest_matching_block,
     strings_matching_blocks,
@@ -75,23 +94,35 @@ from d8s_strings import (
     substrings,
     switch,
     text_abbreviate,
+    text_ascii_character_count,
     text_ascii_characters,
+    text_ascii_runs,
     text_consonant_count,
     text_consonants,
     text_ensure_ends_with,
     text_ensure_starts_with,
     text_examples,
+    text_input,
+    text_input_chunks,
+    text_input_is_no,
+    text_input_is_yes,
+    text_input_lines,
     text_join,
+    text_non_ascii_character_count,
     text_non_ascii_characters,
+    text_non_ascii_runs,
     text_to_leet_speak,
     text_vowel_count,
     text_vowels,
     unicode_number_to_character,
     unicode_to_ascii,
+    unicode_to_ascii_many,
+    unicode_to_ascii_stream,
     uppercase,
     uppercase_count,
     uppercase_first_letter,
     xor,
+    xor_recover_key,
 )
 from d8s_strings.strings import _handle_casing
 
@@ -221,6 +252,20 @@ def test_a10n_1():
 def test_unicode_to_ascii_docs_1():
     s = "Klüft skräms inför på fédéral électoral große"
     assert unicode_to_ascii(s) == "Kluft skrams infor pa federal electoral groe"
+    assert unicode_to_ascii("foo bar") == "foo bar"
+    assert unicode_to_ascii("ﬁle ① ｗｉｄｅ") == "file 1 wide"
+
+
+def test_unicode_to_ascii_many_1():
+    assert list(unicode_to_ascii_many(["Klüft", "foo", "ﬁ"])) == ["Kluft", "foo", "fi"]
+
+
+def test_unicode_to_ascii_stream_1():
+    import io
+
+    s = "Klüft skräms inför på fédéral électoral große"
+    assert "".join(unicode_to_ascii_stream(io.StringIO(s), chunk_size=3)) == unicode_to_ascii(s)
+    assert "".join(unicode_to_ascii_stream(["Klü", "ft"])) == "Kluft"
 
 
 def test_string_replace_index_1():
@@ -252,6 +297,14 @@ def test_string_remove_non_alpha_numeric_characters_1():
     result = string_remove_non_alpha_numeric_characters("foobar!@#!@#!test")
     assert result == "foobartest"
 
+    result = string_remove_non_alpha_numeric_characters("fööbar!@#!@#!test 1")
+    assert result == "fbartest 1"
+
+
+def test_string_remove_non_alpha_numeric_characters_many_1():
+    result = string_remove_non_alpha_numeric_characters_many(["foo!bar", "a-b c"])
+    assert list(result) == ["foobar", "ab c"]
+
 
 def test_string_find_between_1():
     result = string_find_between("foobar", "f", "b")
@@ -273,6 +326,123 @@ def test_string_find_between_1():
     assert result == ""
 
 
+def test_string_find_between_non_greedy():
+    assert string_find_between("foobarfoobar", "f", "b", greedy=False) == "oo"
+    assert string_find_between("a.b.c", ".", ".", greedy=False) == "b"
+
+
+FIND_BETWEEN_TEXT = "xx<a>1</a> <a>22</a>\nfoo <a>3\n</a><a>4</a>"
+
+
+def test_string_find_between_iter_1():
+    assert list(string_find_between_iter(FIND_BETWEEN_TEXT, "<a>", "</a>")) == ["1", "22", "4"]
+    assert list(string_find_between_iter(FIND_BETWEEN_TEXT, "<a>", "</a>", greedy=True)) == ["1</a> <a>22", "4"]
+    assert list(string_find_between_iter(FIND_BETWEEN_TEXT, "<a>", "</a>", spans=True)) == [(5, 6), (14, 16), (37, 38)]
+    assert list(string_find_between_iter("foobar", "g", "r")) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+@pytest.mark.parametrize("greedy", [True, False])
+def test_string_find_between_stream_1(chunk_size, greedy):
+    import io
+
+    expected = list(string_find_between_iter(FIND_BETWEEN_TEXT, "<a>", "</a>", greedy=greedy))
+    expected_spans = list(string_find_between_iter(FIND_BETWEEN_TEXT, "<a>", "</a>", greedy=greedy, spans=True))
+
+    stream = io.StringIO(FIND_BETWEEN_TEXT)
+    assert list(string_find_between_stream(stream, "<a>", "</a>", greedy=greedy, chunk_size=chunk_size)) == expected
+
+    stream = io.StringIO(FIND_BETWEEN_TEXT)
+    result = string_find_between_stream(stream, "<a>", "</a>", greedy=greedy, spans=True, chunk_size=chunk_size)
+    assert list(result) == expected_spans
+
+    stream = io.BytesIO(FIND_BETWEEN_TEXT.encode())
+    result = string_find_between_stream(stream, "<a>", "</a>", greedy=greedy, chunk_size=chunk_size)
+    assert list(result) == [i.encode() for i in expected]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+@pytest.mark.parametrize("greedy", [True, False])
+@pytest.mark.parametrize(
+    "start_string,end_string",
+    [
+        ("<a>", "</a>"),
+        ("aa", "a"),
+        ("a", "aa"),
+        ("", "b"),
+        ("a", ""),
+        ("", ""),
+        # the delimiters contain newlines, so matches can span lines
+        ("\n", ":"),
+        ("<a>\n", "\n</a>"),
+        ("a", "\n\n"),
+        ("\n", ""),
+    ],
+)
+def test_string_find_between_stream_chunks(chunk_size, greedy, start_string, end_string):
+    rng = random.Random(chunk_size)
+    texts = ["x\nHost: a\nUser: b\n", "<a>\nhello\n</a> <a>\nbye\n</a>"]
+    for _ in range(50):
+        texts.append("".join(rng.choice(["a", "b", ":", "<a>", "</a>", "\n"]) for _ in range(rng.randint(0, 30))))
+    for text in texts:
+        expected = list(string_find_between_iter(text, start_string, end_string, greedy=greedy, spans=True))
+        stream = io.StringIO(text)
+        result = string_find_between_stream(
+            stream, start_string, end_string, greedy=greedy, spans=True, chunk_size=chunk_size
+        )
+        assert list(result) == expected
+
+
+class _LongLineStream:
+    """A stream of one long line (generated as it is read) with a match at its end."""
+
+    def __init__(self, size: int):
+        self.remaining = size
+        self.end = "<a>end</a>"
+
+    def read(self, size: int) -> str:
+        if not self.remaining:
+            end, self.end = self.end, ""
+            return end
+        size = min(size, self.remaining)
+        self.remaining -= size
+        return "a" * size
+
+
+def test_string_find_between_stream_long_line():
+    import tracemalloc
+
+    # the part of the line without a start_string is not kept in memory
+    tracemalloc.start()
+    try:
+        assert list(string_find_between_stream(_LongLineStream(20_000_000), "<a>", "</a>", chunk_size=2**16)) == ["end"]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 2_000_000
+
+
+def test_string_find_between_stream_mmap(tmp_path):
+    import mmap
+
+    file_path = tmp_path / "test.log"
+    file_path.write_bytes(FIND_BETWEEN_TEXT.encode())
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert list(string_find_between_stream(m, "<a>", "</a>")) == [b"1", b"22", b"4"]
+        assert list(string_find_between_stream(m, "<a>", "</a>", spans=True)) == [(5, 6), (14, 16), (37, 38)]
+
+    assert list(string_find_between_stream(FIND_BETWEEN_TEXT, "<a>", "</a>")) == ["1", "22", "4"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 5, 100])
+def test_string_find_between_stream_multiline_delimiters(chunk_size):
+    stream = io.StringIO("x\nHost: a\nUser: b\n")
+    assert list(string_find_between_stream(stream, "\n", ":", chunk_size=chunk_size)) == ["Host", "User"]
+    stream = io.BytesIO(b"<p>\nhello\n</p> <p>\nbye\n</p>")
+    assert list(string_find_between_stream(stream, "<p>\n", "\n</p>", chunk_size=chunk_size)) == [b"hello", b"bye"]
+
+
 def test_strings_similarity_1():
     result = strings_similarity("foobar", "foolbat")
     assert result == 0.7692307692307693
@@ -416,6 +586,34 @@ def test_text_ascii_characters_1():
 def test_text_non_ascii_characters_1():
     results = tuple(text_non_ascii_characters("τεστtest"))
     assert results == ("τ", "ε", "σ", "τ")
+    assert tuple(text_non_ascii_characters("test")) == ()
+
+
+def test_text_ascii_runs_1():
+    assert list(text_ascii_runs("τεστ test τ!")) == [" test ", "!"]
+    assert list(text_ascii_runs("τεστ test τ!", spans=True)) == [(4, 10), (11, 12)]
+    assert list(text_ascii_runs("test", spans=True)) == [(0, 4)]
+    assert list(text_ascii_runs("")) == []
+    assert list(text_ascii_runs("τεστ test".encode())) == [b" test"]
+
+
+def test_text_non_ascii_runs_1():
+    assert list(text_non_ascii_runs("τεστ test τ!")) == ["τεστ", "τ"]
+    assert list(text_non_ascii_runs("τεστ test τ!", spans=True)) == [(0, 4), (10, 11)]
+    assert list(text_non_ascii_runs("test")) == []
+    assert list(text_non_ascii_runs("test τ".encode(), spans=True)) == [(5, 7)]
+
+
+def test_text_ascii_character_count_1():
+    assert text_ascii_character_count("τεστtest") == 4
+    assert text_ascii_character_count("test") == 4
+    assert text_ascii_character_count("τεστtest".encode()) == 4
+
+
+def test_text_non_ascii_character_count_1():
+    assert text_non_ascii_character_count("τεστtest") == 4
+    assert text_non_ascii_character_count("test") == 0
+    assert text_non_ascii_character_count("τεστtest😀".encode()) == 5
 
 
 def test_indefinite_article_1():
@@ -605,6 +803,13 @@ def test_string_remove_numbers_1():
         string_remove_numbers("there were 2 pigeons on a wall when 1 fell off and found 4 cats...", replacement="!")
         == "there were ! pigeons on a wall when ! fell off and found ! cats..."
     )
+    assert string_remove_numbers("a1b22c", replacement="") == "abc"
+    assert string_remove_numbers("ü1b٢2c", replacement="") == "übc"
+
+
+def test_string_remove_numbers_many_1():
+    assert list(string_remove_numbers_many(["a1b", "22c"])) == ["a b", " c"]
+    assert list(string_remove_numbers_many(["a1b", "22c"], replacement="")) == ["ab", "c"]
 
 
 def test_string_left_pad_1():
@@ -635,6 +840,26 @@ def test_string_remove_1():
     s = string_remove("1", "110010", count=1)
     assert s == "10010"
 
+    s = string_remove("1+", "110010", count=1)
+    assert s == "0010"
+
+    s = string_remove("a", "AaBb", flags=re.IGNORECASE)
+    assert s == "Bb"
+
+
+def test_string_remove_many_1():
+    assert list(string_remove_many("1", ["110010", "1"])) == ["000", ""]
+    assert list(string_remove_many(r"\d", ["a1", "b2"])) == ["a", "b"]
+
+
+def test_string_remove_cache_info_1():
+    string_remove(r"[xyz]+", "abc")
+    string_remove(r"[xyz]+", "abc")
+    cache_info = string_remove_cache_info()
+    assert cache_info["hits"] >= 1
+    assert cache_info["currsize"] >= 1
+    assert 0 < cache_info["hit_rate"] <= 1
+
 
 def test_string_remove_from_start_1():
     s = string_remove_from_start("foobar", "foo")
@@ -647,6 +872,13 @@ def test_string_remove_from_start_1():
     s = string_remove_from_start("110010", "11")
     assert s == "0010"
 
+    # the string_to_remove is not treated as a regex
+    s = string_remove_from_start("a.b.c", "a.")
+    assert s == "b.c"
+
+    s = string_remove_from_start("(foo", "(")
+    assert s == "foo"
+
 
 def test_string_remove_from_end_1():
     s = string_remove_from_end("foobar", "bar")
@@ -836,6 +1068,32 @@ def test_string_in_iterable_fuzzy_1():
     assert string_in_iterable_fuzzy("test", ["testing"])
     assert string_in_iterable_fuzzy("foo", ["foo", "b", "a"])
     assert not string_in_iterable_fuzzy("bang", ["foo", "b", "a"])
+    assert string_in_iterable_fuzzy("test", ContainmentIndex(["testing"]))
+    assert not string_in_iterable_fuzzy("bang", ContainmentIndex(["foo", "b", "a"]))
+
+
+def test_containment_index_1():
+    index = ContainmentIndex(["testing", "foo", "contest", "b"])
+    assert len(index) == 4
+    assert "test" in index
+    assert "b" in index
+    assert "bang" not in index
+    assert "" in index
+    assert list(index.matches("test")) == ["testing", "contest"]
+    assert list(index.matches("o")) == ["foo", "contest"]
+    assert list(index.matches("testx")) == []
+
+    index.add("attest")
+    index.update(["bang"])
+    assert list(index.matches("test")) == ["testing", "contest", "attest"]
+    assert index.contains("bang")
+
+
+def test_containment_index_pickle():
+    import pickle
+
+    index = pickle.loads(pickle.dumps(ContainmentIndex(["testing", "foo", "contest"])))
+    assert list(index.matches("test")) == ["testing", "contest"]
 
 
 def test_strings_diff_opcodes_1():
@@ -846,6 +1104,32 @@ def test_strings_diff_opcodes_1():
     assert op_codes[2] == ("equal", 3, 4, 3, 4)
 
 
+STRINGS_DIFF_MANY_PAIRS = [
+    ("abc", "abd"),
+    ("abcdef\nthis may be a\ntest", "abcdef\nthis may be a\ntest"),
+    ("", ""),
+    (["a", "b"], ["a", "c"]),
+    ("foobar", "foolbat"),
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_strings_diff_many_1(workers):
+    pairs = STRINGS_DIFF_MANY_PAIRS
+    assert list(strings_diff_many(pairs, workers=workers)) == [strings_diff(a, b) for a, b in pairs]
+    assert list(strings_diff_many(pairs, workers=workers, output="opcodes", chunksize=2)) == [
+        strings_diff_opcodes(a, b) for a, b in pairs
+    ]
+    assert list(strings_diff_many(iter(pairs), workers=workers, output="ratio")) == [
+        strings_similarity(a, b) for a, b in pairs
+    ]
+
+
+def test_strings_diff_many_failure_modes():
+    with pytest.raises(ValueError):
+        strings_diff_many(STRINGS_DIFF_MANY_PAIRS, output="foo")
+
+
 def test_strings_matching_blocks_1():
     import difflib
 
@@ -868,6 +1152,50 @@ def test_strings_longest_matching_block_1():
 def test_string_as_numbers():
     assert string_as_numbers("london") == [12, 15, 14, 4, 15, 14]
     assert string_as_numbers("fair") == [6, 1, 9, 18]
+    assert string_as_numbers("FaIr") == [6, 1, 9, 18]
+    assert string_as_numbers(b"fair") == [6, 1, 9, 18]
+
+    for invalid_string in ("fair!", "café"):
+        with pytest.raises(ValueError):
+            string_as_numbers(invalid_string)
+
+
+def test_letter_as_number_invalid():
+    assert letter_as_number("a") == 1
+    assert letter_as_number("Z") == 26
+
+    for invalid_letter in ("", "ab", "1", "é"):
+        with pytest.raises(ValueError):
+            letter_as_number(invalid_letter)
+
+
+def test_string_as_numbers_array_1():
+    numbers = string_as_numbers_array("London")
+    assert numbers == array("I", [12, 15, 14, 4, 15, 14])
+    assert numbers_as_string(numbers) == "london"
+    assert numbers_as_string([1, 2, 26]) == "abz"
+    assert string_as_numbers_array(b"") == array("I")
+
+    with pytest.raises(ValueError):
+        numbers_as_string([1, 27])
+
+
+def test_string_char_codes_1():
+    for string in ("", "hello", "café ☕ 😀", "\ud800"):
+        codes = string_char_codes(string)
+        assert codes == array("I", map(ord, string))
+        assert from_char_code(codes) == string
+    assert string_char_codes(b"hi") == array("I", [104, 105])
+    assert string_char_codes(b"\xe9\xff") == array("I", [0xE9, 0xFF])
+
+
+def test_string_char_codes_numpy():
+    numpy = pytest.importorskip("numpy")
+    codes = string_char_codes("café", numpy=True)
+    assert codes.dtype == numpy.uintc
+    assert from_char_code(codes) == "café"
+    assert from_char_code(codes.astype(numpy.int64)) == "café"
+    assert numbers_as_string(string_as_numbers_array("fair", numpy=True)) == "fair"
 
 
 def test_text_join_1():
@@ -1550,12 +1878,94 @@ def test_string_rotate_1():
     assert string_rotate("abc", 25) == "zab"
     assert string_rotate("abc", 26) == "abc"
     assert string_rotate("abc", 27) == "bcd"
+    assert string_rotate(b"Hello, World! \xff") == b"Uryyb, Jbeyq! \xff"
+    assert string_rotate(bytearray(b"abc"), 1) == bytearray(b"bcd")
+
+
+def test_string_rotate_crack_1():
+    text = "The Zen of Python, by Tim Peters. Beautiful is better than ugly. Explicit is better than implicit."
+    for rot in range(26):
+        decrypted_text, candidates = string_rotate_crack(string_rotate(text, rot))
+        assert decrypted_text == text
+        assert candidates[0][0] == (26 - rot) % 26
+        assert sorted(candidate[0] for candidate in candidates) == list(range(26))
+        assert [candidate[1] for candidate in candidates] == sorted(candidate[1] for candidate in candidates)
+
+
+def test_string_rotate_crack_2():
+    # non-ascii letters are ignored (and left as they are)
+    text = "Ünïcödé letters are ignored, but the rest of this sentence is still plain English text."
+    assert string_rotate_crack(string_rotate(text, 3))[0] == text
+    # there are no letters to score
+    assert string_rotate_crack("123 !?") == ("123 !?", [(rot, 0.0) for rot in range(26)])
+    assert string_rotate_crack("") == ("", [(rot, 0.0) for rot in range(26)])
+
+
+def test_string_rotate_crack_bytes():
+    text = "Bytes are decrypted to bytes: this sentence is plain English text.".encode()
+    decrypted_text, candidates = string_rotate_crack(string_rotate(text, 5))
+    assert decrypted_text == text
+    assert candidates[0][0] == 21
+    assert candidates == string_rotate_crack(string_rotate(text.decode(), 5))[1]
+
+
+def test_string_rotate_crack_many_1():
+    texts = ["Uryyb, Jbeyq! Guvf vf n frperg zrffntr.", "Khoor, Zruog! Wklv lv d vhfuhw phvvdjh."]
+    assert [decrypted_text for decrypted_text, _ in string_rotate_crack_many(texts)] == [
+        "Hello, World! This is a secret message.",
+        "Hello, World! This is a secret message.",
+    ]
 
 
 def test_xor_1():
     assert xor("test", "abc") == xor(b"test", b"abc") == xor(b"test", b"abca") == "\x15\x07\x10\x15"
 
 
+XOR_PLAINTEXT = (
+    b"It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of foolishness, "
+    b"it was the epoch of belief, it was the epoch of incredulity, it was the season of Light, it was the season of "
+    b"Darkness, it was the spring of hope, it was the winter of despair, we had everything before us, we had nothing "
+    b"before us, we were all going direct to Heaven, we were all going direct the other way - in short, the period "
+    b"was so far like the present period, that some of its noisiest authorities insisted on its being received, for "
+    b"good or for evil, in the superlative degree of comparison only. There were a king with a large jaw and a queen "
+    b"with a plain face, on the throne of England; there were a king with a large jaw and a queen with a fair face, "
+    b"on the throne of France. In both countries it was clearer than crystal to the lords of the State preserves of "
+    b"loaves and fishes, that things in general were settled for ever."
+)
+
+
+def _xor_bytes(message: bytes, key: bytes) -> bytes:
+    return bytes(a ^ b for a, b in zip(message, itertools.cycle(key)))
+
+
+@pytest.mark.parametrize("key", [b"k", b"ICE", b"secret key", b"\x00\xff\x13\x37 longer key with bytes"])
+def test_xor_recover_key_1(key):
+    candidates = xor_recover_key(_xor_bytes(XOR_PLAINTEXT, key))
+    assert candidates[0][0] == key
+    assert 1 <= len(candidates) <= 3
+    assert [score for _, score in candidates] == sorted(score for _, score in candidates)
+
+
+@pytest.mark.parametrize("length", [100, 200, 300, 600])
+@pytest.mark.parametrize("key", [b"ICE", b"Dickens", b"secret key"])
+def test_xor_recover_key_short_ciphertext(length, key):
+    # longer keys fit short ciphertexts better, but are not more likely
+    assert xor_recover_key(_xor_bytes(XOR_PLAINTEXT[:length], key))[0][0] == key
+
+
+def test_xor_recover_key_2():
+    key = b"Dickens"
+    ciphertext = _xor_bytes(XOR_PLAINTEXT, key)
+    assert xor_recover_key(ciphertext.decode("latin-1"))[0][0] == key
+    assert xor_recover_key(bytearray(ciphertext), 10, candidates=1)[0][0] == key
+    # the key can not be found if it is longer than max_keysize
+    assert xor_recover_key(ciphertext, 5)[0][0] != key
+    assert xor_recover_key(b"") == []
+    # "a" is most likely to be a space (the most common byte in English) encrypted with "A"
+    assert xor_recover_key(b"a")[0][0] == b"A"
+    assert len(xor_recover_key(ciphertext, candidates=1)) == 1
+
+
 def test_hamming_distance_1():
     assert hamming_distance("karolin", "kathrin") == 3
     assert hamming_distance("karolin", "kerstin") == 3
@@ -1768,3 +2178,103 @@ def test_string_reverse_case_1():
     assert string_reverse_case("This is a test") == "tHIS IS A TEST"
     assert string_reverse_case("This is a Test") == "tHIS IS A tEST"
     assert string_reverse_case("FoobaR") == "fOOBAr"
+
+
+class _Stdin(io.TextIOWrapper):
+    """Piped (not interactive) stdin with the given content."""
+
+    def __init__(self, content: bytes):
+        super().__init__(io.BytesIO(content), encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        (b"", ""),
+        (b"a\nb\n", "a\nb"),
+        (b"a\r\nb", "a\nb"),
+        (b"a\n\n", "a\n"),
+        ("café\n".encode(), "café"),
+    ],
+)
+def test_text_input_piped(monkeypatch, capsys, content, expected):
+    monkeypatch.setattr(sys, "stdin", _Stdin(content))
+    assert text_input("Paste") == expected
+    assert capsys.readouterr().out.startswith("Paste")
+
+
+def test_text_input_chunks_1():
+    # the multi-byte character is split across reads
+    content = "héllo wörld\n".encode()
+    chunks = list(text_input_chunks(2, stream=io.BytesIO(content)))
+    assert len(chunks) > 1
+    assert "".join(chunks) == "héllo wörld\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        (b"", []),
+        (b"a", ["a"]),
+        (b"a\n", ["a"]),
+        (b"ab\ncd\n\nef", ["ab", "cd", "", "ef"]),
+        (b"ab\r\ncd\r\n", ["ab", "cd"]),
+        (b"ab\r", ["ab"]),
+    ],
+)
+def test_text_input_lines_1(chunk_size, content, expected):
+    assert list(text_input_lines(chunk_size, stream=io.BytesIO(content))) == expected
+
+
+def test_text_input_lines_stdin(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", _Stdin(b"a\nb"))
+    assert list(text_input_lines()) == ["a", "b"]
+
+
+def test_text_input_is_yes_piped(monkeypatch, capsys):
+    stdin = _Stdin(b"yes\nn\n")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert text_input_is_yes("Continue?")
+    assert text_input_is_no("Really?")
+    assert capsys.readouterr().out == "Continue (y/n)Really (y/n)"
+
+    with pytest.raises(EOFError):
+        text_input_is_yes("Again?")
+
+
+def test_text_input_after_input(monkeypatch, capsys):
+    # the lines which input() has already buffered are not skipped
+    monkeypatch.setattr(sys, "stdin", _Stdin(b"alice\nyes\nno\na\nb\n"))
+    assert input() == "alice"
+    assert text_input_is_yes("ok?")
+    assert text_input_is_no("ok?")
+    assert list(text_input_lines()) == ["a", "b"]
+
+
+def test_text_input_chunks_encoding():
+    content = "café\n".encode("latin-1")
+    assert "".join(text_input_chunks(stream=io.BytesIO(content), encoding="latin-1")) == "café\n"
+    assert list(text_input_lines(stream=io.BytesIO(content), encoding="ascii", errors="replace")) == ["caf\ufffd"]
+    with pytest.raises(UnicodeDecodeError):
+        list(text_input_chunks(stream=io.BytesIO(content)))
+
+
+def test_text_input_interactive(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", _Stdin(b""))
+    monkeypatch.setattr(sys.stdin, "isatty", lambda: True)
+    entered_lines = ["y", "first", "second"]
+
+    def _input(message=""):
+        if not entered_lines:
+            raise EOFError
+        return entered_lines.pop(0)
+
+    monkeypatch.setattr("builtins.input", _input)
+    assert text_input_is_yes("Continue?")
+    assert text_input("Paste") == "first\nsecond"
+
+    entered_lines.extend(["a", "b"])
+    assert list(text_input_lines()) == ["a", "b"]
+    entered_lines.extend(["a", "b"])
+    assert list(text_input_chunks()) == ["a\n", "b\n"]
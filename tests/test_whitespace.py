@@ -0,0 +1,161 @@
+import io
+
+import pytest
+
+from d8s_strings import (
+    WhitespaceNormalizer,
+    corpus_text,
+    string_collapse_whitespace,
+    string_has_multiple_consecutive_spaces,
+    string_has_whitespace_run,
+    string_normalize_line_endings,
+    string_trim_lines,
+    string_whitespace_run_count,
+    string_whitespace_runs,
+)
+
+TEXT = "  foo  bar\t\tbaz \t qux \r\n  a　　b  \rc\n\n  d  "
+
+
+KIND_CHARACTERS = {
+    "space": lambda character: character == " ",
+    "tab": lambda character: character == "\t",
+    "blank": lambda character: character in " \t",
+    "inline": lambda character: character.isspace() and character not in "\r\n",
+    "unicode": str.isspace,
+}
+
+
+def _runs(text, is_kind, minimum):
+    runs, start = [], None
+    for index, character in enumerate(text + "x"):
+        if is_kind(character) and character != "x":
+            start = index if start is None else start
+        elif start is not None:
+            if index - start >= minimum:
+                runs.append((start, index))
+            start = None
+    return runs
+
+
+@pytest.mark.parametrize("kind", list(KIND_CHARACTERS))
+@pytest.mark.parametrize("minimum", [1, 2, 3])
+def test_string_whitespace_runs(kind, minimum):
+    for text in [TEXT, corpus_text(5_000, 11), "", "a"]:
+        runs = list(string_whitespace_runs(text, kind, minimum))
+        assert runs == _runs(text, KIND_CHARACTERS[kind], minimum)
+        assert string_whitespace_run_count(text, kind, minimum) == len(runs)
+        assert string_has_whitespace_run(text, kind, minimum) == bool(runs)
+
+
+def test_string_has_whitespace_run():
+    assert string_has_whitespace_run("a  b")
+    assert not string_has_whitespace_run("a b\n c")
+    assert string_has_whitespace_run("a\t\tb", "tab")
+    assert not string_has_whitespace_run("a \tb", "tab")
+    assert string_has_whitespace_run("a \tb", "blank")
+    assert string_has_whitespace_run("a　 b", "inline")
+    assert not string_has_whitespace_run("a\n b", "inline")
+    assert string_has_whitespace_run("a\n b", "unicode")
+    assert string_has_whitespace_run("a   b", minimum=3)
+    assert not string_has_whitespace_run("a  b", minimum=3)
+    with pytest.raises(ValueError):
+        string_has_whitespace_run("a  b", "newline")
+    with pytest.raises(ValueError):
+        string_has_whitespace_run("a  b", minimum=0)
+
+
+def test_string_has_multiple_consecutive_spaces_is_linear():
+    # the previous regex (".*  +.*") backtracked over long lines
+    assert not string_has_multiple_consecutive_spaces("a " * 500_000)
+    assert string_has_multiple_consecutive_spaces("a " * 500_000 + " ")
+    assert string_has_multiple_consecutive_spaces("first line\nsecond  line")
+
+
+def test_string_collapse_whitespace():
+    assert string_collapse_whitespace("a  b   c d") == "a b c d"
+    assert string_collapse_whitespace("a \t b\t\tc", "blank") == "a b c"
+    assert string_collapse_whitespace("a\tb", "blank") == "a b"
+    assert string_collapse_whitespace("a\t\tb\tc", "tab", "\t") == "a\tb\tc"
+    assert string_collapse_whitespace("a 　b \n c", "inline") == "a b \n c"
+    assert string_collapse_whitespace("a 　b \n c\n", "unicode") == "a b c "
+    assert string_collapse_whitespace("a  b c", replacement="") == "abc"
+    assert string_collapse_whitespace("a  b c", replacement="\\n") == "a\\nb\\nc"
+    assert string_collapse_whitespace("a  b c", replacement="__") == "a__b__c"
+    assert string_collapse_whitespace(f" {TEXT} ", "unicode") == f" {' '.join(TEXT.split())} "
+
+
+def test_string_trim_lines():
+    text = "  a b  \r\n\t c 　\rd\n  \n e "
+    assert string_trim_lines(text) == "  a b\r\n\t c\rd\n\n e"
+    assert string_trim_lines(text, "leading") == "a b  \r\nc 　\rd\n\ne "
+    assert string_trim_lines(text, "both") == "a b\r\nc\rd\n\ne"
+    with pytest.raises(ValueError):
+        string_trim_lines(text, "middle")
+
+
+def test_string_normalize_line_endings():
+    assert string_normalize_line_endings("a\r\nb\rc\nd\r\r\n") == "a\nb\nc\nd\n\n"
+    assert string_normalize_line_endings("a\r\nb\rc\nd", "\r\n") == "a\r\nb\r\nc\r\nd"
+    assert string_normalize_line_endings("a\nb", "\\") == "a\\b"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"collapse": "space"},
+        {"collapse": "blank", "trim": "trailing"},
+        {"collapse": "inline", "trim": "both", "line_ending": "\n"},
+        {"collapse": "space", "replacement": "_", "trim": "leading", "line_ending": "\r\n"},
+        {"collapse": "unicode", "replacement": ""},
+        {"trim": "both", "line_ending": "\r\n"},
+        {"trim": "trailing", "line_ending": "\n"},
+        # the line endings become part of the runs which are collapsed
+        {"collapse": "space", "line_ending": " "},
+        {"collapse": "blank", "trim": "both", "line_ending": ""},
+        {"collapse": "inline", "line_ending": "\t\n"},
+        {"collapse": "unicode", "trim": "leading"},
+        {"collapse": "unicode", "replacement": "_", "line_ending": "|"},
+    ],
+)
+def test_whitespace_normalizer_matches_steps(kwargs):
+    normalizer = WhitespaceNormalizer(**kwargs)
+    for text in [
+        TEXT,
+        corpus_text(20_000, 7),
+        "",
+        "   ",
+        "\r\n\r\n",
+        "a" + " " * 10_000 + "b",
+        " a \t\r \n\t b\r\r\n  \n",
+    ]:
+        # the steps are done in the documented order
+        expected = text
+        if kwargs.get("trim"):
+            expected = string_trim_lines(expected, kwargs["trim"])
+        if kwargs.get("line_ending") is not None:
+            expected = string_normalize_line_endings(expected, kwargs["line_ending"])
+        if kwargs.get("collapse"):
+            expected = string_collapse_whitespace(expected, kwargs["collapse"], kwargs.get("replacement", " "))
+        assert normalizer.normalize(text) == normalizer(text) == expected
+
+        chunks = [text[index : index + 97] for index in range(0, len(text), 97)]
+        assert "".join(normalizer.normalize_stream(chunks)) == expected
+        assert "".join(normalizer.normalize_stream(io.StringIO(text), chunk_size=50)) == expected
+    assert list(normalizer.normalize_many([TEXT, "a"])) == [normalizer.normalize(TEXT), normalizer.normalize("a")]
+
+
+def test_whitespace_normalizer_joined_runs():
+    assert WhitespaceNormalizer(collapse="space", line_ending=" ")("a \nb") == "a b"
+    assert WhitespaceNormalizer(collapse="space", line_ending="")("a \n b") == "a b"
+    assert WhitespaceNormalizer(collapse="space", line_ending=" \n")("a \nb") == "a \nb"
+    # trimming joins the "\r" and "\n" into one line ending
+    assert WhitespaceNormalizer(trim="both", line_ending="\n")("a\r \nb") == "a\nb"
+
+
+def test_whitespace_normalizer_invalid():
+    with pytest.raises(ValueError):
+        WhitespaceNormalizer(trim="middle")
+    with pytest.raises(ValueError):
+        WhitespaceNormalizer(collapse="newline")